@@ -0,0 +1,91 @@
+# backend/app/auth/dependencies.py
+
+# Import FastAPI tools for dependencies, errors and the current request
+from fastapi import Depends, HTTPException, Request, status
+
+# OAuth2 helper that extracts the "Bearer <token>" value from the Authorization header
+from fastapi.security import OAuth2PasswordBearer
+
+# Import select to look up the admin row
+from sqlalchemy import select
+
+from dotenv import load_dotenv  # Used to load environment variables from a .env file
+import os  # Provides access to environment variables
+import threading  # Protects the admin cache, which is shared by all requests
+import time  # Used to expire cached admin rows
+
+# Import token verification (which has its own verified-token cache)
+from app.auth.jwt_handler import verify_access_token
+
+# Import the async session factory and the Admin model for the admin lookup
+from app.database import AsyncSessionLocal
+from app.models.admin import Admin
+
+# Load environment variables from a .env file into the system environment
+load_dotenv()
+
+# The single OAuth2 scheme used by every protected router
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")
+
+# How long (seconds) a looked-up admin row is reused before reading it again
+ADMIN_CACHE_TTL = int(os.getenv("ADMIN_CACHE_TTL", 300))
+
+# Cache of admin rows: username -> (expires_at, {"id", "username", "email"})
+_admin_cache = {}
+_admin_cache_lock = threading.Lock()
+
+
+# Dependency to verify the JWT token and authenticate the user
+# The decoded payload is resolved once per request and kept on request.state.principal
+async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)):
+    principal = getattr(request.state, "principal", None)
+    if principal is not None:
+        return principal
+
+    payload = verify_access_token(token)  # Decode and verify token
+    if not payload:
+        # Raise 401 Unauthorized if token is invalid or expired
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+        )
+
+    request.state.principal = payload
+    return payload  # Return the decoded token payload if valid
+
+
+# Dependency that also resolves the Admin row of the token's subject
+# Returns a plain dict (id, username, email) kept on request.state.admin
+# Rows are cached for ADMIN_CACHE_TTL seconds to avoid a query per request
+async def get_current_admin(request: Request, principal: dict = Depends(get_current_user)):
+    admin = getattr(request.state, "admin", None)
+    if admin is not None:
+        return admin
+
+    username = principal.get("sub")
+    now = time.monotonic()
+    with _admin_cache_lock:
+        entry = _admin_cache.get(username)
+    if entry is not None and entry[0] > now:
+        admin = entry[1]
+    else:
+        async with AsyncSessionLocal() as db:
+            row = await db.scalar(select(Admin).where(Admin.username == username))
+        if row is None:
+            # The token is valid but its admin no longer exists
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+            )
+        admin = {"id": row.id, "username": row.username, "email": row.email}
+        with _admin_cache_lock:
+            _admin_cache[username] = (now + ADMIN_CACHE_TTL, admin)
+
+    request.state.admin = admin
+    return admin
+
+
+# Function to drop a cached admin row (e.g. after the account changes)
+def forget_admin(username: str):
+    with _admin_cache_lock:
+        _admin_cache.pop(username, None)
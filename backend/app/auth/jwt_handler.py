@@ -5,6 +5,10 @@ from jose import JWTError, jwt  # 'jose' is a library used for creating and veri
 from datetime import datetime, timedelta  # Used to handle date and time operations
 from dotenv import load_dotenv  # Used to load environment variables from a .env file
 import os  # Provides access to environment variables and operating system functions
+import hashlib  # Used to key the verified-token cache by a hash instead of the raw token
+import threading  # Protects the cache, which is shared by all request threads
+import time  # Used to expire cached tokens at their "exp" claim
+from collections import OrderedDict  # Keeps cache entries in least-recently-used order
 
 # Load environment variables from a .env file into the system environment
 load_dotenv()
@@ -20,6 +24,15 @@ ALGORITHM = os.getenv("ALGORITHM")
 # If not set, defaults to 60 minutes
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
 
+# Maximum number of verified tokens kept in memory (0 disables the cache)
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", 1024))
+
+# Cache of already verified tokens: sha256(token) -> (exp timestamp, payload)
+# Saves a full signature check when the same token is sent again before it expires
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+_token_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
 
 # Function to create a JWT access token
 # Takes a dictionary (`data`) which usually contains user identification (e.g., user ID)
@@ -43,13 +56,52 @@ def create_access_token(data: dict):
 
 # Function to verify and decode a JWT token
 # Takes the JWT token string as input
+# Tokens verified before are answered from the cache until their "exp" passes
 def verify_access_token(token: str):
+    key = hashlib.sha256(token.encode()).hexdigest()
+
+    # Look the token up in the cache first
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is not None:
+            expires_at, payload = entry
+            if expires_at > time.time():
+                _token_cache.move_to_end(key)  # Mark as most recently used
+                _token_cache_stats["hits"] += 1
+                return dict(payload)  # Copy so callers cannot change the cached payload
+            del _token_cache[key]  # Expired: drop it and verify again (which will fail)
+        _token_cache_stats["misses"] += 1
+
     try:
         # Try to decode the token using the secret key and algorithm
         # If successful, it returns the payload (i.e., the original data)
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload  # The decoded data; may contain fields like "sub" (subject or user ID)
     
     # If decoding fails (e.g., due to invalid signature, expired token, etc.), return None
     except JWTError:
         return None
+
+    # Remember the verified payload until the token expires
+    expires_at = payload.get("exp")
+    if TOKEN_CACHE_SIZE > 0 and isinstance(expires_at, (int, float)):
+        with _token_cache_lock:
+            _token_cache[key] = (expires_at, dict(payload))
+            _token_cache.move_to_end(key)
+            while len(_token_cache) > TOKEN_CACHE_SIZE:
+                _token_cache.popitem(last=False)  # Evict the least recently used token
+                _token_cache_stats["evictions"] += 1
+
+    return payload  # The decoded data; may contain fields like "sub" (subject or user ID)
+
+
+# Function to empty the verified-token cache
+# Call it after rotating SECRET_KEY so old tokens are verified against the new key
+def clear_token_cache():
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
+# Function to read the cache hit/miss counters and current size
+def token_cache_stats():
+    with _token_cache_lock:
+        return {**_token_cache_stats, "size": len(_token_cache), "max_size": TOKEN_CACHE_SIZE}
@@ -3,10 +3,40 @@
 # Import the CryptContext class from passlib to manage password hashing
 from passlib.context import CryptContext
 
+import asyncio  # Used to await work running on the hashing threads
+import os  # Provides access to environment variables
+import threading  # Protects the admission counter
+from concurrent.futures import ThreadPoolExecutor  # Dedicated threads for bcrypt
+from dotenv import load_dotenv  # Used to load environment variables from a .env file
+
+# Load environment variables from a .env file into the system environment
+load_dotenv()
+
+# bcrypt cost factor (work = 2^rounds); passlib's default is 12
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+
 # Create a CryptContext object with bcrypt as the hashing algorithm
 # bcrypt is a secure and widely-used algorithm for password hashing
 # "deprecated='auto'" means older algorithms will be marked deprecated automatically
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+# Number of threads that run bcrypt (bcrypt releases the GIL, so they run in parallel)
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", min(4, os.cpu_count() or 1)))
+
+# How many hashing jobs may wait for a free thread before new ones are turned away
+HASH_QUEUE_LIMIT = int(os.getenv("HASH_QUEUE_LIMIT", 32))
+
+# Dedicated executor so a burst of logins cannot take every request thread
+_hash_executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="bcrypt")
+
+# Number of jobs currently running or waiting on the executor
+_in_flight = 0
+_in_flight_lock = threading.Lock()
+
+
+# Raised when the hashing executor already has HASH_WORKERS + HASH_QUEUE_LIMIT jobs
+class HashingPoolFull(Exception):
+    pass
 
 
 # Function to hash a plain-text password
@@ -23,3 +53,38 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     # The verify method checks whether the plain password matches the hashed one
     return pwd_context.verify(plain_password, hashed_password)
+
+
+# Run a hashing function on the dedicated executor and await its result
+# Raises HashingPoolFull instead of queueing when the executor is saturated
+async def _run_bounded(fn, *args):
+    global _in_flight
+    with _in_flight_lock:
+        if _in_flight >= HASH_WORKERS + HASH_QUEUE_LIMIT:
+            raise HashingPoolFull()
+        _in_flight += 1
+
+    def release(_):
+        global _in_flight
+        with _in_flight_lock:
+            _in_flight -= 1
+
+    future = _hash_executor.submit(fn, *args)
+    future.add_done_callback(release)
+    return await asyncio.wrap_future(future)
+
+
+# Async version of hash_password that runs on the bounded hashing executor
+async def hash_password_async(password: str) -> str:
+    return await _run_bounded(hash_password, password)
+
+
+# Async version of verify_password that runs on the bounded hashing executor
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_bounded(verify_password, plain_password, hashed_password)
+
+
+# Function to read how busy the hashing executor is
+def hashing_pool_stats():
+    with _in_flight_lock:
+        return {"in_flight": _in_flight, "workers": HASH_WORKERS, "queue_limit": HASH_QUEUE_LIMIT}
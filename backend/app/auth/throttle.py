@@ -0,0 +1,63 @@
+# backend/app/auth/throttle.py
+
+import os  # Provides access to environment variables
+import threading  # Protects the attempt log, which is shared by all requests
+import time  # Used to age out old attempts
+from collections import OrderedDict, deque  # Keys in order of their last attempt, and timestamps of recent attempts per key
+from dotenv import load_dotenv  # Used to load environment variables from a .env file
+
+# Load environment variables from a .env file into the system environment
+load_dotenv()
+
+# Attempts allowed per username within the window, and the window length in seconds
+LOGIN_MAX_ATTEMPTS = int(os.getenv("LOGIN_MAX_ATTEMPTS", 10))
+LOGIN_ATTEMPT_WINDOW = int(os.getenv("LOGIN_ATTEMPT_WINDOW", 60))
+
+# Upper bound on tracked usernames, so random usernames cannot grow memory forever
+# When every tracked key is still inside the window, the least recently seen ones are evicted
+MAX_TRACKED_KEYS = 10000
+
+
+# Sliding-window limiter: at most `max_attempts` per key in the last `window` seconds
+class AttemptThrottle:
+    def __init__(self, max_attempts: int, window: int):
+        self.max_attempts = max_attempts
+        self.window = window
+        self._attempts = OrderedDict()  # key -> deque of attempt times, least recently tried first
+        self._lock = threading.Lock()
+
+    # Record an attempt for `key`
+    # Returns None if allowed, or the number of seconds to wait before retrying
+    def hit(self, key: str):
+        now = time.monotonic()
+        with self._lock:
+            attempts = self._attempts.get(key)
+            if attempts is None:
+                self._evict(now)
+                attempts = self._attempts[key] = deque()
+            self._attempts.move_to_end(key)  # Keys still being tried (even blocked ones) are evicted last
+            while attempts and attempts[0] <= now - self.window:
+                attempts.popleft()
+            if len(attempts) >= self.max_attempts:
+                return int(attempts[0] + self.window - now) + 1
+            attempts.append(now)
+            return None
+
+    # Forget the attempts for `key` (e.g. after a successful login)
+    def reset(self, key: str):
+        with self._lock:
+            self._attempts.pop(key, None)
+
+    def _evict(self, now: float):
+        # Make room for one more key: drop keys whose attempts are all outside the window,
+        # then, if the table is still full, the least recently tried keys
+        # Keys are ordered by when they were last tried, so only the front of the table is examined
+        while self._attempts:
+            oldest = next(iter(self._attempts.values()))
+            if len(self._attempts) < MAX_TRACKED_KEYS and oldest and oldest[-1] > now - self.window:
+                break
+            self._attempts.popitem(last=False)
+
+
+# Shared limiter for /login and /reset-password, keyed by the submitted username/email
+login_throttle = AttemptThrottle(LOGIN_MAX_ATTEMPTS, LOGIN_ATTEMPT_WINDOW)
@@ -3,17 +3,52 @@
 from sqlalchemy import create_engine  # For creating the database connection engine
 from sqlalchemy.ext.declarative import declarative_base  # Base class for model definitions
 from sqlalchemy.orm import sessionmaker  # For creating database sessions
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker  # Async engine and sessions
 from dotenv import load_dotenv  # To load environment variables from a .env file
 import os  # For accessing environment variables
 
+# Pool classes that time connection waits, and the pool event instrumentation
+from app.utils.pool_stats import TimedQueuePool, TimedAsyncAdaptedQueuePool, instrument_engine
+
+# Per-request SQL statement counting and timing (see app/utils/metrics.py)
+from app.utils.metrics import instrument_queries
+
+# Slow-query log with captured query plans (see app/utils/slow_queries.py)
+from app.utils.slow_queries import instrument_slow_queries
+
 # Load environment variables from the .env file into the system environment
 load_dotenv()
 
 # Read the database URL (connection string) from environment variables
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Connection pool settings, shared by the sync and async engines
+# DB_POOL_SIZE: connections kept open in the pool
+# DB_MAX_OVERFLOW: extra connections allowed during bursts (closed when returned)
+# DB_POOL_TIMEOUT: seconds to wait for a free connection before failing
+# DB_POOL_RECYCLE: seconds after which a connection is replaced (-1 disables)
+# DB_POOL_PRE_PING: test each connection before use to skip stale ones
+POOL_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
+    "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 30)),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes"),
+}
+
+
+def _pool_kwargs(url: str, poolclass) -> dict:
+    # In-memory SQLite needs a single shared connection, so keep SQLAlchemy's default pool there
+    if url.startswith("sqlite") and (":memory:" in url or url.rstrip("/").endswith(":")):
+        return {}
+    return {"poolclass": poolclass, **POOL_OPTIONS}
+
+
 # Create the SQLAlchemy engine to connect to the database using the URL
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, **_pool_kwargs(DATABASE_URL, TimedQueuePool))
+instrument_engine(engine, "sync")
+instrument_queries(engine)
+instrument_slow_queries(engine)
 
 # Create a configured "SessionLocal" class
 # autocommit=False means transactions must be explicitly committed
@@ -21,6 +56,33 @@ engine = create_engine(DATABASE_URL)
 # bind=engine links the session to the database engine created above
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+# Derive the async driver URL from DATABASE_URL unless ASYNC_DATABASE_URL is set
+# postgresql://... uses asyncpg, sqlite://... uses aiosqlite
+def _async_url(url: str) -> str:
+    scheme, _, rest = url.partition("://")
+    driver = {
+        "postgresql": "postgresql+asyncpg",
+        "postgresql+psycopg2": "postgresql+asyncpg",
+        "postgres": "postgresql+asyncpg",
+        "sqlite": "sqlite+aiosqlite",
+    }.get(scheme, scheme)
+    return f"{driver}://{rest}"
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_url(DATABASE_URL)
+
+# Create the async engine used by async route handlers
+# Requests wait on its connection pool instead of holding a threadpool thread
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_pool_kwargs(ASYNC_DATABASE_URL, TimedAsyncAdaptedQueuePool))
+instrument_engine(async_engine.sync_engine, "async")
+instrument_queries(async_engine.sync_engine)
+instrument_slow_queries(async_engine.sync_engine)
+
+# Async session factory
+# expire_on_commit=False keeps loaded attributes usable after commit without another round-trip
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 # Create a Base class that our ORM models will inherit from
 # This keeps track of tables and mappings
 Base = declarative_base()
@@ -32,3 +94,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -2,9 +2,15 @@
 
 from fastapi import FastAPI  # Import FastAPI framework to create the app
 from fastapi.middleware.cors import CORSMiddleware  # Middleware to handle CORS (Cross-Origin Resource Sharing)
+from app.utils.compression import CompressionMiddleware  # gzip/Brotli response compression
+from app.utils.metrics import MetricsMiddleware  # Per-route latency, status and SQL metrics
+from app.utils.log import RequestIdMiddleware, setup_logging  # Structured, queue-backed logging
+
+# Send every log record through the non-blocking queue handler (see app/utils/log.py for settings)
+setup_logging()
 
 # Import route modules where API endpoints are defined
-from app.routes import auth, member, payment, plan, renewal, gym_info, dashboard
+from app.routes import auth, member, payment, plan, renewal, gym_info, dashboard, admin, metrics
 
 # Create a FastAPI app instance
 app = FastAPI()
@@ -25,6 +31,17 @@ app.add_middleware(
     allow_headers=["*"],          # Allow all headers in requests
 )
 
+# Compress large JSON, CSV and NDJSON responses (see app/utils/compression.py for settings)
+app.add_middleware(CompressionMiddleware)
+
+# Record per-route metrics and add Server-Timing headers
+# Added last so it is the outermost middleware and its timings include the others
+app.add_middleware(MetricsMiddleware)
+
+# Give every request an id (X-Request-ID) that is attached to its log records
+# Outermost, so metrics, slow-query and route logs all see it
+app.add_middleware(RequestIdMiddleware)
+
 # Register routers (collections of API endpoints) with a common prefix "/api"
 app.include_router(auth.router, prefix="/api")       # Authentication routes
 app.include_router(dashboard.router, prefix="/api")  # Dashboard routes
@@ -33,6 +50,8 @@ app.include_router(payment.router, prefix="/api")    # Payment routes
 app.include_router(plan.router, prefix="/api")       # Plan management routes
 app.include_router(renewal.router, prefix="/api")    # Membership renewal routes
 app.include_router(gym_info.router, prefix="/api")   # Gym info routes
+app.include_router(admin.router, prefix="/api")      # Operational stats (connection pool)
+app.include_router(metrics.router)                   # Prometheus scrape endpoint at /metrics (no /api prefix, admin or scrape token)
 
 # Define a simple root endpoint to check if the API is running
 @app.get("/")
@@ -40,13 +59,13 @@ def read_root():
     return {"message": "Gym Management System API is running"}
 
 # ---------------------------------------------------------
-# Setup automatic database table creation on startup
+# Bring the database schema up to date on startup
 # ---------------------------------------------------------
-from app.database import Base, engine
-from app.models import admin, member, payment, plan, gym_info
+from app.database import engine
+from app.migrations import run_migrations
 
-# Create all tables if they don't exist
-Base.metadata.create_all(bind=engine)
+# Create missing tables and apply pending migrations (e.g. new indexes)
+run_migrations(engine)
 
 # ---------------------------------------------------------
 # Customize Swagger UI to support JWT Bearer authentication
@@ -0,0 +1,109 @@
+# backend/app/migrations/__init__.py
+#
+# Minimal versioned schema migrations.
+#
+# Every migration is a module in this package with a VERSION number, a short
+# DESCRIPTION and an upgrade(conn) function. Applied versions are recorded in
+# the "schema_migrations" table, so each migration runs exactly once per database.
+#
+# - A brand-new database gets every table and index from the models through
+#   create_all, and all migrations are recorded as applied.
+# - A database created before migrations existed (tables but no
+#   schema_migrations) is recorded at the baseline and upgraded from there.
+# - Otherwise only the migrations that have not been applied yet are run.
+
+from datetime import datetime  # To timestamp applied migrations
+from typing import List  # For type hints
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, select
+from sqlalchemy.engine import Engine
+
+from app.database import Base
+
+# Import every migration module, in order
+from app.migrations import (
+    m0001_baseline,
+    m0002_dashboard_summary,
+    m0003_hot_filter_indexes,
+    m0004_table_versions,
+    m0005_member_search,
+    m0006_member_payment_totals,
+)
+
+MIGRATIONS = [
+    m0001_baseline,
+    m0002_dashboard_summary,
+    m0003_hot_filter_indexes,
+    m0004_table_versions,
+    m0005_member_search,
+    m0006_member_payment_totals,
+]
+
+# Bookkeeping table, kept out of Base.metadata so create_all never touches it
+migration_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def applied_versions(engine: Engine) -> List[int]:
+    # Versions already recorded in schema_migrations (empty if the table does not exist)
+    if not inspect(engine).has_table("schema_migrations"):
+        return []
+    with engine.connect() as conn:
+        return [row[0] for row in conn.execute(select(schema_migrations.c.version).order_by(schema_migrations.c.version))]
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """
+    Bring the database schema up to date.
+
+    Args:
+        engine (Engine): Engine connected to the application database.
+
+    Returns:
+        List[int]: Versions that were applied (or recorded) by this call.
+    """
+    # Make sure every model is registered on Base.metadata before create_all
+    from app.models import admin, member, payment, plan, gym_info, dashboard_summary, table_version  # noqa: F401
+
+    inspector = inspect(engine)
+    fresh = not inspector.has_table("schema_migrations")
+    legacy_tables = fresh and inspector.has_table("members")
+
+    migration_metadata.create_all(bind=engine)
+    done = set(applied_versions(engine))
+    recorded = []
+
+    with engine.begin() as conn:
+        if fresh and not legacy_tables:
+            # Empty database: the models already describe the latest schema
+            Base.metadata.create_all(bind=conn)
+            pending = []
+            recorded = [m.VERSION for m in MIGRATIONS]
+        else:
+            if fresh:
+                # Tables were created by create_all before migrations existed
+                done.add(m0001_baseline.VERSION)
+                recorded.append(m0001_baseline.VERSION)
+            pending = [m for m in MIGRATIONS if m.VERSION not in done]
+
+        for migration in pending:
+            migration.upgrade(conn)
+            recorded.append(migration.VERSION)
+
+        by_version = {m.VERSION: m for m in MIGRATIONS}
+        for version in recorded:
+            conn.execute(
+                schema_migrations.insert().values(
+                    version=version,
+                    description=by_version[version].DESCRIPTION,
+                    applied_at=datetime.now(),
+                )
+            )
+
+    return recorded
@@ -0,0 +1,10 @@
+# backend/app/migrations/m0001_baseline.py
+
+# Schema as it was created by Base.metadata.create_all before migrations existed
+VERSION = 1
+DESCRIPTION = "baseline: admins, members, payments, plans, gym_info"
+
+
+def upgrade(conn):
+    # Databases at the baseline already have these tables; nothing to do
+    pass
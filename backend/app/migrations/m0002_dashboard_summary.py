@@ -0,0 +1,11 @@
+# backend/app/migrations/m0002_dashboard_summary.py
+
+from app.models.dashboard_summary import DashboardSummary
+
+VERSION = 2
+DESCRIPTION = "dashboard_summary rollup table"
+
+
+def upgrade(conn):
+    # The table may already exist if it was created by create_all
+    DashboardSummary.__table__.create(bind=conn, checkfirst=True)
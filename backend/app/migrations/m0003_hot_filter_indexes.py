@@ -0,0 +1,17 @@
+# backend/app/migrations/m0003_hot_filter_indexes.py
+
+from app.models.member import Member
+from app.models.payment import Payment
+
+VERSION = 3
+DESCRIPTION = "indexes on members(end_date), payments(member_id, date DESC), payments(date)"
+
+INDEX_NAMES = ("ix_members_end_date", "ix_payments_member_id_date", "ix_payments_date")
+
+
+def upgrade(conn):
+    # Create the indexes declared in the models' __table_args__
+    for table in (Member.__table__, Payment.__table__):
+        for index in table.indexes:
+            if index.name in INDEX_NAMES:
+                index.create(bind=conn, checkfirst=True)
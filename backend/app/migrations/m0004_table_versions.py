@@ -0,0 +1,11 @@
+# backend/app/migrations/m0004_table_versions.py
+
+from app.models.table_version import TableVersion
+
+VERSION = 4
+DESCRIPTION = "table_versions change counters"
+
+
+def upgrade(conn):
+    # The table may already exist if it was created by create_all
+    TableVersion.__table__.create(bind=conn, checkfirst=True)
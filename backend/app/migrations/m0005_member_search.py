@@ -0,0 +1,40 @@
+# backend/app/migrations/m0005_member_search.py
+
+from sqlalchemy import bindparam, inspect, select, text, update
+
+from app.models.member import Member, MEMBER_SEARCH_DDL, normalize_phone
+
+VERSION = 5
+DESCRIPTION = "members.phone_digits and member search index (FTS5 on SQLite, pg_trgm on Postgres)"
+
+# Members backfilled per UPDATE batch
+BATCH_SIZE = 5000
+
+
+def upgrade(conn):
+    # Add the normalized phone column (it may exist if create_all ran with the new model)
+    if "phone_digits" not in {column["name"] for column in inspect(conn).get_columns("members")}:
+        conn.execute(text("ALTER TABLE members ADD COLUMN phone_digits VARCHAR"))
+
+    # Backfill it before the search triggers exist, so rows are indexed once by the rebuild below
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            select(Member.id, Member.phone).where(Member.id > last_id).order_by(Member.id).limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            update(Member.__table__)
+            .where(Member.__table__.c.id == bindparam("member_id"))
+            .values(phone_digits=bindparam("digits")),
+            [{"member_id": row.id, "digits": normalize_phone(row.phone)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+    for statement in MEMBER_SEARCH_DDL.get(conn.dialect.name, []):
+        conn.execute(text(statement))
+
+    # Index every existing member
+    if conn.dialect.name == "sqlite":
+        conn.execute(text("INSERT INTO members_fts(members_fts) VALUES ('rebuild')"))
@@ -0,0 +1,25 @@
+# backend/app/migrations/m0006_member_payment_totals.py
+
+from sqlalchemy import inspect, text
+
+from app.utils.member_totals import rebuild_member_totals
+
+VERSION = 6
+DESCRIPTION = "members.total_paid, payment_count, last_payment_at"
+
+COLUMNS = {
+    "total_paid": "NUMERIC(12, 2) NOT NULL DEFAULT 0",
+    "payment_count": "INTEGER NOT NULL DEFAULT 0",
+    "last_payment_at": "TIMESTAMP",
+}
+
+
+def upgrade(conn):
+    # Add the counters (they may exist if create_all ran with the new model)
+    existing = {column["name"] for column in inspect(conn).get_columns("members")}
+    for name, ddl in COLUMNS.items():
+        if name not in existing:
+            conn.execute(text(f"ALTER TABLE members ADD COLUMN {name} {ddl}"))
+
+    # Fill them from the payment history
+    rebuild_member_totals(conn)
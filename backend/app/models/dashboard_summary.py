@@ -0,0 +1,45 @@
+# backend/app/models/dashboard_summary.py
+
+# Import SQLAlchemy column types used to define the rollup table
+from sqlalchemy import Column, Integer, String, Date, DateTime, Numeric
+
+# Import datetime to timestamp every update of a summary row
+from datetime import datetime
+
+# Import the Base class for model declaration
+from app.database import Base
+
+
+# Define a class that maps to the "dashboard_summary" table in the database
+# Each row holds the dashboard counters for one day or one month, so the
+# dashboard can be served with a single primary-key read
+class DashboardSummary(Base):
+    # Name of the table in the database
+    __tablename__ = "dashboard_summary"
+
+    # Granularity of the row: "day" or "month" (part of the primary key)
+    period = Column(String, primary_key=True)
+
+    # First day of the period (the day itself, or the 1st of the month)
+    period_start = Column(Date, primary_key=True)
+
+    # Number of members as of the period
+    total_members = Column(Integer, nullable=False, default=0)
+
+    # Members whose end_date is before the period start
+    expired_members = Column(Integer, nullable=False, default=0)
+
+    # Members whose end_date falls within 7 days of the period start
+    upcoming_renewals = Column(Integer, nullable=False, default=0)
+
+    # Revenue collected within the period
+    revenue = Column(Numeric(12, 2), nullable=False, default=0)
+
+    # Revenue collected from the 1st of the month up to and including the period
+    month_revenue = Column(Numeric(12, 2), nullable=False, default=0)
+
+    # Number of payments recorded within the period
+    payment_count = Column(Integer, nullable=False, default=0)
+
+    # When the row was last changed (incremental update or rebuild)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
@@ -1,7 +1,11 @@
 # backend/app/models/member.py
 
 # Import column types from SQLAlchemy to define the schema (structure) of the table
-from sqlalchemy import Column, Integer, String, Date, Text
+from sqlalchemy import Column, Integer, String, Date, DateTime, Numeric, Text, Index, DDL, event
+from sqlalchemy.orm import relationship
+
+# To strip everything but digits from phone numbers
+import re
 
 # Import the Base class used for defining models
 from app.database import Base
@@ -22,6 +26,10 @@ class Member(Base):
     
     # 'phone' column - stores the member's phone number (required)
     phone = Column(String, nullable=False)
+
+    # 'phone_digits' column - the phone number with every non-digit removed, used by member search
+    # Written next to 'phone' on every insert and update (see normalize_phone)
+    phone_digits = Column(String, nullable=True)
     
     # 'email' column - stores the member's email address (optional)
     email = Column(String, nullable=True)
@@ -37,3 +45,69 @@ class Member(Base):
     
     # 'notes' column - optional field to store additional notes about the member (e.g., health info, preferences)
     notes = Column(Text, nullable=True)
+
+    # Lifetime payment counters, kept up to date whenever a payment is recorded (see app/utils/member_totals.py)
+    # Sum of all the member's payment amounts
+    total_paid = Column(Numeric(12, 2), nullable=False, default=0, server_default="0")
+
+    # Number of payments the member has made
+    payment_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Date and time of the member's most recent payment (None if they never paid)
+    last_payment_at = Column(DateTime, nullable=True)
+
+    # Relationship to the Payment model: the member's payments, newest first
+    # (served by ix_payments_member_id_date); load it with selectinload to avoid N+1 queries
+    payments = relationship(
+        "Payment",
+        back_populates="member",
+        order_by="(desc(Payment.date), desc(Payment.id))",
+    )
+
+    # Indexes for hot filter columns
+    # end_date is used by every renewal query and by the dashboard
+    __table_args__ = (
+        Index("ix_members_end_date", "end_date"),
+    )
+
+
+# Turn a phone number as typed ("+91 98765-43210") into the searchable digits ("919876543210")
+def normalize_phone(phone):
+    return re.sub(r"\D", "", phone) if phone else None
+
+
+# Search index objects that are not expressed through columns, per database
+# SQLite: an FTS5 trigram index over name, email and phone_digits, kept in sync by triggers
+# Postgres: pg_trgm GIN indexes supporting substring (LIKE '%...%') lookups
+MEMBER_SEARCH_DDL = {
+    "sqlite": [
+        """CREATE VIRTUAL TABLE IF NOT EXISTS members_fts USING fts5(
+            name, email, phone_digits, content='members', content_rowid='id', tokenize='trigram'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS members_fts_ai AFTER INSERT ON members BEGIN
+            INSERT INTO members_fts(rowid, name, email, phone_digits)
+            VALUES (new.id, new.name, new.email, new.phone_digits);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS members_fts_ad AFTER DELETE ON members BEGIN
+            INSERT INTO members_fts(members_fts, rowid, name, email, phone_digits)
+            VALUES ('delete', old.id, old.name, old.email, old.phone_digits);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS members_fts_au AFTER UPDATE OF name, email, phone_digits ON members BEGIN
+            INSERT INTO members_fts(members_fts, rowid, name, email, phone_digits)
+            VALUES ('delete', old.id, old.name, old.email, old.phone_digits);
+            INSERT INTO members_fts(rowid, name, email, phone_digits)
+            VALUES (new.id, new.name, new.email, new.phone_digits);
+        END""",
+    ],
+    "postgresql": [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS ix_members_name_trgm ON members USING gin (lower(name) gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_members_email_trgm ON members USING gin (lower(email) gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_members_phone_digits_trgm ON members USING gin (phone_digits gin_trgm_ops)",
+    ],
+}
+
+# create_all creates the search objects right after the members table
+for dialect, statements in MEMBER_SEARCH_DDL.items():
+    for statement in statements:
+        event.listen(Member.__table__, "after_create", DDL(statement).execute_if(dialect=dialect))
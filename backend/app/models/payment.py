@@ -1,7 +1,7 @@
 # backend/app/models/payment.py
 
 # Import necessary SQLAlchemy column types and relationship tools
-from sqlalchemy import Column, Integer, ForeignKey, Numeric, String, DateTime, Text
+from sqlalchemy import Column, Integer, ForeignKey, Numeric, String, DateTime, Text, Index
 from sqlalchemy.orm import relationship
 
 # Import datetime for automatic timestamping of payment records
@@ -37,5 +37,13 @@ class Payment(Base):
     # Optional notes field for any additional details about the payment
     notes = Column(Text, nullable=True)
 
-    # Relationship to the Member model
-    member = relationship("Member", backref="payments")
+    # Relationship to the Member model (the other side is Member.payments)
+    member = relationship("Member", back_populates="payments")
+
+    # Indexes for hot filter columns
+    # (member_id, date DESC) serves the per-member payment history ordered by newest first
+    # date serves the monthly revenue and date range filters
+    __table_args__ = (
+        Index("ix_payments_member_id_date", member_id, date.desc()),
+        Index("ix_payments_date", date),
+    )
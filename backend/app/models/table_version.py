@@ -0,0 +1,27 @@
+# backend/app/models/table_version.py
+
+# Import SQLAlchemy column types used to define the version table
+from sqlalchemy import Column, Integer, String, DateTime
+
+# Import datetime to timestamp every version bump
+from datetime import datetime
+
+# Import the Base class for model declaration
+from app.database import Base
+
+
+# Define a class that maps to the "table_versions" table in the database
+# Each row is a counter that is incremented whenever the named table changes,
+# so every worker process can tell whether its in-memory copy is stale
+class TableVersion(Base):
+    # Name of the table in the database
+    __tablename__ = "table_versions"
+
+    # Name of the versioned table (e.g. "plans")
+    name = Column(String, primary_key=True)
+
+    # Incremented in the same transaction as every write to the table
+    version = Column(Integer, nullable=False, default=0)
+
+    # When the counter was last incremented
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
@@ -1,2 +1,2 @@
 # app/routes/__init__.py
-from . import auth, member, payment, plan, renewal, gym_info
+from . import auth, member, payment, plan, renewal, gym_info, admin
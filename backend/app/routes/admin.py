@@ -0,0 +1,83 @@
+# backend/app/routes/admin.py
+
+# Import FastAPI tools for routing and error handling
+from fastapi import APIRouter, Depends, HTTPException, status
+
+# Import the live connection pool statistics
+from app.utils.pool_stats import POOL_STATS
+
+# Import the slow-query log
+from app.utils.slow_queries import clear_slow_queries, slow_query_snapshot
+
+# Import the log queue counters
+from app.utils.log import logging_stats
+
+# Import the bcrypt executor load
+from app.auth.password_handler import hashing_pool_stats
+
+# Import the verified-token cache controls
+from app.auth.jwt_handler import clear_token_cache, token_cache_stats
+
+# Import the shared authentication dependency (admin endpoints also require an existing admin)
+from app.auth.dependencies import get_current_admin
+
+
+# Create a FastAPI router for operational/admin endpoints
+# All routes will be prefixed with "/admin"
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+# ----------------- ROUTES -----------------
+
+# GET /admin/pool
+# Returns checked-out, idle and overflow connection counts for each engine,
+# plus event counters and wait/hold time histograms (milliseconds)
+@router.get("/pool")
+async def get_pool_stats(_: dict = Depends(get_current_admin)):
+    return {name: stats.snapshot() for name, stats in POOL_STATS.items()}
+
+
+# GET /admin/token-cache
+# Returns hit/miss/eviction counters and the size of the verified-token cache
+@router.get("/token-cache")
+async def get_token_cache_stats(_: dict = Depends(get_current_admin)):
+    return token_cache_stats()
+
+
+# DELETE /admin/token-cache
+# Empties the verified-token cache (use after rotating the signing key)
+@router.delete("/token-cache", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_token_cache(_: dict = Depends(get_current_admin)):
+    clear_token_cache()
+    return
+
+
+# GET /admin/hashing
+# Returns how many password hash/verify jobs are running or queued on the bcrypt executor
+@router.get("/hashing")
+async def get_hashing_stats(_: dict = Depends(get_current_admin)):
+    return hashing_pool_stats()
+
+
+# GET /admin/slow-queries
+# Returns statements slower than SLOW_QUERY_MS grouped by normalized SQL, and the
+# most recent ones (newest first) with route, redacted parameters and query plan
+@router.get("/slow-queries")
+async def get_slow_queries(_: dict = Depends(get_current_admin)):
+    return slow_query_snapshot()
+
+
+# DELETE /admin/slow-queries
+# Empties the slow-query buffer (e.g. after adding an index)
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_slow_queries(_: dict = Depends(get_current_admin)):
+    clear_slow_queries()
+    return
+
+
+# GET /admin/logging
+# Returns how many log records are waiting to be written and how many were dropped
+# because the log queue was full
+@router.get("/logging")
+async def get_logging_stats(_: dict = Depends(get_current_admin)):
+    return logging_stats()
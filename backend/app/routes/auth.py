@@ -1,16 +1,20 @@
 # backend/app/routes/auth.py
 
+# Import logging to record login outcomes (never credentials or tokens)
+import logging
+
 # Import required tools from FastAPI
 from fastapi import APIRouter, Depends, HTTPException, status
 
-# Import SQLAlchemy Session to interact with the database
-from sqlalchemy.orm import Session
+# Import AsyncSession to interact with the database without blocking, and select to build queries
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 
 # Import form data structure for login (though not used here; included by default in OAuth2PasswordRequestForm)
 from fastapi.security import OAuth2PasswordRequestForm
 
-# Import local database session creator
-from app.database import get_db
+# Import the async database session dependency
+from app.database import get_async_db
 
 # Import the Admin model for querying admin users
 from app.models.admin import Admin
@@ -18,42 +22,86 @@ from app.models.admin import Admin
 # Import request and response schemas for login
 from app.schemas.admin import LoginRequest, LoginResponse, AdminCreate, AdminPasswordReset
 
-# Import password verification function
-from app.auth.password_handler import verify_password
-from app.auth.password_handler import hash_password
+# Import password hashing/verification, run on the bounded bcrypt executor
+from app.auth.password_handler import verify_password_async, hash_password_async, HashingPoolFull
+
+# Import per-username attempt throttling
+from app.auth.throttle import login_throttle
 
 # Import function to generate a JWT token
 from app.auth.jwt_handler import create_access_token
 
+# Import the admin-row cache invalidation
+from app.auth.dependencies import forget_admin
+
+# Import the compression opt-out for responses carrying secrets
+from app.utils.compression import no_compression
+
+# Logger for authentication events
+logger = logging.getLogger(__name__)
+
 # Create a router for authentication-related routes
 router = APIRouter(tags=["Auth"])
 
 
+# Reject the request with 429 if this username has used up its attempts
+def check_throttle(username: str):
+    retry_after = login_throttle.hit(username.lower())
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts, try again later",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+# Run a password hash/verify on the bounded executor
+# Returns 503 instead of queueing when the executor is full
+async def run_hashing(coro):
+    try:
+        return await coro
+    except HashingPoolFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, try again shortly",
+            headers={"Retry-After": "1"},
+        )
+
+
 # Login route - handles POST requests to /login
 # Expects a JSON body matching LoginRequest schema (username and password)
 # Returns a LoginResponse schema with a JWT access token
+# Never compressed: the token must not be exposed to compression side channels (BREACH)
 @router.post("/login", response_model=LoginResponse)
-def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+@no_compression
+async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+    # Limit attempts per username before doing any bcrypt work
+    check_throttle(login_data.username)
+
     # Query the database for an admin with the given username
-    
-    admin = db.query(Admin).filter(Admin.email == login_data.username).first()
-    print(admin)
+    admin = await db.scalar(select(Admin).where(Admin.email == login_data.username))
     # If no admin found, raise an unauthorized error
     if not admin:
+        logger.warning("Login failed: unknown username", extra={"event": "auth.login_failed", "reason": "unknown_username"})
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username"
         )
 
     # Verify the password provided against the hashed password stored in the database
-    if not verify_password(login_data.password, admin.hashed_password):
+    if not await run_hashing(verify_password_async(login_data.password, admin.hashed_password)):
+        logger.warning("Login failed: wrong password", extra={"event": "auth.login_failed", "reason": "wrong_password", "admin_id": admin.id})
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid password"
         )
 
+    # A successful login clears the attempt counter
+    login_throttle.reset(login_data.username.lower())
+
     # If credentials are correct, generate a JWT access token
     access_token = create_access_token(data={"sub": admin.username})
+    logger.info("Admin logged in", extra={"event": "auth.login", "admin_id": admin.id})
 
     # Return the token wrapped in a response schema
     return LoginResponse(access_token=access_token, message="Login successful")
@@ -66,26 +114,26 @@ def login(login_data: LoginRequest, db: Session = Depends(get_db)):
 # Expects a JSON body matching AdminCreate schema (username, email, password, confirm_password)
 # Returns a success message if registration is completed
 @router.post("/register")
-def register(admin_data: AdminCreate, db: Session = Depends(get_db)):
+async def register(admin_data: AdminCreate, db: AsyncSession = Depends(get_async_db)):
     # Check that password and confirm_password fields match
     if admin_data.password != admin_data.confirm_password:
         raise HTTPException(status_code=400, detail="Passwords do not match")
 
     # Check if the username or email is already taken in the database
-    if db.query(Admin).filter((Admin.username == admin_data.username) | (Admin.email == admin_data.email)).first():
+    if await db.scalar(select(Admin).where((Admin.username == admin_data.username) | (Admin.email == admin_data.email))):
         raise HTTPException(status_code=400, detail="Username or email already exists")
 
     # Create a new Admin object with hashed password
     new_admin = Admin(
         username=admin_data.username,
         email=admin_data.email,
-        hashed_password=hash_password(admin_data.password)
+        hashed_password=await run_hashing(hash_password_async(admin_data.password))
     )
 
     # Add the new admin to the database and commit the transaction
     db.add(new_admin)
-    db.commit()
-    db.refresh(new_admin)  # Refresh instance with new DB state (e.g., get assigned ID)
+    await db.commit()
+    await db.refresh(new_admin)  # Refresh instance with new DB state (e.g., get assigned ID)
 
     # Return a success message upon successful registration
     return {"message": "Registration successful"}
@@ -94,9 +142,12 @@ def register(admin_data: AdminCreate, db: Session = Depends(get_db)):
 
 # Password reset route
 @router.post("/reset-password")
-def reset_password(data: AdminPasswordReset, db: Session = Depends(get_db)):
+async def reset_password(data: AdminPasswordReset, db: AsyncSession = Depends(get_async_db)):
+    # Limit attempts per email before doing any bcrypt work
+    check_throttle(data.email)
+
     # Find admin by email
-    admin = db.query(Admin).filter(Admin.email == data.email).first()
+    admin = await db.scalar(select(Admin).where(Admin.email == data.email))
 
     # If admin doesn't exist, raise error
     if not admin:
@@ -106,7 +157,7 @@ def reset_password(data: AdminPasswordReset, db: Session = Depends(get_db)):
         )
 
     # Verify old password
-    if not verify_password(data.old_password, admin.hashed_password):
+    if not await run_hashing(verify_password_async(data.old_password, admin.hashed_password)):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect current password"
@@ -120,7 +171,10 @@ def reset_password(data: AdminPasswordReset, db: Session = Depends(get_db)):
         )
 
     # Hash and update the new password
-    admin.hashed_password = hash_password(data.new_password)
-    db.commit()
+    admin.hashed_password = await run_hashing(hash_password_async(data.new_password))
+    await db.commit()
+
+    # Drop any cached copy of this admin so the next request reads it again
+    forget_admin(admin.username)
 
     return {"message": "Password reset successful"}
\ No newline at end of file
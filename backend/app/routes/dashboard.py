@@ -1,44 +1,47 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.models.member import Member
-from app.models.payment import Payment
-from datetime import datetime, timedelta
-from app.auth.jwt_handler import verify_access_token
-from fastapi.security import OAuth2PasswordBearer
+import logging
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.database import get_async_db
+from app.utils.stats import BREAKDOWN_COLUMNS, compute_revenue_breakdown
+from app.utils.summary import ensure_summary, summary_to_stats
+from datetime import datetime
+from app.auth.dependencies import get_current_user
+from app.utils.etag import table_etag, conditional
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")
-
-def get_current_user(token: str = Depends(oauth2_scheme)):
-    payload = verify_access_token(token)
-    if not payload:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-    return payload
-
 @router.get("/")
-def get_dashboard_stats(db: Session = Depends(get_db)):
-    
-    print("in dashboard")
-    total_members = db.query(Member).count()
-
+async def get_dashboard_stats(
+    request: Request,
+    response: Response,
+    breakdown: Optional[str] = Query(None, description="Comma-separated: method, plan"),
+    db: AsyncSession = Depends(get_async_db),
+    _: dict = Depends(get_current_user),
+):
+    # Polled by every open dashboard, so only a sample of views is logged
+    logger.info("Dashboard requested", extra={"event": "dashboard.view", "breakdown": breakdown, "sample": 0.01})
     today = datetime.now().date()
-    exp_members = db.query(Member).filter(Member.end_date < today).count()
-    active_members = total_members - exp_members
-
-    start_of_month = datetime.now().replace(day=1)
-    payments_this_month = db.query(Payment).filter(Payment.date >= start_of_month).all()
-    total_payments = sum([p.amount for p in payments_this_month])
-
-    next_week = datetime.now() + timedelta(days=7)
-    now = datetime.now()
-    upcoming_renewals = db.query(Member).filter((Member.end_date <= next_week) & (Member.end_date >= now)).count()
 
-    return {
-        "Total_Members": total_members,
-        "Active_Members": active_members,
-        "Total_Payments": total_payments,
-        "Upcoming_Renewals": upcoming_renewals, 
-        "Expired_Membership": exp_members
-    }
+    # Counters only change with members, payments, a summary rebuild or the date
+    etag = await db.run_sync(table_etag, ["members", "payments", "dashboard_summary"], today, breakdown)
+    not_modified = conditional(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    # Counters are read from today's dashboard_summary row (built on the first request of the day)
+    row = await db.run_sync(ensure_summary, today)
+    stats = summary_to_stats(row)
+    await db.commit()
+
+    if breakdown:
+        dimensions = [d.strip() for d in breakdown.split(",") if d.strip()]
+        unknown = [d for d in dimensions if d not in BREAKDOWN_COLUMNS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown breakdown: {', '.join(unknown)}")
+        for dimension in dimensions:
+            stats[f"Revenue_By_{dimension.capitalize()}"] = await db.run_sync(compute_revenue_breakdown, dimension, today)
+
+    return stats
@@ -1,7 +1,7 @@
 # backend/app/routes/gym_info.py
 
 # Import FastAPI tools for routing and error handling
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 # Import SQLAlchemy session for database access
 from sqlalchemy.orm import Session
@@ -15,11 +15,12 @@ from app.models.gym_info import GymInfo
 # Import schemas for reading and updating gym info
 from app.schemas.gym_info import GymInfoOut, GymInfoUpdate
 
-# Import token verification function
-from app.auth.jwt_handler import verify_access_token
+# Import the shared authentication dependency
+from app.auth.dependencies import get_current_user
 
-# Import OAuth2 token dependency
-from fastapi.security import OAuth2PasswordBearer
+# Import the change counter and conditional GET helpers
+from app.utils.versions import bump_version
+from app.utils.etag import table_etag, conditional
 
 
 # Create a FastAPI router for gym info related endpoints
@@ -27,29 +28,24 @@ from fastapi.security import OAuth2PasswordBearer
 router = APIRouter(prefix="/gym-info", tags=["Gym Info"])
 
 
-# OAuth2PasswordBearer is a dependency that extracts the token from the Authorization header
-# This expects the token to be passed as "Bearer <token>"
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")
-
-
-# Dependency to verify token and get current user (for protected routes)
-def get_current_user(token: str = Depends(oauth2_scheme)):
-    payload = verify_access_token(token)  # Decode and verify JWT
-    if not payload:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-    return payload  # If valid, return the payload (e.g., {"sub": username})
-
-
 # ----------------- ROUTES -----------------
 
 # GET /gym-info
 # Retrieves the current gym's information from the database
 # Requires a valid token (authenticated user)
+# Answers 304 Not Modified when If-None-Match carries the current ETag
 @router.get("/", response_model=GymInfoOut)
 def get_gym_info(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),         # Get DB session
     _: dict = Depends(get_current_user)    # Ensure user is authenticated
 ):
+    # Compare the gym_info version with the client's copy before loading the row
+    not_modified = conditional(request, response, table_etag(db, ["gym_info"]))
+    if not_modified:
+        return not_modified
+
     # Fetch the first (and only) GymInfo record
     gym_info = db.query(GymInfo).first()
 
@@ -79,6 +75,7 @@ def create_gym_info(
 
     # Add to DB and commit
     db.add(gym_info)
+    bump_version(db, "gym_info")
     db.commit()
     db.refresh(gym_info)
 
@@ -106,6 +103,7 @@ def update_gym_info(
         setattr(gym_info, field, value)  # Set new value for each field
 
     # Save the changes to the database
+    bump_version(db, "gym_info")
     db.commit()
 
     # Refresh the object with the new data from the database
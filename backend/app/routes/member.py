@@ -1,115 +1,368 @@
 # backend/app/routes/member.py
 
-# Import FastAPI utilities for routing, dependency injection, and exceptions
-from fastapi import APIRouter, Depends, HTTPException, status
+# Import FastAPI utilities for routing, dependency injection, exceptions, and query parameters
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 
-# Import Session for database interactions
-from sqlalchemy.orm import Session
+# Import AsyncSession for non-blocking database interactions
+from sqlalchemy.ext.asyncio import AsyncSession
 
-# Import List typing for response models that return lists
-from typing import List
+# Import typing helpers for optional query parameters and alternative responses
+from typing import List, Optional, Union
 
-# Import the session factory for database connection
-from app.database import get_db
+# To read import limits from environment variables
+import os
 
-# Import the Member ORM model
-from app.models.member import Member
+# Import select/func/insert to build queries, and selectinload to fetch payment histories in one query
+from sqlalchemy import select, func, insert
+from sqlalchemy.orm import selectinload
+
+# Import the async session dependency
+from app.database import get_async_db
+
+# Import the Member ORM model and phone normalization for the search column
+from app.models.member import Member, normalize_phone
+
+# Import Payment so the Member.payments relationship is configured
+from app.models.payment import Payment  # noqa: F401
 
 # Import Pydantic schemas for member creation, update, and output
-from app.schemas.member import MemberCreate, MemberUpdate, MemberOut
+from app.schemas.member import (
+    MemberCreate, MemberUpdate, MemberOut, MemberPage, MemberDetail, MemberDetailList,
+    MemberImportReport, MemberSearchResults,
+)
+
+# Import dashboard rollup maintenance
+from app.utils.summary import record_member_change, record_members_added
+
+# Import streaming parsers and chunk validation for bulk imports
+from app.utils.importer import iter_lines, iter_csv_records, iter_ndjson_records, validate_rows
+
+# Import the streaming CSV/NDJSON export helper
+from app.utils.export import export_response
+
+# Import cursor helpers shared by paginated list endpoints
+from app.utils.pagination import keyset_page, clamp_limit, MAX_PAGE_SIZE
 
-# Import function to verify JWT tokens
-from app.auth.jwt_handler import verify_access_token
+# Import the column-tuple + orjson fast path for list responses
+from app.utils.fast_json import parse_fields, field_columns, rows_to_dicts, fast_response
 
-# Import OAuth2 password bearer to extract tokens from requests
-from fastapi.security import OAuth2PasswordBearer
+# Import the plan catalog, which plan_type values are checked against
+from app.utils.plan_catalog import get_plan_catalog, require_plan
+
+# Import the member search query builder
+from app.utils.search import parse_terms, member_search_query
+
+# Import the shared authentication dependency
+from app.auth.dependencies import get_current_user
+
+# Import the change counter and conditional GET helpers
+from app.utils.versions import bump_version
+from app.utils.etag import table_etag, conditional
 
 
 # Create an APIRouter instance with prefix and tags
 router = APIRouter(prefix="/members", tags=["Members"])
 
+# Rows validated and inserted per batch during a bulk import
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", 1000))
 
-# OAuth2 scheme to extract the token from Authorization header
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/login")
+# Maximum number of per-row errors returned in an import report
+IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", 1000))
 
+# Member columns written by a bulk import, in COPY order
+IMPORT_COLUMNS = list(MemberCreate.model_fields) + ["phone_digits"]
 
-# Dependency to verify the JWT token and authenticate the user
-def get_current_user(token: str = Depends(oauth2_scheme)):
-    print("TOKEN RECEIVED:", token)
-    payload = verify_access_token(token)  # Decode and verify token
-    if not payload:
-        # Raise 401 Unauthorized if token is invalid or expired
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-        )
-    return payload  # Return the decoded token payload if valid
+# Largest number of results a member search can return
+SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", 50))
 
 
 # ----------------- ROUTES -----------------
 
 
+# Columns each supported ordering sorts by (the last one is always the unique id)
+MEMBER_SORT_KEYS = {
+    "id": (Member.id,),
+    "end_date": (Member.end_date, Member.id),
+}
+
+
+# Load members with their payment histories: one query for the members, one for all their payments
+async def load_member_details(db: AsyncSession, ids: List[int]) -> List[Member]:
+    result = await db.execute(
+        select(Member).where(Member.id.in_(ids)).options(selectinload(Member.payments))
+    )
+    by_id = {member.id: member for member in result.scalars().all()}
+    return [by_id[member_id] for member_id in ids if member_id in by_id]
+
+
+# Parse the `ids` query parameter ("3,8,21") into unique member ids, in order
+def parse_ids(ids: str) -> List[int]:
+    try:
+        values = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be a comma-separated list of integers")
+    values = list(dict.fromkeys(values))
+    if len(values) > MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_PAGE_SIZE} ids per request")
+    return values
+
+
 # GET /members
-# Return a list of all members in the database
+# Return one page of members ordered by id (or by end_date, id)
+# Pass the returned next_cursor back as `cursor` to get the following page
+# Pass `fields` (e.g. id,name,phone,end_date) to select and return only those columns
+# Answers 304 Not Modified when If-None-Match carries the current ETag
+# With `ids` (e.g. ids=3,8,21) return just those members with lifetime counters and payment history instead
 # Requires user authentication (valid JWT token)
-@router.get("/", response_model=List[MemberOut])
-def get_members(db: Session = Depends(get_db), _: dict = Depends(get_current_user)):
-    return db.query(Member).all()  # Return all member records
+@router.get("/", response_model=Union[MemberPage, MemberDetailList])
+async def get_members(
+    request: Request,
+    response: Response,
+    ids: Optional[str] = Query(None, description="Comma-separated member ids; returns those members with their payments"),
+    cursor: Optional[str] = Query(None),                           # Opaque cursor from the previous page
+    limit: Optional[int] = Query(None, ge=1),                      # Page size, capped at PAGE_SIZE_MAX
+    sort: str = Query("id", pattern="^(id|end_date)$"),            # Ordering: "id" or "end_date"
+    include_total: bool = Query(False),                            # Also count all members (extra query)
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,phone,end_date; only these keys are present in each item (all fields when omitted)"),
+    db: AsyncSession = Depends(get_async_db),
+    _: dict = Depends(get_current_user)
+):
+    if ids is not None:
+        members = await load_member_details(db, parse_ids(ids))
+        return fast_response(MemberDetailList.model_validate({"items": members}, from_attributes=True).model_dump())
+
+    limit = clamp_limit(limit)
+    names = parse_fields(fields, MemberOut)
+
+    # Compare the members version with the client's copy before running the page query
+    etag = await db.run_sync(table_etag, ["members"], cursor, limit, sort, include_total, names)
+    not_modified = conditional(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    # Fetch the page that follows the cursor as plain column tuples (requested fields + sort keys)
+    keys = MEMBER_SORT_KEYS[sort]
+    rows, next_cursor = await keyset_page(
+        db, select(*field_columns(Member, names, keys)), keys, sort, cursor, limit, entities=False
+    )
+
+    total = await db.scalar(select(func.count(Member.id))) if include_total else None
+
+    # Encoded directly with orjson; the payload matches MemberPage
+    return fast_response({"items": rows_to_dicts(rows, names), "next_cursor": next_cursor, "total": total}, response)
+
+
+# GET /members/export
+# Stream every member as CSV or NDJSON, optionally gzip-compressed
+# Rows are read through a server-side cursor, so memory use does not grow with the table
+@router.get("/export")
+async def export_members(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),  # Output format
+    gzip: bool = Query(False),                             # Compress the stream on the fly
+    _: dict = Depends(get_current_user)
+):
+    stmt = select(*field_columns(Member, list(MemberOut.model_fields))).order_by(Member.id)
+    return export_response(stmt, format, "members", gzip)
+
+
+# GET /members/search
+# Find members by partial name, email or phone number (e.g. "ravi", "98765", "ravi 4321")
+# Every term must match; results are ranked best match first and capped at `limit`
+# Uses the search index (FTS5 on SQLite, pg_trgm on Postgres), so the table is never scanned
+@router.get("/search", response_model=MemberSearchResults)
+async def search_members(
+    q: str = Query(..., min_length=1, max_length=100),            # Search text
+    limit: int = Query(20, ge=1),                                   # Number of results, capped at SEARCH_MAX_RESULTS
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,phone,end_date; only these keys are present in each item (all fields when omitted)"),
+    db: AsyncSession = Depends(get_async_db),
+    _: dict = Depends(get_current_user)
+):
+    terms = parse_terms(q)
+    names = parse_fields(fields, MemberOut)
+    dialect = (await db.connection()).dialect.name
+
+    query = member_search_query(dialect, terms, field_columns(Member, names), min(limit, SEARCH_MAX_RESULTS))
+    rows = (await db.execute(query)).all()
+
+    return fast_response({"items": rows_to_dicts(rows, names)})
 
 
 # POST /members
 # Create a new member using data sent in the request body
+# plan_type must name an existing plan (400 otherwise)
 # Return the created member with a 201 status code
 @router.post("/", response_model=MemberOut, status_code=status.HTTP_201_CREATED)
-def create_member(
+async def create_member(
     member: MemberCreate,           # Pydantic schema for new member data
-    db: Session = Depends(get_db),  # Database session
+    db: AsyncSession = Depends(get_async_db),  # Database session
     _: dict = Depends(get_current_user)  # Authentication dependency
 ):
-    new_member = Member(**member.dict())  # Create Member object from request data
+    await db.run_sync(require_plan, member.plan_type)
+
+    # Update dashboard_summary in the same transaction
+    await db.run_sync(record_member_change, None, member.end_date)
+    new_member = Member(**member.dict(), phone_digits=normalize_phone(member.phone))  # Create Member object from request data
     db.add(new_member)                    # Add new member to the session
-    db.commit()                          # Commit to save in DB
-    db.refresh(new_member)               # Refresh instance to get DB-generated fields (e.g., id)
+    await db.run_sync(bump_version, "members")
+    await db.commit()                    # Commit to save in DB
+    await db.refresh(new_member)         # Refresh instance to get DB-generated fields (e.g., id)
     return new_member                    # Return the newly created member
 
 
+# Insert one validated chunk of members inside the current transaction
+# Postgres uses COPY through asyncpg; other databases use a batched executemany INSERT
+# dashboard_summary is updated first: on the day's first write ensure_summary builds today's
+# row from the members table, which must not already contain this chunk
+async def insert_member_chunk(db: AsyncSession, rows):
+    for row in rows:
+        row["phone_digits"] = normalize_phone(row["phone"])
+    await db.run_sync(record_members_added, [row["end_date"] for row in rows])
+    connection = await db.connection()
+    if connection.dialect.name == "postgresql":
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            Member.__tablename__,
+            records=[tuple(row[column] for column in IMPORT_COLUMNS) for row in rows],
+            columns=IMPORT_COLUMNS,
+        )
+    else:
+        await db.execute(insert(Member), rows)
+    await db.run_sync(bump_version, "members")
+
+
+# POST /members/import
+# Bulk-create members from a CSV (with header row) or NDJSON request body
+# The body is parsed as a stream and inserted in chunks of IMPORT_CHUNK_SIZE rows
+# Invalid rows (including unknown plan types) are skipped and reported; valid rows are committed in one transaction
+# With dry_run=true rows are only validated
+@router.post("/import", response_model=MemberImportReport)
+async def import_members(
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),  # Defaults from Content-Type
+    dry_run: bool = Query(False),                                  # Validate only, insert nothing
+    db: AsyncSession = Depends(get_async_db),
+    _: dict = Depends(get_current_user)
+):
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = "ndjson" if "ndjson" in content_type or "jsonl" in content_type else "csv"
+
+    lines = iter_lines(request.stream())
+    records = iter_csv_records(lines) if format == "csv" else iter_ndjson_records(lines)
+
+    rows = inserted = failed = 0
+    errors = []
+    chunk = []
+
+    async def flush():
+        nonlocal inserted, failed
+        # Rows whose plan_type names no plan are reported like schema errors
+        catalog = await db.run_sync(get_plan_catalog)
+        known, chunk_errors = [], []
+        for row, record in chunk:
+            plan_type = record.get("plan_type")
+            if plan_type and catalog.by_name(plan_type) is None:
+                chunk_errors.append({"row": row, "errors": [f"plan_type: Unknown plan: {plan_type}"]})
+            else:
+                known.append((row, record))
+        valid, schema_errors = validate_rows(MemberCreate, known)
+        chunk_errors.extend(schema_errors)
+        failed += len(chunk_errors)
+        errors.extend(chunk_errors[:max(IMPORT_MAX_ERRORS - len(errors), 0)])
+        if valid and not dry_run:
+            await insert_member_chunk(db, valid)
+            inserted += len(valid)
+        chunk.clear()
+
+    async for row, record, error in records:
+        rows += 1
+        if error is not None:
+            failed += 1
+            if len(errors) < IMPORT_MAX_ERRORS:
+                errors.append({"row": row, "errors": [error]})
+            continue
+        chunk.append((row, record))
+        if len(chunk) >= IMPORT_CHUNK_SIZE:
+            await flush()
+    await flush()
+
+    if not dry_run:
+        await db.commit()
+
+    errors.sort(key=lambda entry: entry["row"])
+    return {"dry_run": dry_run, "rows": rows, "inserted": inserted, "failed": failed, "errors": errors}
+
+
+# GET /members/{id}
+# Return one member with lifetime counters and payment history (newest first)
+# Declared after the fixed paths (/export, /search, /import) so they are matched first
+@router.get("/{id}", response_model=MemberDetail)
+async def get_member(
+    id: int,                          # ID of the member (from URL path)
+    db: AsyncSession = Depends(get_async_db),
+    _: dict = Depends(get_current_user)
+):
+    members = await load_member_details(db, [id])
+    if not members:
+        raise HTTPException(status_code=404, detail="Member not found")
+    return members[0]
+
+
 # PUT /members/{id}
 # Update an existing member identified by id
 # Only fields provided in the request will be updated (partial update)
 @router.put("/{id}", response_model=MemberOut)
-def update_member(
+async def update_member(
     id: int,                          # ID of the member to update (from URL path)
     member_data: MemberUpdate,        # Data to update (Pydantic schema)
-    db: Session = Depends(get_db),    # DB session
+    db: AsyncSession = Depends(get_async_db),  # DB session
     _: dict = Depends(get_current_user)  # Authentication
 ):
-    member = db.query(Member).filter(Member.id == id).first()  # Find member by id
+    member = await db.get(Member, id)  # Find member by id
     if not member:
         # If not found, raise 404 Not Found error
         raise HTTPException(status_code=404, detail="Member not found")
 
+    changes = member_data.dict(exclude_unset=True)
+
+    # A new plan_type must name an existing plan (400 otherwise)
+    if changes.get("plan_type") is not None:
+        await db.run_sync(require_plan, changes["plan_type"])
+
+    # Update dashboard_summary in the same transaction (before the member row changes)
+    if changes.get("end_date") is not None:
+        await db.run_sync(record_member_change, member.end_date, changes["end_date"])
+
+    # Keep the search column in step with the phone number
+    if changes.get("phone") is not None:
+        changes["phone_digits"] = normalize_phone(changes["phone"])
+
     # Update only the fields sent in the request
-    for field, value in member_data.dict(exclude_unset=True).items():
+    for field, value in changes.items():
         setattr(member, field, value)
 
-    db.commit()        # Save changes to DB
-    db.refresh(member)  # Refresh to get updated data
+    await db.run_sync(bump_version, "members")
+    await db.commit()        # Save changes to DB
+    await db.refresh(member)  # Refresh to get updated data
     return member      # Return updated member
 
 
 # DELETE /members/{id}
 # Delete a member identified by id
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_member(
+async def delete_member(
     id: int,                       # ID of the member to delete
-    db: Session = Depends(get_db),  # DB session
+    db: AsyncSession = Depends(get_async_db),  # DB session
     _: dict = Depends(get_current_user)  # Authentication
 ):
-    member = db.query(Member).filter(Member.id == id).first()  # Find member by id
+    member = await db.get(Member, id)  # Find member by id
     if not member:
         # Raise 404 if member not found
         raise HTTPException(status_code=404, detail="Member not found")
 
-    db.delete(member)  # Delete the member record
-    db.commit()        # Commit the transaction to finalize deletion
+    # Update dashboard_summary in the same transaction
+    await db.run_sync(record_member_change, member.end_date, None)
+    await db.delete(member)  # Delete the member record
+    await db.run_sync(bump_version, "members")
+    await db.commit()        # Commit the transaction to finalize deletion
     return             # Return 204 No Content (empty response)
@@ -0,0 +1,46 @@
+# backend/app/routes/metrics.py
+
+# Import FastAPI tools for routing, dependencies and errors
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
+
+from dotenv import load_dotenv  # Used to load environment variables from a .env file
+import hmac  # Constant-time comparison of the scrape token
+import os  # Provides access to environment variables
+
+# Import the metrics renderer
+from app.utils.metrics import render_metrics
+
+# Import the shared authentication dependencies
+from app.auth.dependencies import get_current_admin, get_current_user, oauth2_scheme
+
+# Load environment variables from a .env file into the system environment
+load_dotenv()
+
+# Bearer token Prometheus may present instead of an admin's access token
+# Unset (default): only logged-in admins can read /metrics
+METRICS_SCRAPE_TOKEN = os.getenv("METRICS_SCRAPE_TOKEN", "")
+
+
+# Create a FastAPI router for the metrics scrape endpoint
+# Mounted without the "/api" prefix, where Prometheus expects it
+router = APIRouter(tags=["Metrics"])
+
+
+# Dependency that lets through the configured scrape token or an admin's access token
+# Anything else gets the same 401 as the other protected routes
+async def require_metrics_access(request: Request, token: str = Depends(oauth2_scheme)):
+    if METRICS_SCRAPE_TOKEN and hmac.compare_digest(token.encode(), METRICS_SCRAPE_TOKEN.encode()):
+        return
+    await get_current_admin(request, await get_current_user(request, token))
+
+
+# ----------------- ROUTES -----------------
+
+# GET /metrics
+# Per-route latency histograms, SQL statements and DB time per request,
+# request counts by status code and in-flight requests, in Prometheus text format
+# Requires an admin token, or METRICS_SCRAPE_TOKEN as a bearer token (Prometheus "authorization" setting)
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(_: None = Depends(require_metrics_access)):
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
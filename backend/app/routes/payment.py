@@ -1,93 +1,173 @@
 # backend/app/routes/payment.py
 
 # Import FastAPI tools for routing, dependencies, exceptions, and query parameters
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, status, Query
 
-# Import SQLAlchemy session for DB operations
-from sqlalchemy.orm import Session
+# Import AsyncSession for non-blocking DB operations and select to build queries
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
 
 # For typing optional query parameters and list responses
-from typing import List, Optional
+from typing import Optional
 
 # To handle date/time query filters
 from datetime import datetime
 
-# Import DB session creator
-from app.database import get_db
+# Import the async DB session dependency
+from app.database import get_async_db
 
 # Import Payment ORM model
 from app.models.payment import Payment
 
 # Import Pydantic schemas for Payment creation and output
-from app.schemas.payment import PaymentCreate, PaymentOut
+from app.schemas.payment import PaymentCreate, PaymentOut, PaymentPage
 
-# Import JWT verification function
-from app.auth.jwt_handler import verify_access_token
+# Import cursor helpers shared by paginated list endpoints
+from app.utils.pagination import keyset_page, clamp_limit
 
-# OAuth2 helper to extract token from requests
-from fastapi.security import OAuth2PasswordBearer
+# Import the column-tuple + orjson fast path for list responses
+from app.utils.fast_json import parse_fields, field_columns, rows_to_dicts, fast_response
+
+# Import dashboard rollup and member lifetime counter maintenance
+from app.utils.summary import record_payment
+from app.utils.member_totals import record_member_payments
+
+# Import the plan catalog, which plan_type values are checked against
+from app.utils.plan_catalog import require_plan
+
+# Import the streaming CSV/NDJSON export helper
+from app.utils.export import export_response
+
+# Import the shared authentication dependency
+from app.auth.dependencies import get_current_user
+
+# Import the change counter helper
+from app.utils.versions import bump_version
 
 
 # Create API router with prefix and tag
 router = APIRouter(prefix="/payments", tags=["Payments"])
 
-# OAuth2PasswordBearer instance to extract JWT token from Authorization header
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")
 
+# ----------------- ROUTES -----------------
 
-# Dependency to verify JWT token and authenticate user
-def get_current_user(token: str = Depends(oauth2_scheme)):
-    payload = verify_access_token(token)  # Decode and verify token
-    if not payload:
-        # Raise 401 if token invalid or expired
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
-    return payload  # Return token payload if valid
 
+# Columns payment pages are ordered by, newest first (the id breaks ties between equal dates)
+PAYMENT_SORT_KEYS = (Payment.date, Payment.id)
 
-# ----------------- ROUTES -----------------
+
+# Add the optional filters shared by the list and export endpoints
+def apply_payment_filters(query, member_id, start_date, end_date, method=None, plan_type=None):
+    if member_id:
+        query = query.where(Payment.member_id == member_id)
+    if start_date:
+        query = query.where(Payment.date >= start_date)
+    if end_date:
+        query = query.where(Payment.date <= end_date)
+    if method:
+        query = query.where(Payment.method == method)
+    if plan_type:
+        query = query.where(Payment.plan_type == plan_type)
+    return query
 
 
 # GET /payments
-# Retrieve list of payments, optionally filtered by member_id and date range
-@router.get("/", response_model=List[PaymentOut])
-def get_payments(
+# Retrieve one page of payments, newest first, optionally filtered by member, date range, method and plan
+# Pages are keyed on (date, id) descending; pass next_cursor back as `cursor` for the next page
+# Pass `fields` (e.g. id,member_id,amount,date) to select and return only those columns
+@router.get("/", response_model=PaymentPage)
+async def get_payments(
     member_id: Optional[int] = Query(None),      # Filter by member ID (optional)
     start_date: Optional[datetime] = Query(None),# Filter payments from this date (optional)
     end_date: Optional[datetime] = Query(None),  # Filter payments until this date (optional)
-    db: Session = Depends(get_db),                # DB session dependency
+    method: Optional[str] = Query(None),         # Filter by payment method (optional)
+    plan_type: Optional[str] = Query(None),      # Filter by plan type (optional)
+    cursor: Optional[str] = Query(None),         # Opaque cursor from the previous page
+    limit: Optional[int] = Query(None, ge=1),    # Page size, capped at PAGE_SIZE_MAX
+    include_total: bool = Query(False),          # Also count all matching payments
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,member_id,amount,date; only these keys are present in each item (all fields when omitted)"),
+    db: AsyncSession = Depends(get_async_db),     # DB session dependency
     _: dict = Depends(get_current_user)            # Authentication dependency
 ):
-    query = db.query(Payment)  # Start query on Payment table
+    limit = clamp_limit(limit)
+    names = parse_fields(fields, PaymentOut)
+    columns = field_columns(Payment, names, PAYMENT_SORT_KEYS)
+
+    # The total ignores the cursor and rides along as a scalar subquery in the same statement
+    if include_total:
+        total_query = apply_payment_filters(
+            select(func.count(Payment.id)), member_id, start_date, end_date, method, plan_type
+        )
+        columns.append(total_query.scalar_subquery().label("total"))
+
+    query = select(*columns)  # Start query on Payment table
 
     # Apply filters if query params are provided
-    if member_id:
-        query = query.filter(Payment.member_id == member_id)
-    if start_date:
-        query = query.filter(Payment.date >= start_date)
-    if end_date:
-        query = query.filter(Payment.date <= end_date)
+    query = apply_payment_filters(query, member_id, start_date, end_date, method, plan_type)
+
+    # Fetch the page that follows the cursor, ordered by date descending (most recent first)
+    rows, next_cursor = await keyset_page(
+        db, query, PAYMENT_SORT_KEYS, "date", cursor, limit, descending=True, entities=False
+    )
+
+    total = None
+    if include_total:
+        # An empty page has no row to carry the subquery, so count separately
+        total = rows[0].total if rows else await db.scalar(total_query)
 
-    # Return results ordered by date descending (most recent first)
-    return query.order_by(Payment.date.desc()).all()
+    # Encoded directly with orjson; the payload matches PaymentPage (the total column is left out)
+    return fast_response({"items": rows_to_dicts(rows, names), "next_cursor": next_cursor, "total": total})
+
+
+# GET /payments/export
+# Stream payments as CSV or NDJSON (same filters as GET /payments), optionally gzip-compressed
+# Rows are read through a server-side cursor, so memory use does not grow with the table
+@router.get("/export")
+async def export_payments(
+    member_id: Optional[int] = Query(None),      # Filter by member ID (optional)
+    start_date: Optional[datetime] = Query(None),# Filter payments from this date (optional)
+    end_date: Optional[datetime] = Query(None),  # Filter payments until this date (optional)
+    method: Optional[str] = Query(None),         # Filter by payment method (optional)
+    plan_type: Optional[str] = Query(None),      # Filter by plan type (optional)
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),  # Output format
+    gzip: bool = Query(False),                   # Compress the stream on the fly
+    _: dict = Depends(get_current_user)            # Authentication dependency
+):
+    stmt = select(*Payment.__table__.columns)
+    stmt = apply_payment_filters(stmt, member_id, start_date, end_date, method, plan_type)
+    stmt = stmt.order_by(Payment.date.desc(), Payment.id.desc())
+    return export_response(stmt, format, "payments", gzip)
 
 
 # POST /payments
 # Create a new payment record
+# plan_type must name an existing plan (400 otherwise)
 @router.post("/", response_model=PaymentOut, status_code=status.HTTP_201_CREATED)
-def create_payment(
+async def create_payment(
     payment: PaymentCreate,        # Payment data from request body
-    db: Session = Depends(get_db),  # DB session
+    db: AsyncSession = Depends(get_async_db),  # DB session
     _: dict = Depends(get_current_user)  # Authentication
 ):
+    await db.run_sync(require_plan, payment.plan_type)
+
+    # Add the amount to dashboard_summary in the same transaction
+    await db.run_sync(record_payment, payment.amount)
+
     # Create Payment object from input data
-    new_payment = Payment(**payment.dict())
+    new_payment = Payment(**payment.dict(), date=datetime.now())
+
+    # Add it to the member's total_paid, payment_count and last_payment_at
+    await db.run_sync(record_member_payments, [
+        {"member_id": payment.member_id, "amount": payment.amount, "paid_at": new_payment.date}
+    ])
 
     # Add to DB session and commit transaction
     db.add(new_payment)
-    db.commit()
+    await db.run_sync(bump_version, "payments")
+    await db.commit()
 
     # Refresh the instance to get any DB-generated fields (like ID)
-    db.refresh(new_payment)
+    await db.refresh(new_payment)
 
     # Return the newly created payment object
     return new_payment
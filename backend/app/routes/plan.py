@@ -1,7 +1,7 @@
 # backend/app/routes/plan.py
 
 # Import FastAPI tools for creating routes, handling dependencies, exceptions, and HTTP status codes
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 # Import Session for DB operations using SQLAlchemy ORM
 from sqlalchemy.orm import Session
@@ -18,41 +18,41 @@ from app.models.plan import Plan
 # Import Pydantic schemas for Plan creation, update, and output validation
 from app.schemas.plan import PlanCreate, PlanUpdate, PlanOut
 
-# Import JWT verification function for authentication
-from app.auth.jwt_handler import verify_access_token
+# Import the shared authentication dependency
+from app.auth.dependencies import get_current_user
 
-# Import OAuth2PasswordBearer to extract JWT token from requests
-from fastapi.security import OAuth2PasswordBearer
+# Import the in-memory plan catalog and the change counter helper
+from app.utils.plan_catalog import PLANS_VERSION, get_plan_catalog, invalidate_plan_catalog
+from app.utils.versions import bump_version
+
+# Import conditional GET helpers
+from app.utils.etag import make_etag, conditional
 
 
 # Create API router with prefix /plans and tag "Plans"
 router = APIRouter(prefix="/plans", tags=["Plans"])
 
-# OAuth2PasswordBearer instance to handle token extraction from Authorization header
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")
-
-
-# Dependency function to verify JWT token and authenticate the user
-def get_current_user(token: str = Depends(oauth2_scheme)):
-    payload = verify_access_token(token)  # Decode token to get payload
-    if not payload:
-        # Raise 401 Unauthorized if token is invalid or expired
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-    return payload  # Return decoded token payload if valid
-
 
 # ----------------- ROUTES -----------------
 
 
 # GET /plans
-# Returns a list of all plans in the database
+# Returns a list of all plans, served from the in-memory plan catalog
+# Answers 304 Not Modified when If-None-Match carries the catalog's current ETag
 @router.get("/", response_model=List[PlanOut])
 def get_plans(
-    db: Session = Depends(get_db),           # Inject DB session
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),           # Inject DB session (only used when the catalog is stale)
     _: dict = Depends(get_current_user)      # Require authentication (token)
 ):
-    # Query all Plan records and return as list
-    return db.query(Plan).all()
+    catalog = get_plan_catalog(db)
+    not_modified = conditional(request, response, make_etag({PLANS_VERSION: catalog.version}))
+    if not_modified:
+        return not_modified
+
+    # Return every plan in the current catalog snapshot
+    return list(catalog.plans)
 
 
 # POST /plans
@@ -72,7 +72,9 @@ def create_plan(
     # Create new Plan object from validated data
     new_plan = Plan(**plan.dict())
     db.add(new_plan)   # Add new plan to DB session
+    bump_version(db, PLANS_VERSION)  # Tell every worker the catalog changed
     db.commit()        # Commit transaction to save to DB
+    invalidate_plan_catalog()  # Reload this worker's catalog on next use
     db.refresh(new_plan)  # Refresh instance to get DB-generated fields (like ID)
 
     # Return the newly created plan object
@@ -98,7 +100,9 @@ def update_plan(
     for field, value in plan_data.dict(exclude_unset=True).items():
         setattr(plan, field, value)  # Update field on Plan instance
 
+    bump_version(db, PLANS_VERSION)  # Tell every worker the catalog changed
     db.commit()       # Commit changes to DB
+    invalidate_plan_catalog()  # Reload this worker's catalog on next use
     db.refresh(plan)  # Refresh to get updated data from DB
 
     # Return updated plan
@@ -120,7 +124,9 @@ def delete_plan(
         raise HTTPException(status_code=404, detail="Plan not found")
 
     db.delete(plan)  # Delete plan record from DB session
+    bump_version(db, PLANS_VERSION)  # Tell every worker the catalog changed
     db.commit()      # Commit transaction to save changes
+    invalidate_plan_catalog()  # Reload this worker's catalog on next use
 
     # No return needed; 204 No Content means success with no body
     return
@@ -1,99 +1,278 @@
 # backend/app/routes/renewal.py
 
-# Import FastAPI tools for routing, dependencies, exceptions, and query parameters
+# Import FastAPI tools for routing, dependencies, and query parameters
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-# Import SQLAlchemy Session for DB access
-from sqlalchemy.orm import Session
+# Import AsyncSession for non-blocking DB access, and statement builders for bulk writes
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, insert
 
 # Import date/time utilities
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-# Import List typing for response type hinting
-from typing import List
+# Decimal for revenue totals
+from decimal import Decimal
 
-# Import function to create DB session
-from app.database import get_db
+# To read the calendar cache setting from environment variables
+import os
 
-# Import Member model (database table representation)
+# To log served renewal pages
+import logging
+
+# Import Optional typing for optional query parameters
+from typing import Optional
+
+# Import the async DB session dependency
+from app.database import get_async_db
+
+# Import Member and Payment models (database table representations)
 from app.models.member import Member
+from app.models.payment import Payment
+
+# Import Pydantic schemas for a page of members and the expiry calendar
+from app.schemas.member import MemberOut, MemberPage
+from app.schemas.renewal import ExpiryCalendar, BatchRenewalRequest, BatchRenewalResponse
+
+# Import dashboard rollup and member lifetime counter maintenance
+from app.utils.summary import record_member_changes, record_payments
+from app.utils.member_totals import record_member_payments
+
+# Import the in-memory plan catalog used to price renewals
+from app.utils.plan_catalog import get_plan_catalog
+
+# Import the change counter helper
+from app.utils.versions import bump_version
+
+# Import the renewal range-query engine
+from app.utils.filters import renewal_window, members_ending_between, expiry_calendar_query
+
+# Import cursor pagination helpers
+from app.utils.pagination import keyset_page, clamp_limit
 
-# Import Pydantic schema for Member output validation
-from app.schemas.member import MemberOut
+# Import the column-tuple + orjson fast path for list responses
+from app.utils.fast_json import parse_fields, field_columns, rows_to_dicts, fast_response
 
-# Import JWT verification function
-from app.auth.jwt_handler import verify_access_token
+# Import the shared authentication dependency
+from app.auth.dependencies import get_current_user
 
-# OAuth2 helper to extract token from Authorization header
-from fastapi.security import OAuth2PasswordBearer
 
+# Logger for renewal endpoints
+logger = logging.getLogger(__name__)
 
 # Create API router with prefix /renewals and tag "Renewals"
 router = APIRouter(prefix="/renewals", tags=["Renewals"])
 
-# OAuth2PasswordBearer instance to extract token from requests
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")
+# When enabled, each calendar (per days/bucket) is computed once per day and reused until midnight
+# Member changes made during the day then show up in the calendar the next day
+CALENDAR_CACHE_UNTIL_MIDNIGHT = os.getenv("CALENDAR_CACHE_UNTIL_MIDNIGHT", "false").lower() in ("1", "true", "yes")
 
+# Cached calendars keyed by (today, days, bucket)
+_calendar_cache = {}
 
-# Dependency to verify the JWT token and authenticate user
-def get_current_user(token: str = Depends(oauth2_scheme)):
-    payload = verify_access_token(token)  # Decode and verify the JWT token
-    if not payload:
-        # Raise 401 Unauthorized if token invalid or expired
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-    return payload  # Return token payload if valid
+# Largest number of members accepted in one batch renewal request
+RENEWAL_BATCH_MAX = int(os.getenv("RENEWAL_BATCH_MAX", 5000))
+
+
+# Shared implementation of every renewal endpoint
+# Resolves the window to an end_date range and returns one page ordered by (end_date, id)
+# Only the requested `fields` (plus the sort keys) are selected
+async def renewal_page(db: AsyncSession, kind: str, days: Optional[int], cursor: Optional[str], limit: Optional[int], order: str, fields: Optional[str] = None):
+    today = datetime.now().date()               # Get current date (no time)
+    first, last = renewal_window(kind, today, days)
+    names = parse_fields(fields, MemberOut)
+    keys = (Member.end_date, Member.id)
+
+    descending = order == "desc"
+    members, next_cursor = await keyset_page(
+        db,
+        members_ending_between(first, last, field_columns(Member, names, keys)),
+        keys,
+        f"renewals:{order}",
+        cursor,
+        clamp_limit(limit),
+        descending=descending,
+        entities=False,
+    )
+    # Renewal lists are polled often, so only a sample of pages is logged
+    logger.info(
+        "Renewal page served",
+        extra={"event": "renewals.page", "kind": kind, "count": len(members), "sample": 0.1},
+    )
+
+    # Encoded directly with orjson; the payload matches MemberPage
+    return fast_response({"items": rows_to_dicts(members, names), "next_cursor": next_cursor})
 
 
 # GET /renewals/7days
-# Fetch members whose membership end date is within the next 'days' days (default 7)
-@router.get("/7days", response_model=List[MemberOut])
-def get_upcoming_renewals(
+# Fetch members whose membership end date is between today and 'days' days ahead (default 7)
+# Already expired memberships are not included (see /renewals/exp)
+@router.get("/7days", response_model=MemberPage)
+async def get_upcoming_renewals(
     days: int = Query(7, ge=1, le=30),           # Query param 'days' with default=7, min=1, max=30
-    db: Session = Depends(get_db),                # Inject DB session
+    cursor: Optional[str] = Query(None),         # Opaque cursor from the previous page
+    limit: Optional[int] = Query(None, ge=1),    # Page size, capped at PAGE_SIZE_MAX
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,phone,end_date; only these keys are present in each item (all fields when omitted)"),
+    order: str = Query("asc", pattern="^(asc|desc)$"),  # Sort by end_date, soonest first by default
+    db: AsyncSession = Depends(get_async_db),     # Inject DB session
     _: dict = Depends(get_current_user)           # Require authenticated user
 ):
-    today = datetime.now().date()               # Get current UTC date (no time)
-    upcoming_date = today + timedelta(days=days)   # Calculate date 'days' ahead
-
-    # Query members whose end_date is between today and upcoming_date (inclusive)
-    members = db.query(Member).filter(
-        Member.end_date <= upcoming_date
-    ).all()
-    print(f"Found {len(members)} members with upcoming renewals (within {days} days)")
+    return await renewal_page(db, "upcoming", days, cursor, limit, order, fields)
 
-    # Return the list of matching members
-    return members
 
-@router.get("/exp", response_model=List[MemberOut])
-def exp_membership(
-    days: int = Query(7, ge=1, le=30),           # Query param 'days' with default=7, min=1, max=30
-    db: Session = Depends(get_db),                # Inject DB session
+# GET /renewals/exp
+# Fetch members whose membership has already ended, most recently expired first
+# Pass 'days' to only include memberships that ended within the last 'days' days
+@router.get("/exp", response_model=MemberPage)
+async def exp_membership(
+    days: Optional[int] = Query(None, ge=1),     # Optional look-back window in days
+    cursor: Optional[str] = Query(None),         # Opaque cursor from the previous page
+    limit: Optional[int] = Query(None, ge=1),    # Page size, capped at PAGE_SIZE_MAX
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,phone,end_date; only these keys are present in each item (all fields when omitted)"),
+    order: str = Query("desc", pattern="^(asc|desc)$"), # Sort by end_date, most recent first by default
+    db: AsyncSession = Depends(get_async_db),     # Inject DB session
     _: dict = Depends(get_current_user)           # Require authenticated user
 ):
-    today = datetime.now().date()               # Get current UTC date (no time)
+    return await renewal_page(db, "expired", days, cursor, limit, order, fields)
 
-    # Query members whose end_date is between today and upcoming_date (inclusive)
-    members = db.query(Member).filter(
-        Member.end_date < today
-    ).all()
-    print(f"Found {len(members)} members with upcoming renewals (within {days} days)")
 
-    # Return the list of matching members
-    return members
-    
 # GET /renewals/today
 # Fetch members whose membership end date is exactly today
-@router.get("/today", response_model=List[MemberOut])
-def get_today_renewals(
-    db: Session = Depends(get_db),                # Inject DB session
+@router.get("/today", response_model=MemberPage)
+async def get_today_renewals(
+    cursor: Optional[str] = Query(None),         # Opaque cursor from the previous page
+    limit: Optional[int] = Query(None, ge=1),    # Page size, capped at PAGE_SIZE_MAX
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,phone,end_date; only these keys are present in each item (all fields when omitted)"),
+    db: AsyncSession = Depends(get_async_db),     # Inject DB session
+    _: dict = Depends(get_current_user)           # Require authenticated user
+):
+    return await renewal_page(db, "today", None, cursor, limit, "asc", fields)
+
+
+# Fold per-day histogram rows into day or week buckets covering [first, last], including empty ones
+def build_calendar(rows, first: date, last: date, bucket: str):
+    by_day = {end_date: (expiring, Decimal(revenue or 0), unpriced) for end_date, expiring, revenue, unpriced in rows}
+    step = 7 if bucket == "week" else 1
+
+    buckets = []
+    start = first
+    while start <= last:
+        end = min(start + timedelta(days=step - 1), last)
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        hits = [by_day[d] for d in days if d in by_day]
+        buckets.append({
+            "start": start,
+            "end": end,
+            "expiring": sum(h[0] for h in hits),
+            "expected_revenue": sum((h[1] for h in hits), Decimal(0)),
+            "unpriced": sum(h[2] for h in hits),
+        })
+        start = end + timedelta(days=1)
+
+    return {
+        "start": first,
+        "end": last,
+        "bucket": bucket,
+        "total_expiring": sum(b["expiring"] for b in buckets),
+        "total_expected_revenue": sum((b["expected_revenue"] for b in buckets), Decimal(0)),
+        "buckets": buckets,
+    }
+
+
+# GET /renewals/calendar
+# Number of memberships expiring on each day (or week) of the next 'days' days,
+# with the expected renewal revenue from each member's plan price
+@router.get("/calendar", response_model=ExpiryCalendar)
+async def get_expiry_calendar(
+    days: int = Query(90, ge=1, le=366),         # How many days ahead to cover, starting today
+    bucket: str = Query("day", pattern="^(day|week)$"),  # Group per day or per 7-day week
+    db: AsyncSession = Depends(get_async_db),     # Inject DB session
+    _: dict = Depends(get_current_user)           # Require authenticated user
+):
+    today = datetime.now().date()
+    key = (today, days, bucket)
+    if CALENDAR_CACHE_UNTIL_MIDNIGHT and key in _calendar_cache:
+        return _calendar_cache[key]
+
+    last = today + timedelta(days=days - 1)
+    rows = (await db.execute(expiry_calendar_query(today, last))).all()
+    calendar = build_calendar(rows, today, last, bucket)
+
+    if CALENDAR_CACHE_UNTIL_MIDNIGHT:
+        # Drop entries from previous days, then remember today's result
+        for old in [k for k in _calendar_cache if k[0] != today]:
+            del _calendar_cache[old]
+        _calendar_cache[key] = calendar
+
+    return calendar
+
+
+# POST /renewals/batch
+# Renew many members in one transaction:
+# - each member's end_date is extended by the plan's duration, counted from the current
+#   end_date, or from today if the membership has already ended (start_date becomes today)
+# - a Payment is recorded for each member at the plan's price (or the given amount)
+# All members and plans must exist; otherwise nothing is written
+@router.post("/batch", response_model=BatchRenewalResponse)
+async def batch_renew(
+    request: BatchRenewalRequest,                 # Members and plans to renew
+    db: AsyncSession = Depends(get_async_db),     # Inject DB session
     _: dict = Depends(get_current_user)           # Require authenticated user
 ):
-    today = datetime.now().date()              # Get current UTC date (no time)
+    items = request.items
+    if not items:
+        return {"renewed": 0, "results": []}
+    if len(items) > RENEWAL_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {RENEWAL_BATCH_MAX} renewals per request")
+
+    member_ids = [item.member_id for item in items]
+    if len(set(member_ids)) != len(member_ids):
+        raise HTTPException(status_code=400, detail="Each member can only be renewed once per request")
+
+    # Plans come from the in-memory catalog; one query loads every member in the batch
+    catalog = await db.run_sync(get_plan_catalog)
+    plan_names = {item.plan_type for item in items}
+    plans = {name: catalog.by_name(name) for name in plan_names if catalog.by_name(name) is not None}
+    members = {
+        member.id: member
+        for member in (await db.execute(select(Member.id, Member.start_date, Member.end_date).where(Member.id.in_(member_ids)))).all()
+    }
+
+    missing_plans = sorted(plan_names - plans.keys())
+    if missing_plans:
+        raise HTTPException(status_code=404, detail=f"Plan not found: {', '.join(missing_plans)}")
+    missing_members = [member_id for member_id in member_ids if member_id not in members]
+    if missing_members:
+        raise HTTPException(status_code=404, detail=f"Member not found: {', '.join(map(str, missing_members))}")
+
+    today = datetime.now().date()
+    member_rows, payment_rows, changes, results = [], [], [], []
+    for item in items:
+        member = members[item.member_id]
+        plan = plans[item.plan_type]
+
+        lapsed = member.end_date < today
+        start_date = today if lapsed else member.start_date
+        end_date = (today if lapsed else member.end_date) + timedelta(days=plan.duration)
+        amount = item.amount if item.amount is not None else plan.price
+
+        member_rows.append({"id": member.id, "start_date": start_date, "end_date": end_date, "plan_type": plan.name})
+        payment_rows.append({
+            "member_id": member.id, "plan_type": plan.name, "amount": amount,
+            "method": item.method, "notes": item.notes, "date": datetime.now(),
+        })
+        changes.append((member.end_date, end_date))
+        results.append({"member_id": member.id, "plan_type": plan.name, "start_date": start_date, "end_date": end_date, "amount": amount})
 
-    # Query members whose end_date is exactly today
-    members = db.query(Member).filter(
-        Member.end_date == today
-    ).all()
+    # Keep dashboard_summary in step, then write everything with two bulk statements
+    await db.run_sync(record_member_changes, changes)
+    await db.run_sync(record_payments, [row["amount"] for row in payment_rows])
+    await db.execute(update(Member), member_rows)
+    await db.execute(insert(Payment), payment_rows)
+    await db.run_sync(record_member_payments, [
+        {"member_id": row["member_id"], "amount": row["amount"], "paid_at": row["date"]} for row in payment_rows
+    ])
+    await db.run_sync(bump_version, "members")
+    await db.run_sync(bump_version, "payments")
+    await db.commit()
 
-    # Return the list of matching members
-    return members
+    return {"renewed": len(results), "results": results}
@@ -2,8 +2,12 @@
 
 # Import BaseModel for defining schemas, EmailStr for validating email format
 from pydantic import BaseModel, EmailStr
-from typing import Optional  # For optional fields that may be None
-from datetime import date    # For date fields (start_date, end_date)
+from typing import List, Optional  # For optional fields and lists of members
+from datetime import date, datetime  # For date fields (start_date, end_date) and timestamps
+from decimal import Decimal  # For money totals
+
+# Payments are embedded in the member profile
+from app.schemas.payment import PaymentOut
 
 # Schema used when creating a new member (input data)
 class MemberCreate(BaseModel):
@@ -38,3 +42,50 @@ class MemberOut(BaseModel):
 
     class Config:
         orm_mode = True            # Enables compatibility with ORM models like SQLAlchemy
+
+# Schema for a member in list responses that support ?fields= (sparse fieldsets)
+# Every field is optional: only the requested fields are present, all of them without ?fields=
+class MemberOutPartial(BaseModel):
+    """A member with only the fields requested with ?fields= (every field when it is omitted)."""
+    id: Optional[int] = None
+    name: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    plan_type: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    notes: Optional[str] = None
+
+# Schema used for one page of the member list (cursor pagination)
+class MemberPage(BaseModel):
+    items: List[MemberOutPartial]      # Members on this page (only the requested fields)
+    next_cursor: Optional[str] = None  # Opaque cursor for the next page, None on the last page
+    total: Optional[int] = None        # Total number of members, only when include_total=true
+
+# Schema used for a member profile: the member, lifetime counters and payment history
+class MemberDetail(MemberOut):
+    total_paid: Decimal                # Sum of all the member's payments
+    payment_count: int                 # Number of payments made
+    last_payment_at: Optional[datetime]  # Most recent payment, None if the member never paid
+    payments: List[PaymentOut]         # Payment history, newest first
+
+# Schema returned by GET /members?ids=...
+class MemberDetailList(BaseModel):
+    items: List[MemberDetail]          # Requested members that exist, in the requested order
+
+# Schema returned by member search (best match first)
+class MemberSearchResults(BaseModel):
+    items: List[MemberOutPartial]      # Matching members, at most `limit` (only the requested fields)
+
+# Schema for one rejected row of a bulk import
+class MemberImportError(BaseModel):
+    row: int                           # 1-based data row number (the CSV header is not counted)
+    errors: List[str]                  # Validation or parse messages for the row
+
+# Schema returned by the bulk import endpoint
+class MemberImportReport(BaseModel):
+    dry_run: bool                      # True if rows were only validated, not inserted
+    rows: int                          # Data rows read from the upload
+    inserted: int                      # Rows inserted (0 on a dry run)
+    failed: int                        # Rows rejected
+    errors: List[MemberImportError]    # Per-row errors (capped at IMPORT_MAX_ERRORS)
@@ -2,7 +2,7 @@
 
 # Import BaseModel for schema definitions
 from pydantic import BaseModel
-from typing import Optional  # For optional fields (nullable)
+from typing import List, Optional  # For optional fields (nullable) and lists
 from datetime import datetime  # For date and time fields
 from decimal import Decimal    # For precise decimal values (e.g., money amounts)
 
@@ -26,3 +26,21 @@ class PaymentOut(BaseModel):
 
     class Config:
         orm_mode = True         # Allows direct conversion from ORM model instances (e.g., SQLAlchemy)
+
+# Schema for a payment in list responses that support ?fields= (sparse fieldsets)
+# Every field is optional: only the requested fields are present, all of them without ?fields=
+class PaymentOutPartial(BaseModel):
+    """A payment with only the fields requested with ?fields= (every field when it is omitted)."""
+    id: Optional[int] = None
+    member_id: Optional[int] = None
+    plan_type: Optional[str] = None
+    amount: Optional[Decimal] = None
+    method: Optional[str] = None
+    date: Optional[datetime] = None
+    notes: Optional[str] = None
+
+# Schema used for one page of the payment list (cursor pagination)
+class PaymentPage(BaseModel):
+    items: List[PaymentOutPartial]      # Payments on this page, newest first (only the requested fields)
+    next_cursor: Optional[str] = None   # Opaque cursor for the next page, None on the last page
+    total: Optional[int] = None         # Matching payments across all pages, only when include_total=true
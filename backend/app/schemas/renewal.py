@@ -0,0 +1,49 @@
+# backend/app/schemas/renewal.py
+
+# Import BaseModel for schema definitions
+from pydantic import BaseModel
+from typing import List, Optional  # For lists and optional fields
+from datetime import date      # For bucket start/end dates
+from decimal import Decimal    # For expected revenue amounts
+
+# Schema for one day or week of the expiry calendar (output)
+class ExpiryBucket(BaseModel):
+    start: date                   # First day of the bucket
+    end: date                     # Last day of the bucket (same as start for daily buckets)
+    expiring: int                 # Memberships whose end_date falls in the bucket
+    expected_revenue: Decimal     # Sum of the current price of each expiring member's plan
+    unpriced: int                 # Expiring members whose plan_type matches no plan
+
+# Schema for the expiry calendar response (output)
+class ExpiryCalendar(BaseModel):
+    start: date                   # First day covered (today)
+    end: date                     # Last day covered
+    bucket: str                   # "day" or "week"
+    total_expiring: int           # Sum of expiring over all buckets
+    total_expected_revenue: Decimal  # Sum of expected_revenue over all buckets
+    buckets: List[ExpiryBucket]   # One entry per day/week, including empty ones
+
+# Schema for renewing one member (input)
+class RenewalItem(BaseModel):
+    member_id: int                       # Member to renew
+    plan_type: str                       # Name of the plan to renew on (looked up in the plans table)
+    method: str                          # Payment method, e.g., Cash, UPI, Card
+    amount: Optional[Decimal] = None     # Amount paid; defaults to the plan's price
+    notes: Optional[str] = None          # Optional notes stored on the payment
+
+# Schema for a batch renewal request (input)
+class BatchRenewalRequest(BaseModel):
+    items: List[RenewalItem]             # Members to renew, each at most once
+
+# Schema for the outcome of one renewal (output)
+class RenewalResult(BaseModel):
+    member_id: int                       # Renewed member
+    plan_type: str                       # Plan the member is now on
+    start_date: date                     # Membership start date after renewal
+    end_date: date                       # New membership end date
+    amount: Decimal                      # Amount recorded on the payment
+
+# Schema for the batch renewal response (output)
+class BatchRenewalResponse(BaseModel):
+    renewed: int                         # Number of members renewed
+    results: List[RenewalResult]         # One entry per renewed member
@@ -0,0 +1,198 @@
+# backend/app/utils/compression.py
+#
+# Response compression middleware (gzip, and Brotli when the optional
+# "brotli" package is installed).
+#
+# - The encoding is negotiated from Accept-Encoding (q-values honoured, br preferred).
+# - Complete bodies smaller than COMPRESSION_MIN_SIZE are sent as-is.
+# - Streaming bodies are compressed chunk by chunk and flushed after every
+#   chunk, so clients keep receiving data while the stream is produced.
+# - Responses that already carry Content-Encoding (e.g. exports with gzip=true),
+#   non-text media types, 204/304 responses and HEAD requests are left alone.
+# - Routes decorated with @no_compression are never compressed.
+
+import os  # For reading settings from environment variables
+import zlib  # gzip encoder
+from typing import Callable, List, Optional  # For type hints
+
+from dotenv import load_dotenv  # To load environment variables from a .env file
+from starlette.datastructures import Headers, MutableHeaders  # Request / response header helpers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send  # ASGI types
+
+try:  # Brotli is optional: without it only gzip is offered
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Load environment variables from the .env file into the system environment
+load_dotenv()
+
+# Turn compression off entirely (e.g. when a reverse proxy already compresses)
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Complete bodies smaller than this many bytes are not worth compressing
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+
+# zlib level for gzip (1 = fastest, 9 = smallest)
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+
+# Brotli quality (0-11); low values are cheap enough for dynamic responses
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4))
+
+# Media types worth compressing (everything else, e.g. images, is passed through)
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/javascript", "application/xml")
+
+# Attribute set on endpoints by @no_compression
+_OPT_OUT = "_no_compression"
+
+
+def no_compression(endpoint: Callable) -> Callable:
+    # Route decorator: never compress this endpoint's responses
+    setattr(endpoint, _OPT_OUT, True)
+    return endpoint
+
+
+class GzipEncoder:
+    # Incremental gzip stream (wbits=31 writes the gzip header and trailer)
+    name = "gzip"
+
+    def __init__(self, level: int = COMPRESSION_GZIP_LEVEL):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        # Compress and flush, so the bytes can be sent right away
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class BrotliEncoder:
+    # Incremental Brotli stream
+    name = "br"
+
+    def __init__(self, quality: int = COMPRESSION_BROTLI_QUALITY):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+# Encodings this server can produce, in order of preference
+ENCODERS = {"br": BrotliEncoder, "gzip": GzipEncoder} if brotli is not None else {"gzip": GzipEncoder}
+
+
+def choose_encoding(accept_encoding: str, available: List[str]) -> Optional[str]:
+    """
+    Pick the encoding to use for a request's Accept-Encoding header.
+
+    Args:
+        accept_encoding (str): Raw Accept-Encoding header (e.g. "gzip, deflate, br;q=0.9").
+        available (List[str]): Encodings the server can produce, most preferred first.
+
+    Returns:
+        Optional[str]: Chosen encoding, or None to send the body uncompressed.
+    """
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for name in available:
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing response bodies on the fly.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not COMPRESSION_ENABLED or scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), list(ENCODERS))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        encoder = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, encoder, passthrough
+
+            if message["type"] == "http.response.start":
+                # Hold the headers back until the first body chunk shows what to do
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is None:
+                headers = MutableHeaders(raw=list(start["headers"]))
+                start["headers"] = headers.raw
+                if not self._should_compress(scope, start["status"], headers, body, more_body):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                encoder = ENCODERS[encoding]()
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    # The compressed length is unknown until the stream ends
+                    if "content-length" in headers:
+                        del headers["Content-Length"]
+                    data = encoder.chunk(body)
+                else:
+                    data = encoder.finish(body)
+                    headers["Content-Length"] = str(len(data))
+                await send(start)
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+                return
+
+            data = encoder.chunk(body) if more_body else encoder.finish(body)
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _should_compress(self, scope: Scope, status: int, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        if status < 200 or status in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        if getattr(scope.get("endpoint"), _OPT_OUT, False):
+            return False
+        if not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES):
+            return False
+        # A complete body is compressed only above the threshold; a stream always is
+        return more_body or len(body) >= self.minimum_size
@@ -0,0 +1,69 @@
+# backend/app/utils/etag.py
+
+import hashlib  # To fold versions and request parameters into a short tag
+from typing import Dict, Iterable, Optional  # For type hints
+
+from fastapi import Request, Response  # To read If-None-Match and answer 304
+from sqlalchemy.orm import Session  # To work with database sessions
+
+from app.utils.versions import get_versions  # Per-table change counters
+
+# Browsers keep the response but revalidate it with If-None-Match before every reuse
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(versions: Dict[str, int], *extra) -> str:
+    """
+    Build a weak ETag from table versions and anything else the payload depends on.
+
+    Args:
+        versions (Dict[str, int]): Change counter of every table the payload is built from.
+        *extra: Other inputs of the payload (query parameters, the current day, ...).
+
+    Returns:
+        str: Weak ETag such as W/"3f1c...".
+    """
+    parts = [f"{name}={versions[name]}" for name in sorted(versions)] + [repr(value) for value in extra]
+    digest = hashlib.sha1("|".join(parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def table_etag(db: Session, names: Iterable[str], *extra) -> str:
+    # ETag for a payload built from the named tables (one small primary-key query)
+    # Compute it before reading the payload, so a concurrent write can only make the tag older
+    return make_etag(get_versions(db, names), *extra)
+
+
+def _matches(header: Optional[str], etag: str) -> bool:
+    # Weak comparison against every tag listed in If-None-Match
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def conditional(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Tag the response and short-circuit when the client already has this version.
+
+    Args:
+        request (Request): Incoming request, checked for If-None-Match.
+        response (Response): Response the route will return; receives the ETag header.
+        etag (str): Current ETag of the resource.
+
+    Returns:
+        Optional[Response]: An empty 304 response to return as-is, or None to build the payload.
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
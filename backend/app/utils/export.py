@@ -0,0 +1,86 @@
+# backend/app/utils/export.py
+
+import csv  # For writing CSV rows
+import io  # In-memory text buffer reused for every batch
+import json  # For writing NDJSON rows
+import os  # For reading the batch size from environment variables
+import zlib  # For gzip-compressing the stream on the fly
+from typing import AsyncIterator, List  # For type hints
+
+from dotenv import load_dotenv  # To load environment variables from a .env file
+from fastapi.responses import StreamingResponse  # Sends the body as it is produced
+from sqlalchemy import Select  # Statement to export
+
+from app.database import AsyncSessionLocal  # The export opens its own session for the stream's lifetime
+
+# Load environment variables from the .env file into the system environment
+load_dotenv()
+
+# Rows fetched from the server-side cursor per round-trip
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 2000))
+
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+def _json_default(value):
+    # Dates as ISO strings, Decimal amounts as exact strings
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+async def _encode_rows(stmt: Select, columns: List[str], fmt: str) -> AsyncIterator[bytes]:
+    # Stream the statement's rows through a server-side cursor, one batch at a time
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if fmt == "csv":
+        writer.writerow(columns)
+
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for batch in result.partitions():
+            if fmt == "csv":
+                writer.writerows(batch)
+            else:
+                for row in batch:
+                    buffer.write(json.dumps(dict(zip(columns, row)), default=_json_default))
+                    buffer.write("\n")
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    # Compress each batch as it is produced (wbits=31 writes a gzip header)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_response(stmt: Select, fmt: str, filename: str, gzip: bool = False) -> StreamingResponse:
+    """
+    Build a StreamingResponse that writes the rows of `stmt` as CSV or NDJSON.
+
+    Memory stays flat regardless of the row count: rows are fetched EXPORT_BATCH_SIZE
+    at a time and written out before the next batch is read.
+
+    Args:
+        stmt (Select): Column select to export; its column names become the CSV header / JSON keys.
+        fmt (str): "csv" or "ndjson".
+        filename (str): Base name for the Content-Disposition header (without extension).
+        gzip (bool): Compress the stream with gzip (sent as Content-Encoding: gzip).
+
+    Returns:
+        StreamingResponse: Response streaming the export.
+    """
+    columns = [column.key for column in stmt.selected_columns]
+    body = _encode_rows(stmt, columns, fmt)
+    headers = {"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'}
+    if gzip:
+        body = _gzip(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=MEDIA_TYPES[fmt], headers=headers)
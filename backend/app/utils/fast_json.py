@@ -0,0 +1,94 @@
+# backend/app/utils/fast_json.py
+#
+# Fast path for list endpoints.
+#
+# The default path loads ORM entities, validates each one into a Pydantic model
+# (orm_mode), dumps it to a dict and encodes the result with the json module.
+# List endpoints instead select plain column tuples, turn them into dicts and
+# encode them once with orjson. Routes keep their response_model, so the
+# OpenAPI schema is unchanged; returning a Response skips the per-row validation.
+#
+# List endpoints also accept ?fields=a,b,c (sparse fieldsets): only those
+# columns are selected and only those keys are returned for each row.
+
+from decimal import Decimal  # Money columns come back as Decimal
+from typing import Any, Dict, List, Optional, Sequence, Type  # For type hints
+
+import orjson  # Fast JSON encoder (handles date and datetime natively)
+from fastapi import HTTPException, Response, status  # To reject unknown fields and carry route headers
+from fastapi.responses import ORJSONResponse  # Base class using orjson
+from pydantic import BaseModel  # Output schemas the columns are taken from
+
+
+def _default(value: Any) -> Any:
+    # Decimal is encoded as a string, exactly like Pydantic does
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(ORJSONResponse):
+    # orjson response that also accepts Decimal values
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def schema_columns(model, schema: Type[BaseModel]) -> List:
+    # Table columns of `model` named like the fields of `schema`, in schema order
+    table = model.__table__
+    return [table.c[name] for name in schema.model_fields]
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> List[str]:
+    """
+    Validate a ?fields= value against the fields of an output schema.
+
+    Args:
+        fields (Optional[str]): Comma-separated field names, or None/empty for every field.
+        schema (Type[BaseModel]): Output schema of one list item (e.g. MemberOut).
+
+    Returns:
+        List[str]: Requested field names, in schema order.
+    """
+    allowed = list(schema.model_fields)
+    requested = {name.strip() for name in (fields or "").split(",") if name.strip()}
+    if not requested:
+        return allowed
+    unknown = sorted(requested.difference(allowed))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}",
+        )
+    return [name for name in allowed if name in requested]
+
+
+def field_columns(model, names: Sequence[str], keys: Sequence = ()) -> List:
+    # Columns for the requested fields, followed by any sort key the cursor needs but was not requested
+    table = model.__table__
+    columns = [table.c[name] for name in names]
+    return columns + [key for key in keys if key.key not in names]
+
+
+def rows_to_dicts(rows: Sequence, names: Sequence[str]) -> List[Dict[str, Any]]:
+    # Column tuples -> plain dicts keyed by the selected column names
+    # Trailing columns without a name (sort keys, totals) are left out
+    return [dict(zip(names, row)) for row in rows]
+
+
+def fast_response(content: Any, response: Optional[Response] = None, status_code: int = 200) -> FastJSONResponse:
+    """
+    Encode `content` with orjson, carrying over headers set on the route's sub-response.
+
+    Args:
+        content (Any): Payload made of dicts, lists, str, numbers, dates and Decimals.
+        response (Optional[Response]): The injected Response, if the route set headers on it (e.g. ETag).
+        status_code (int): HTTP status of the response.
+
+    Returns:
+        FastJSONResponse: Ready-to-send response.
+    """
+    headers = None
+    if response is not None:
+        headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
@@ -1,10 +1,62 @@
 # backend/app/utils/filters.py
 
+from sqlalchemy import Select, func, select  # To build the range queries
 from sqlalchemy.orm import Session  # To work with database sessions
-from datetime import datetime, timedelta  # For date calculations
-from typing import List  # For specifying return type as a list
+from datetime import date, datetime, timedelta  # For date calculations
+from typing import List, Optional, Tuple  # For type hints
 
 from app.models.member import Member  # Import the Member model to query members
+from app.models.plan import Plan  # Plan prices for expected renewal revenue
+
+# Renewal windows served by the renewal endpoints
+# Each maps (today, days) to an inclusive (first, last) end_date range; None means unbounded
+RENEWAL_WINDOWS = {
+    # Memberships ending between today and `days` from now
+    "upcoming": lambda today, days: (today, today + timedelta(days=days)),
+    # Memberships that already ended, optionally only within the last `days` days
+    "expired": lambda today, days: (today - timedelta(days=days) if days else None, today - timedelta(days=1)),
+    # Memberships ending today
+    "today": lambda today, days: (today, today),
+}
+
+
+def renewal_window(kind: str, today: date, days: Optional[int] = None) -> Tuple[Optional[date], Optional[date]]:
+    """
+    Resolve a named renewal window to an inclusive end_date range.
+
+    Args:
+        kind (str): One of the keys of RENEWAL_WINDOWS ("upcoming", "expired", "today").
+        today (date): Reference day.
+        days (Optional[int]): Window length in days, where the window uses one.
+
+    Returns:
+        Tuple[Optional[date], Optional[date]]: (first, last) end_date, None for an open bound.
+    """
+    return RENEWAL_WINDOWS[kind](today, days)
+
+
+def members_ending_between(first: Optional[date], last: Optional[date], columns: Optional[List] = None) -> Select:
+    """
+    Build a query for members whose end_date lies in [first, last].
+
+    Both bounds compare end_date directly, so the query is a range scan on
+    the members(end_date) index.
+
+    Args:
+        first (Optional[date]): Earliest end_date, or None for no lower bound.
+        last (Optional[date]): Latest end_date, or None for no upper bound.
+        columns (Optional[List]): Member columns to select instead of whole Member entities.
+
+    Returns:
+        Select: Select of Member rows (or of the given columns), without ordering.
+    """
+    query = select(*columns) if columns else select(Member)
+    if first is not None:
+        query = query.where(Member.end_date >= first)
+    if last is not None:
+        query = query.where(Member.end_date <= last)
+    return query
+
 
 def get_members_expiring_within_days(db: Session, days: int) -> List[Member]:
     """
@@ -20,15 +72,35 @@ def get_members_expiring_within_days(db: Session, days: int) -> List[Member]:
     
     # Get today's date in UTC (date only, without time)
     today = datetime.utcnow().date()
-    
-    # Calculate the end date of the range by adding `days` to today
-    end_range = today + timedelta(days=days)
-
-    # Query the Member table where:
-    # - membership end_date is greater than or equal to today (not expired yet)
-    # - membership end_date is less than or equal to end_range (within the window)
-    # Results are ordered by end_date ascending (soonest expiry first)
-    return db.query(Member).filter(
-        Member.end_date >= today,
-        Member.end_date <= end_range
-    ).order_by(Member.end_date.asc()).all()
+
+    # Members ending between today and `days` from now, soonest expiry first
+    query = members_ending_between(*renewal_window("upcoming", today, days))
+    return db.execute(query.order_by(Member.end_date.asc(), Member.id.asc())).scalars().all()
+
+
+def expiry_calendar_query(first: date, last: date) -> Select:
+    """
+    Build the per-day expiry histogram for end_date in [first, last].
+
+    One GROUP BY over the members(end_date) range, with each member's plan
+    price joined in by name to estimate renewal revenue.
+
+    Args:
+        first (date): First end_date to include.
+        last (date): Last end_date to include.
+
+    Returns:
+        Select: Rows of (end_date, expiring, expected_revenue, unpriced), ordered by end_date.
+    """
+    return (
+        select(
+            Member.end_date,
+            func.count(Member.id),
+            func.coalesce(func.sum(Plan.price), 0),
+            func.count(Member.id) - func.count(Plan.id),
+        )
+        .outerjoin(Plan, Plan.name == Member.plan_type)
+        .where(Member.end_date >= first, Member.end_date <= last)
+        .group_by(Member.end_date)
+        .order_by(Member.end_date)
+    )
@@ -0,0 +1,42 @@
+# backend/app/utils/histogram.py
+
+import threading  # Observations come from many threads and the event loop
+from bisect import bisect_left  # To find the bucket for a value
+from typing import Dict, Sequence  # For type hints
+
+# Default bucket upper bounds in milliseconds
+DEFAULT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Histogram:
+    """
+    Thread-safe fixed-bucket histogram.
+
+    Buckets are upper bounds; values above the last bound go into "+Inf".
+    Snapshots report cumulative counts per bucket, like Prometheus histograms.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        # Record one observation
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Dict[str, object]:
+        # Cumulative bucket counts, total count and sum at this moment
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = {}
+        running = 0
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], counts):
+            running += count
+            cumulative[bound] = running
+        return {"buckets": cumulative, "count": running, "sum": round(total, 3)}
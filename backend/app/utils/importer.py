@@ -0,0 +1,114 @@
+# backend/app/utils/importer.py
+
+import codecs  # For decoding the upload incrementally as UTF-8
+import csv  # For parsing CSV records
+import json  # For parsing NDJSON records
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Type  # For type hints
+
+from pydantic import BaseModel, ValidationError  # Rows are validated against a Pydantic schema
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split an async stream of bytes into text lines without reading it all into memory.
+
+    Args:
+        chunks (AsyncIterator[bytes]): Request body stream (e.g. `request.stream()`).
+
+    Yields:
+        str: One line at a time, without the trailing newline.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Optional[Dict[str, object]], Optional[str]]]:
+    """
+    Parse CSV lines (first line is the header) into dicts.
+
+    Quoted fields may span lines: physical lines are joined until the quotes balance.
+
+    Yields:
+        Tuple[int, Optional[dict], Optional[str]]: (row number, record, parse error).
+    """
+    header = None
+    buffer = []
+    row = 0
+    async for line in lines:
+        buffer.append(line)
+        if sum(part.count('"') for part in buffer) % 2:
+            continue  # Inside a quoted field that continues on the next line
+        text = "\n".join(buffer)
+        buffer = []
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield row, None, f"expected {len(header)} columns, got {len(values)}"
+            continue
+        yield row, dict(zip(header, values)), None
+    if buffer:
+        yield row + 1, None, "unterminated quoted field"
+
+
+async def iter_ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Optional[Dict[str, object]], Optional[str]]]:
+    """
+    Parse newline-delimited JSON objects.
+
+    Yields:
+        Tuple[int, Optional[dict], Optional[str]]: (row number, record, parse error).
+    """
+    row = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield row, None, f"invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield row, None, "expected a JSON object"
+            continue
+        yield row, record, None
+
+
+def validate_rows(
+    schema: Type[BaseModel], records: List[Tuple[int, Dict[str, object]]]
+) -> Tuple[List[Dict[str, object]], List[Dict[str, object]]]:
+    """
+    Validate a chunk of records against a Pydantic schema.
+
+    Empty strings (common in CSV exports) are treated as missing values.
+
+    Args:
+        schema (Type[BaseModel]): Schema every row must satisfy (e.g. MemberCreate).
+        records (List[Tuple[int, dict]]): (row number, record) pairs.
+
+    Returns:
+        Tuple[List[dict], List[dict]]: Valid rows as plain dicts, and per-row error entries.
+    """
+    valid, errors = [], []
+    for row, record in records:
+        cleaned = {k: (None if v == "" else v) for k, v in record.items() if k in schema.model_fields}
+        try:
+            valid.append(schema(**cleaned).dict())
+        except ValidationError as exc:
+            errors.append({
+                "row": row,
+                "errors": [f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors()],
+            })
+    return valid, errors
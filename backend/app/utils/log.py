@@ -0,0 +1,231 @@
+# backend/app/utils/log.py
+#
+# Structured, non-blocking logging.
+#
+# - Request handlers only put records on a bounded in-memory queue; a background
+#   thread (QueueListener) formats and writes them. When the queue is full,
+#   records are dropped and counted instead of blocking the request.
+# - Records are written as one JSON object per line (LOG_FORMAT=json, default)
+#   or as plain text (LOG_FORMAT=text). Fields passed with `extra=` become keys.
+# - Every record carries the request id (X-Request-ID, set by RequestIdMiddleware)
+#   and the route of the request being handled, so lines of one request can be grouped.
+# - LOG_LEVEL sets the root level; LOG_LEVELS overrides it per module,
+#   e.g. "app.routes.dashboard=DEBUG,sqlalchemy.engine=WARNING".
+# - High-volume events pass `extra={"event": name, "sample": rate}` and only that
+#   fraction of them is written; LOG_SAMPLE_RATES overrides rates per event,
+#   e.g. "dashboard.view=0,renewals.page=1".
+#
+# Usage:
+#     logger = logging.getLogger(__name__)
+#     logger.info("Renewal page served", extra={"event": "renewals.page", "count": 50, "sample": 0.1})
+
+import atexit  # To flush queued records when the process exits
+import copy  # Queued records are copies, like in QueueHandler.prepare
+import logging  # Standard logging machinery
+import os  # For reading settings from environment variables
+import queue  # Bounded queue between request handlers and the writer thread
+import random  # For sampling
+import re  # To validate incoming request ids
+import sys  # Records are written to stderr
+import threading  # The dropped-record counter is shared by all threads
+import uuid  # To generate request ids
+from contextvars import ContextVar  # Request id of the request being handled
+from datetime import datetime, timezone  # Record timestamps
+from logging.handlers import QueueHandler, QueueListener  # Queue-backed handler and its writer thread
+from typing import Dict, Optional  # For type hints
+
+import orjson  # Fast JSON encoding of records
+from dotenv import load_dotenv  # To load environment variables from a .env file
+from starlette.datastructures import Headers, MutableHeaders  # Request / response header helpers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send  # ASGI types
+
+from app.utils.metrics import current_request  # Route of the request being handled
+
+# Load environment variables from the .env file into the system environment
+load_dotenv()
+
+# Root log level
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+# Per-module levels: "logger.name=LEVEL,..."
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+
+# "json" (one object per line) or "text"
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+
+# Records waiting to be written; beyond this, new records are dropped
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10000))
+
+# Per-event sampling rates overriding the ones in the code: "event=rate,..."
+LOG_SAMPLE_RATES = os.getenv("LOG_SAMPLE_RATES", "")
+
+# Header carrying the request id (accepted from the client or proxy, echoed in the response)
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Incoming request ids are reused only if they look like ids (no log injection)
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
+
+# Request id of the request being handled (None outside requests)
+request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else was passed with `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "sample"}
+
+
+def _parse_pairs(value: str) -> Dict[str, str]:
+    # "a=1, b=2" -> {"a": "1", "b": "2"}
+    pairs = {}
+    for part in value.split(","):
+        name, sep, setting = part.partition("=")
+        if sep and name.strip():
+            pairs[name.strip()] = setting.strip()
+    return pairs
+
+
+_sample_overrides = {event: float(rate) for event, rate in _parse_pairs(LOG_SAMPLE_RATES).items()}
+
+
+class ContextFilter(logging.Filter):
+    """
+    Adds the request id and route to records, and samples high-volume events.
+
+    Runs on the queue handler, i.e. in the thread that logged, where the
+    request's context variables are visible.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        event = getattr(record, "event", None)
+        rate = _sample_overrides.get(event, getattr(record, "sample", None))
+        if rate is not None:
+            if rate <= 0 or (rate < 1 and random.random() >= rate):
+                return False
+            record.sample_rate = rate
+
+        record.request_id = request_id.get()
+        stats = current_request.get()
+        record.route = stats.route if stats is not None else None
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler that drops records instead of blocking when the queue is full.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._lock_dropped = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the arguments into the message and render the traceback now (they may
+        # not survive the trip to another thread), but keep the extra fields intact
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock_dropped:
+                self.dropped += 1
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record: timestamp, level, logger, message, request id, route and extra fields.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for name, value in vars(record).items():
+            if name not in _RECORD_ATTRS and value is not None:
+                entry[name] = value
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class TextFormatter(logging.Formatter):
+    # Human-readable lines for local development
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        if getattr(record, "request_id", None) is None:
+            record.request_id = "-"
+        return super().format(record)
+
+
+_handler: Optional[NonBlockingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging() -> None:
+    """
+    Route every log record through the non-blocking queue handler. Safe to call more than once.
+    """
+    global _handler, _listener
+    if _handler is not None:
+        return
+
+    output = logging.StreamHandler(sys.stderr)
+    output.setFormatter(TextFormatter() if LOG_FORMAT == "text" else JsonFormatter())
+
+    _handler = NonBlockingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+    _handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    root.setLevel(LOG_LEVEL)
+    root.addHandler(_handler)
+    for name, level in _parse_pairs(LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level.upper())
+
+    _listener = QueueListener(_handler.queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def logging_stats() -> Dict[str, int]:
+    # Records waiting in the queue and records dropped because it was full
+    if _handler is None:
+        return {"queued": 0, "dropped": 0}
+    return {"queued": _handler.queue.qsize(), "dropped": _handler.dropped}
+
+
+class RequestIdMiddleware:
+    """
+    ASGI middleware giving every request an id, visible in its log records and the X-Request-ID response header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = Headers(scope=scope).get(REQUEST_ID_HEADER, "")
+        current = incoming if _REQUEST_ID_PATTERN.match(incoming) else uuid.uuid4().hex
+        token = request_id.set(current)
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = current
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            request_id.reset(token)
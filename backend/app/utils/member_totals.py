@@ -0,0 +1,54 @@
+# backend/app/utils/member_totals.py
+
+from sqlalchemy import bindparam, case, func, select, update  # SQL expression helpers
+from sqlalchemy.engine import Connection  # Backfill runs on a plain connection
+from sqlalchemy.orm import Session  # To work with database sessions
+from typing import Dict, List  # For type hints
+
+from app.models.member import Member  # Members carry the denormalized counters
+from app.models.payment import Payment  # Payments the counters are derived from
+
+# One statement per batch: add a payment to its member's counters
+# last_payment_at only moves forward, so a back-dated payment never hides a newer one
+_add_payment = (
+    update(Member.__table__)
+    .where(Member.__table__.c.id == bindparam("member_id"))
+    .values(
+        total_paid=Member.__table__.c.total_paid + bindparam("amount"),
+        payment_count=Member.__table__.c.payment_count + 1,
+        last_payment_at=case(
+            (Member.__table__.c.last_payment_at.is_(None), bindparam("paid_at")),
+            (Member.__table__.c.last_payment_at < bindparam("paid_at"), bindparam("paid_at")),
+            else_=Member.__table__.c.last_payment_at,
+        ),
+    )
+)
+
+
+def record_member_payments(db: Session, payments: List[Dict[str, object]]) -> None:
+    """
+    Add new payments to the members' total_paid, payment_count and last_payment_at.
+
+    Args:
+        db (Session): Session holding the new payments; the update joins its transaction.
+        payments (List[Dict[str, object]]): One dict per payment with member_id, amount and paid_at.
+            A member may appear only once per call.
+    """
+    if payments:
+        db.execute(_add_payment, payments)
+
+
+def rebuild_member_totals(conn: Connection) -> None:
+    # Recompute every member's counters from the payments table
+    payments = Payment.__table__.c
+    members = Member.__table__
+    conn.execute(
+        update(members).values(
+            total_paid=select(func.coalesce(func.sum(payments.amount), 0))
+            .where(payments.member_id == members.c.id).scalar_subquery(),
+            payment_count=select(func.count(payments.id))
+            .where(payments.member_id == members.c.id).scalar_subquery(),
+            last_payment_at=select(func.max(payments.date))
+            .where(payments.member_id == members.c.id).scalar_subquery(),
+        )
+    )
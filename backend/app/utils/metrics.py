@@ -0,0 +1,200 @@
+# backend/app/utils/metrics.py
+#
+# Request and SQL instrumentation.
+#
+# MetricsMiddleware records, per (method, route template):
+# - a latency histogram, request counts per status code and an in-flight gauge,
+# - the number of SQL statements and the DB time each request spent.
+# SQL statements are timed by before/after_cursor_execute listeners on both
+# engines (see instrument_queries) and attributed to the current request
+# through a context variable. Every response carries a Server-Timing header,
+# and render_metrics() produces the Prometheus text format for GET /metrics.
+
+import threading  # Metrics are updated from the event loop and from threadpool threads
+import time  # For measuring durations
+from contextvars import ContextVar  # Carries the current request's counters into DB event handlers
+from typing import Dict, List, Optional, Tuple  # For type hints
+
+from sqlalchemy import event  # To subscribe to cursor execution events
+from sqlalchemy.engine import Engine  # Engines whose statements are timed
+from starlette.datastructures import MutableHeaders  # To add the Server-Timing header
+from starlette.routing import Match  # To resolve the route template before the request runs
+from starlette.types import ASGIApp, Message, Receive, Scope, Send  # ASGI types
+
+from app.utils.histogram import DEFAULT_BUCKETS_MS, Histogram  # Latency distributions
+
+# Buckets for the number of SQL statements issued by one request (spots N+1 patterns)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class RequestStats:
+    # Route and SQL counters of the request being handled
+    __slots__ = ("route", "queries", "db_ms")
+
+    def __init__(self, route: str):
+        self.route = route  # "METHOD /route/template", also used by the slow-query log
+        self.queries = 0
+        self.db_ms = 0.0
+
+
+# Counters of the current request (None outside requests, e.g. scripts and startup)
+current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+
+class RouteMetrics:
+    """
+    Everything recorded for one (method, route) pair.
+    """
+
+    def __init__(self):
+        self.latency_ms = Histogram(DEFAULT_BUCKETS_MS)
+        self.queries = Histogram(QUERY_COUNT_BUCKETS)
+        self.db_ms = Histogram(DEFAULT_BUCKETS_MS)
+        self.statuses: Dict[int, int] = {}
+        self.in_flight = 0
+
+
+_lock = threading.Lock()
+_routes: Dict[Tuple[str, str], RouteMetrics] = {}
+
+
+def _route_metrics(method: str, route: str) -> RouteMetrics:
+    key = (method, route)
+    metrics = _routes.get(key)
+    if metrics is None:
+        with _lock:
+            metrics = _routes.setdefault(key, RouteMetrics())
+    return metrics
+
+
+def instrument_queries(engine: Engine) -> None:
+    """
+    Time every statement executed on `engine` and add it to the current request.
+
+    Args:
+        engine (Engine): Sync engine (use `async_engine.sync_engine` for async engines).
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started_at"].pop()
+        stats = current_request.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_ms += (time.perf_counter() - started) * 1000
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        # A failed statement never reaches after_cursor_execute
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started_at"):
+            connection.info["query_started_at"].pop()
+
+
+def _route_template(scope: Scope) -> str:
+    # Path template of the route that will handle the request (e.g. /api/members/{id})
+    app = scope.get("app")
+    for route in getattr(getattr(app, "router", None), "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route latency, status codes, in-flight requests and SQL usage.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route = _route_template(scope)
+        metrics = _route_metrics(scope["method"], route)
+        stats = RequestStats(f"{scope['method']} {route}")
+        token = current_request.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                elapsed = (time.perf_counter() - started) * 1000
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'app;dur={elapsed:.1f}, db;dur={stats.db_ms:.1f};desc="{stats.queries} queries"',
+                )
+            await send(message)
+
+        with _lock:
+            metrics.in_flight += 1
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request.reset(token)
+            metrics.latency_ms.observe((time.perf_counter() - started) * 1000)
+            metrics.queries.observe(stats.queries)
+            metrics.db_ms.observe(stats.db_ms)
+            with _lock:
+                metrics.in_flight -= 1
+                metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+
+
+def _labels(**labels) -> str:
+    # {name="value",...} with quotes and backslashes escaped
+    escaped = (f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"' for name, value in labels.items())
+    return "{" + ",".join(escaped) + "}"
+
+
+def _histogram_lines(name: str, labels: Dict[str, str], histogram: Histogram) -> List[str]:
+    snapshot = histogram.snapshot()
+    lines = [f"{name}_bucket{_labels(**labels, le=bound)} {count}" for bound, count in snapshot["buckets"].items()]
+    lines.append(f"{name}_sum{_labels(**labels)} {snapshot['sum']}")
+    lines.append(f"{name}_count{_labels(**labels)} {snapshot['count']}")
+    return lines
+
+
+def render_metrics() -> str:
+    """
+    Render every recorded metric in the Prometheus text exposition format.
+
+    Returns:
+        str: Metrics text, one sample per line.
+    """
+    with _lock:
+        routes = sorted(_routes.items())
+        statuses = {key: dict(metrics.statuses) for key, metrics in routes}
+        in_flight = {key: metrics.in_flight for key, metrics in routes}
+
+    families = [
+        ("http_request_duration_ms", "histogram", "Request latency in milliseconds.", "latency_ms"),
+        ("http_request_db_queries", "histogram", "SQL statements issued per request.", "queries"),
+        ("http_request_db_duration_ms", "histogram", "Time spent in SQL statements per request, in milliseconds.", "db_ms"),
+    ]
+    lines = []
+    for name, kind, help_text, attribute in families:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        for (method, route), metrics in routes:
+            lines += _histogram_lines(name, {"method": method, "route": route}, getattr(metrics, attribute))
+
+    lines += ["# HELP http_requests_total Completed requests by status code.", "# TYPE http_requests_total counter"]
+    for (method, route), counts in statuses.items():
+        for status, count in sorted(counts.items()):
+            lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+
+    lines += ["# HELP http_requests_in_flight Requests currently being handled.", "# TYPE http_requests_in_flight gauge"]
+    for (method, route), count in in_flight.items():
+        lines.append(f"http_requests_in_flight{_labels(method=method, route=route)} {count}")
+
+    return "\n".join(lines) + "\n"
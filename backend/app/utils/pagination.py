@@ -0,0 +1,133 @@
+# backend/app/utils/pagination.py
+
+import base64  # For turning the cursor JSON into an opaque, URL-safe string
+import json  # For serializing the cursor values
+import os  # For reading page size limits from environment variables
+from datetime import date, datetime  # Cursor values may contain dates
+from typing import Any, List, Optional, Sequence, Tuple  # For type hints
+
+from dotenv import load_dotenv  # To load environment variables from a .env file
+from fastapi import HTTPException, status  # To reject malformed cursors with a 400
+from sqlalchemy import Select, tuple_  # To build keyset conditions
+from sqlalchemy.ext.asyncio import AsyncSession  # Pages are fetched with an async session
+
+# Load environment variables from the .env file into the system environment
+load_dotenv()
+
+# Default number of rows returned when the client does not send a limit
+DEFAULT_PAGE_SIZE = int(os.getenv("PAGE_SIZE_DEFAULT", 50))
+
+# Hard upper bound on the page size a client can ask for
+MAX_PAGE_SIZE = int(os.getenv("PAGE_SIZE_MAX", 500))
+
+
+def _encode_value(value: Any) -> Any:
+    # Dates are not JSON serializable, so tag them with their type
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    # Reverse of _encode_value
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+    return value
+
+
+def encode_cursor(sort: str, values: List[Any]) -> str:
+    """
+    Build an opaque cursor pointing just after the row with the given sort key values.
+
+    Args:
+        sort (str): Name of the ordering the cursor belongs to (e.g. "id", "end_date").
+        values (List[Any]): Sort key values of the last row on the current page.
+
+    Returns:
+        str: URL-safe base64 string to be sent back as `cursor`.
+    """
+    raw = json.dumps({"s": sort, "v": [_encode_value(v) for v in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], sort: str) -> Optional[List[Any]]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (Optional[str]): Cursor string from the query string, or None for the first page.
+        sort (str): Ordering the current request uses; must match the cursor's ordering.
+
+    Returns:
+        Optional[List[Any]]: Sort key values to continue after, or None for the first page.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if data["s"] != sort:
+            raise ValueError("cursor was issued for a different sort order")
+        return [_decode_value(v) for v in data["v"]]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    # Fall back to the default page size and never exceed the configured maximum
+    if not limit or limit < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+async def keyset_page(
+    db: AsyncSession,
+    query: Select,
+    keys: Sequence,
+    sort: str,
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = False,
+    entities: bool = True,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch one page of ORM entities (or column rows) ordered by `keys`, continuing after `cursor`.
+
+    Args:
+        db (AsyncSession): Session used to run the query.
+        query (Select): Select of a single ORM entity, or of columns including every key, with any filters already applied.
+        keys (Sequence): Columns to order by; the last one must be unique (usually the id).
+        sort (str): Name of the ordering, stored in the cursor so it cannot be reused with another one.
+        cursor (Optional[str]): Cursor from the previous page, or None for the first page.
+        limit (int): Page size (already clamped).
+        descending (bool): Order by the keys descending instead of ascending.
+        entities (bool): Return ORM entities (the first selected column) instead of whole rows.
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: The entities or rows on the page and the cursor for the next page.
+    """
+    after = decode_cursor(cursor, sort)
+    if after is not None:
+        if len(after) != len(keys):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        left = keys[0] if len(keys) == 1 else tuple_(*keys)
+        right = after[0] if len(keys) == 1 else tuple_(*after)
+        query = query.where(left < right if descending else left > right)
+
+    order = [key.desc() if descending else key.asc() for key in keys]
+
+    # Fetch one extra row to know whether another page exists
+    result = await db.execute(query.order_by(*order).limit(limit + 1))
+    rows = result.scalars().all() if entities else result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor(sort, [getattr(rows[-1], key.key) for key in keys])
+    return rows, next_cursor
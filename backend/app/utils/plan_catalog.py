@@ -0,0 +1,151 @@
+# backend/app/utils/plan_catalog.py
+#
+# In-memory copy of the plans table.
+#
+# Plans change rarely but are read on every plan listing and renewal, so each
+# worker keeps the whole catalog in memory. Every write to plans increments the
+# "plans" counter in table_versions in the same transaction; a worker compares
+# its copy against that counter at most once every PLAN_CATALOG_CHECK_SECONDS
+# and reloads when it moved. Writes made by this worker drop the copy at once.
+# Write paths that store a plan name (members, payments) check it with require_plan.
+
+import os  # For reading the check interval from environment variables
+import threading  # To swap snapshots atomically between request threads
+import time  # Monotonic clock for the check interval
+from dataclasses import dataclass  # Immutable plan snapshots
+from decimal import Decimal  # Plan prices
+from typing import Dict, List, Optional, Tuple  # For type hints
+
+from dotenv import load_dotenv  # To load environment variables from a .env file
+from fastapi import HTTPException, status  # To reject unknown plans with a 400
+from sqlalchemy import select  # SQL expression helper
+from sqlalchemy.orm import Session  # To work with database sessions
+
+from app.models.plan import Plan  # The plans table
+from app.utils.versions import get_versions  # Change counters
+
+# Load environment variables from the .env file into the system environment
+load_dotenv()
+
+# Name of the plans counter in table_versions
+PLANS_VERSION = "plans"
+
+# How often (in seconds) a worker checks the database for plan changes made by other workers
+PLAN_CATALOG_CHECK_SECONDS = float(os.getenv("PLAN_CATALOG_CHECK_SECONDS", 5))
+
+
+@dataclass(frozen=True)
+class PlanEntry:
+    # Read-only copy of one Plan row
+    id: int
+    name: str
+    price: Decimal
+    duration: int
+    description: Optional[str]
+
+
+class PlanCatalog:
+    """
+    Immutable snapshot of every plan, indexed by name.
+    """
+
+    def __init__(self, version: int, plans: List[PlanEntry]):
+        self.version = version
+        self.plans: Tuple[PlanEntry, ...] = tuple(plans)
+        self._by_name: Dict[str, PlanEntry] = {plan.name: plan for plan in plans}
+
+    def by_name(self, name: str) -> Optional[PlanEntry]:
+        return self._by_name.get(name)
+
+
+# Current snapshot, when it was last compared with the database, and the lock guarding both
+# _generation counts invalidations, so a reload that started before one is not stored after it
+_catalog: Optional[PlanCatalog] = None
+_checked_at = 0.0
+_generation = 0
+_lock = threading.Lock()
+
+
+def _load(db: Session, version: int) -> PlanCatalog:
+    # Read the whole plans table into a new snapshot
+    rows = db.execute(
+        select(Plan.id, Plan.name, Plan.price, Plan.duration, Plan.description).order_by(Plan.id)
+    ).all()
+    return PlanCatalog(version, [PlanEntry(*row) for row in rows])
+
+
+def get_plan_catalog(db: Session) -> PlanCatalog:
+    """
+    Return the current plan catalog, reloading it if the plans table changed.
+
+    Between version checks this touches no database at all; lookups on the
+    returned catalog are plain dictionary reads. Async callers use
+    `await db.run_sync(get_plan_catalog)`.
+
+    The lock is never held while querying: under run_sync every query yields
+    to the event loop, and another request blocking on the lock from the loop
+    thread would stall the whole worker. Concurrent callers on a cold cache may
+    each load the plans; the newest snapshot wins.
+
+    A reload reads the version, then the plans, then the version again, and is
+    only stored if neither the version nor this worker's invalidation count
+    moved meanwhile; otherwise it is returned to this caller only, so a write
+    that lands during the load is never hidden behind a stale snapshot.
+
+    Args:
+        db (Session): Session used for the version check and, if needed, the reload.
+
+    Returns:
+        PlanCatalog: Snapshot of every plan.
+    """
+    global _catalog, _checked_at
+
+    catalog = _catalog
+    if catalog is not None and time.monotonic() - _checked_at < PLAN_CATALOG_CHECK_SECONDS:
+        return catalog
+
+    generation = _generation
+    version = get_versions(db, [PLANS_VERSION])[PLANS_VERSION]
+    if catalog is not None and catalog.version == version:
+        with _lock:
+            if _catalog is catalog:
+                _checked_at = time.monotonic()
+        return catalog
+
+    catalog = _load(db, version)
+    if get_versions(db, [PLANS_VERSION])[PLANS_VERSION] != version:
+        return catalog
+
+    with _lock:
+        if _generation == generation and (_catalog is None or _catalog.version <= catalog.version):
+            _catalog = catalog
+            _checked_at = time.monotonic()
+    return catalog
+
+
+def require_plan(db: Session, name: str) -> PlanEntry:
+    """
+    Look up a plan by name in the catalog, rejecting unknown names.
+
+    Async callers use `await db.run_sync(require_plan, name)`.
+
+    Args:
+        db (Session): Session passed on to get_plan_catalog.
+        name (str): Plan name sent by the client (e.g. a member's plan_type).
+
+    Returns:
+        PlanEntry: The plan.
+    """
+    plan = get_plan_catalog(db).by_name(name)
+    if plan is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown plan: {name}")
+    return plan
+
+
+def invalidate_plan_catalog() -> None:
+    # Drop this worker's snapshot; the next get_plan_catalog call reloads it
+    global _catalog, _checked_at, _generation
+    with _lock:
+        _catalog = None
+        _checked_at = 0.0
+        _generation += 1
@@ -0,0 +1,125 @@
+# backend/app/utils/pool_stats.py
+
+import time  # For measuring wait and hold times
+import threading  # Counters are updated from many threads
+from typing import Dict  # For type hints
+
+from sqlalchemy import event  # To subscribe to connection pool events
+from sqlalchemy.engine import Engine  # Engines whose pools are instrumented
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError  # Raised when no connection frees up in time
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool  # Pools used by the sync and async engines
+
+from app.utils.histogram import Histogram  # Wait/hold time distributions
+
+
+class PoolStats:
+    """
+    Counters and latency histograms for one engine's connection pool.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self.wait_ms = Histogram()  # Time spent waiting for a connection from the pool
+        self.hold_ms = Histogram()  # Time a connection stayed checked out
+        self._lock = threading.Lock()
+        self.counters = {"connects": 0, "checkouts": 0, "checkins": 0, "invalidations": 0, "timeouts": 0}
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        # Live pool state plus counters and histograms since startup
+        pool = self.pool
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            "pool_class": type(pool).__name__,
+            "pool_size": pool.size() if hasattr(pool, "size") else None,
+            "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else None,
+            "idle": pool.checkedin() if hasattr(pool, "checkedin") else None,
+            "overflow": max(pool.overflow(), 0) if hasattr(pool, "overflow") else None,
+            "max_overflow": getattr(pool, "_max_overflow", None),
+            **counters,
+            "wait_ms": self.wait_ms.snapshot(),
+            "hold_ms": self.hold_ms.snapshot(),
+        }
+
+
+# Instrumented pools, keyed by engine name ("sync", "async")
+POOL_STATS: Dict[str, PoolStats] = {}
+
+
+class _TimedGetMixin:
+    # Pool events fire after a connection is handed out, so the time spent
+    # waiting for one is measured around the pool's blocking get instead
+    stats = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            if self.stats is not None:
+                self.stats.incr("timeouts")
+            raise
+        finally:
+            if self.stats is not None:
+                self.stats.wait_ms.observe((time.perf_counter() - start) * 1000)
+
+    def recreate(self):
+        # Keep the stats when the engine disposes and rebuilds its pool
+        pool = super().recreate()
+        pool.stats = self.stats
+        if self.stats is not None:
+            self.stats.pool = pool
+        return pool
+
+
+class TimedQueuePool(_TimedGetMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedGetMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_engine(engine: Engine, name: str) -> PoolStats:
+    """
+    Attach pool event listeners to an engine and register its statistics.
+
+    Args:
+        engine (Engine): Sync engine (use `async_engine.sync_engine` for async engines).
+        name (str): Key the statistics are reported under.
+
+    Returns:
+        PoolStats: The statistics object fed by the listeners.
+    """
+    stats = PoolStats(name)
+    stats.pool = engine.pool
+    if isinstance(engine.pool, _TimedGetMixin):
+        engine.pool.stats = stats
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        stats.incr("connects")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.incr("checkouts")
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        stats.incr("checkins")
+        started = connection_record.info.pop("checked_out_at", None) if connection_record else None
+        if started is not None:
+            stats.hold_ms.observe((time.perf_counter() - started) * 1000)
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        stats.incr("invalidations")
+
+    POOL_STATS[name] = stats
+    return stats
@@ -0,0 +1,137 @@
+# backend/app/utils/search.py
+#
+# Member search by partial name, email or phone number.
+#
+# SQLite matches against the members_fts FTS5 trigram index; Postgres matches
+# with LIKE '%term%', served by pg_trgm GIN indexes. Every term of the query
+# must match (AND), and each term needs at least SEARCH_MIN_TERM characters so
+# it can use the trigram index. Matches are ranked by where the terms occur.
+
+import os  # For reading the candidate cap from environment variables
+from typing import List, Sequence, Tuple  # For type hints
+
+from fastapi import HTTPException, status  # To reject queries the index cannot serve
+from sqlalchemy import Select, and_, case, column, func, literal, literal_column, or_, select, table
+
+from app.models.member import Member, normalize_phone  # The members table and phone normalization
+
+# Shortest term the trigram indexes can look up
+SEARCH_MIN_TERM = 3
+
+# Matching members collected from the index before ranking
+SEARCH_CANDIDATES = int(os.getenv("SEARCH_CANDIDATES", 500))
+
+# Characters that may appear in a phone number as typed
+_PHONE_CHARS = set("0123456789+-() .")
+
+# The FTS5 virtual table, joined to members on rowid = id
+members_fts = table("members_fts", column("rowid"))
+
+
+def parse_terms(q: str) -> List[Tuple[str, bool]]:
+    """
+    Split a search query into terms usable by the index.
+
+    Phone-like terms ("98765", "+91 98765-43210" typed as one token) are reduced
+    to digits and only matched against phone_digits; other terms are matched
+    against name and email.
+
+    Args:
+        q (str): Raw query from the search box.
+
+    Returns:
+        List[Tuple[str, bool]]: (term, is_phone) pairs.
+    """
+    terms = []
+    for word in q.split():
+        if set(word) <= _PHONE_CHARS and any(ch.isdigit() for ch in word):
+            term, is_phone = normalize_phone(word), True
+        else:
+            term, is_phone = word.lower(), False
+        if len(term) >= SEARCH_MIN_TERM:
+            terms.append((term, is_phone))
+    if not terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Search terms must be at least {SEARCH_MIN_TERM} characters long",
+        )
+    return terms
+
+
+def _fts_phrase(term: str) -> str:
+    # Quote a term as an FTS5 phrase (double quotes inside are doubled)
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_pattern(term: str) -> str:
+    # Substring pattern with LIKE wildcards in the term escaped
+    return "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def _rank(terms: Sequence[Tuple[str, bool]]):
+    # Lower is better: per name/email term, 0 = name starts with it, 1 = a later word of the
+    # name starts with it, 2 = inside the name, 3 = only in the email; phone terms score 0
+    name = func.lower(Member.name)
+    scores = []
+    for term, is_phone in terms:
+        if is_phone:
+            continue
+        escaped = _like_pattern(term)[1:-1]
+        scores.append(case(
+            (name.like(escaped + "%", escape="\\"), 0),
+            (name.like("% " + escaped + "%", escape="\\"), 1),
+            (name.like("%" + escaped + "%", escape="\\"), 2),
+            else_=3,
+        ))
+    return sum(scores[1:], scores[0]) if scores else literal(0)
+
+
+def member_search_query(dialect: str, terms: Sequence[Tuple[str, bool]], columns: Sequence, limit: int) -> Select:
+    """
+    Build the ranked search query for the given database dialect.
+
+    The index lookup collects at most SEARCH_CANDIDATES matching ids, which are
+    then ranked (see _rank, then shorter names first). A very common term
+    therefore costs the same as a rare one; typing more terms narrows the candidates.
+
+    Args:
+        dialect (str): Dialect name of the connection ("sqlite", "postgresql", ...).
+        terms (Sequence[Tuple[str, bool]]): Terms from parse_terms.
+        columns (Sequence): Member columns to select.
+        limit (int): Maximum number of results.
+
+    Returns:
+        Select: Query returning `columns`, best match first.
+    """
+    if dialect == "sqlite":
+        # FTS5 trigram index; newest members first when there are more candidates than the cap
+        match = " AND ".join(
+            ("{phone_digits} : " if is_phone else "{name email} : ") + _fts_phrase(term)
+            for term, is_phone in terms
+        )
+        candidates = (
+            select(members_fts.c.rowid.label("id"))
+            .where(literal_column("members_fts").op("MATCH")(match))
+            .order_by(members_fts.c.rowid.desc())
+            .limit(SEARCH_CANDIDATES)
+        )
+    else:
+        # Substring LIKE, served by the pg_trgm GIN indexes on Postgres
+        name = func.lower(Member.name)
+        email = func.lower(Member.email)
+        conditions = []
+        for term, is_phone in terms:
+            pattern = _like_pattern(term)
+            if is_phone:
+                conditions.append(Member.phone_digits.like(pattern, escape="\\"))
+            else:
+                conditions.append(or_(name.like(pattern, escape="\\"), email.like(pattern, escape="\\")))
+        candidates = select(Member.id).where(and_(*conditions)).limit(SEARCH_CANDIDATES)
+
+    candidates = candidates.subquery()
+    return (
+        select(*columns)
+        .join(candidates, candidates.c.id == Member.id)
+        .order_by(_rank(terms), func.length(Member.name), Member.id)
+        .limit(limit)
+    )
@@ -0,0 +1,244 @@
+# backend/app/utils/slow_queries.py
+#
+# Slow-query log.
+#
+# Every statement executed on an instrumented engine is timed. Statements that
+# take longer than SLOW_QUERY_MS are logged and kept in a ring buffer (read by
+# GET /api/admin/slow-queries) with:
+# - the normalized SQL (literals and placeholders replaced by "?", IN lists collapsed),
+# - the parameters with strings redacted (names, emails, phone numbers, hashes),
+# - the route of the request that issued it and its duration.
+# Statements slower than SLOW_QUERY_EXPLAIN_MS also get their query plan
+# (EXPLAIN, or EXPLAIN QUERY PLAN on SQLite), captured on the same connection
+# at most once per normalized statement every SLOW_QUERY_EXPLAIN_TTL seconds.
+
+import logging  # Slow statements are also written to the log
+import os  # For reading settings from environment variables
+import re  # For normalizing SQL text
+import threading  # The buffer is written from the event loop and from threadpool threads
+import time  # For measuring durations
+from collections import OrderedDict, deque  # Plan cache and ring buffer
+from datetime import date, datetime  # Parameter values kept as-is
+from decimal import Decimal  # Parameter values kept as-is
+from typing import Any, Dict, List  # For type hints
+
+from dotenv import load_dotenv  # To load environment variables from a .env file
+from sqlalchemy import event  # To subscribe to cursor execution events
+from sqlalchemy.engine import Engine  # Engines whose statements are timed
+
+from app.utils.metrics import current_request  # Route of the request that issued the statement
+
+# Load environment variables from the .env file into the system environment
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Turn the slow-query log off entirely
+SLOW_QUERY_LOG_ENABLED = os.getenv("SLOW_QUERY_LOG_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Statements slower than this many milliseconds are logged and buffered
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 100))
+
+# Statements slower than this many milliseconds also get their query plan captured
+SLOW_QUERY_EXPLAIN_MS = float(os.getenv("SLOW_QUERY_EXPLAIN_MS", SLOW_QUERY_MS))
+
+# Seconds before the plan of the same normalized statement is captured again
+SLOW_QUERY_EXPLAIN_TTL = float(os.getenv("SLOW_QUERY_EXPLAIN_TTL", 60))
+
+# Number of slow statements kept in the ring buffer
+SLOW_QUERY_BUFFER_SIZE = int(os.getenv("SLOW_QUERY_BUFFER_SIZE", 200))
+
+# Only these statements can be explained (DDL, PRAGMA, SAVEPOINT, ... cannot)
+_EXPLAINABLE = ("select", "with", "insert", "update", "delete")
+
+# Normalization patterns: string literals, numbers, driver placeholders, IN lists, whitespace
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+\b|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# Parameter types shown as-is; anything else is redacted
+_SAFE_TYPES = (bool, int, float, Decimal, date, datetime, type(None))
+
+_lock = threading.Lock()
+_entries: deque = deque(maxlen=SLOW_QUERY_BUFFER_SIZE)
+_explained: "OrderedDict[str, float]" = OrderedDict()  # Normalized statement -> time of its last EXPLAIN
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Reduce a statement to its shape, so executions with different values group together.
+
+    Args:
+        statement (str): SQL text as sent to the driver.
+
+    Returns:
+        str: Single-line SQL with literals and placeholders replaced by "?".
+    """
+    sql = _STRING.sub("?", statement)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("(?, ...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def _redact_value(value: Any) -> Any:
+    # Keep ids, amounts and dates (useful to reproduce a plan); hide text and binary values
+    if isinstance(value, _SAFE_TYPES):
+        return value if not isinstance(value, (Decimal, date, datetime)) else str(value)
+    if isinstance(value, (str, bytes)):
+        return f"<redacted {type(value).__name__}({len(value)})>"
+    return f"<redacted {type(value).__name__}>"
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """
+    Copy statement parameters with every text value redacted.
+
+    Args:
+        parameters (Any): Positional (tuple/list) or named (dict) parameters of one execution.
+
+    Returns:
+        Any: Parameters safe to log.
+    """
+    if isinstance(parameters, dict):
+        return {name: _redact_value(value) for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact_value(value) for value in parameters]
+    return _redact_value(parameters)
+
+
+def _should_explain(sql: str, now: float) -> bool:
+    # Explain each normalized statement at most once per SLOW_QUERY_EXPLAIN_TTL seconds
+    with _lock:
+        last = _explained.get(sql)
+        if last is not None and now - last < SLOW_QUERY_EXPLAIN_TTL:
+            return False
+        _explained[sql] = now
+        _explained.move_to_end(sql)
+        while len(_explained) > SLOW_QUERY_BUFFER_SIZE:
+            _explained.popitem(last=False)
+        return True
+
+
+def _explain(conn, statement: str, parameters: Any) -> List[str]:
+    # Query plan of `statement`, run on the connection that executed it (same transaction and settings)
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    conn.info["slow_query_explaining"] = True
+    try:
+        if conn.dialect.name != "sqlite" and conn.in_transaction():
+            # On Postgres a failed EXPLAIN would abort the caller's transaction; a savepoint contains it
+            with conn.begin_nested():
+                rows = conn.exec_driver_sql(prefix + statement, parameters).all()
+        else:
+            rows = conn.exec_driver_sql(prefix + statement, parameters).all()
+    finally:
+        conn.info["slow_query_explaining"] = False
+    # SQLite rows are (id, parent, notused, detail); other databases return one text column
+    return [str(row[-1]) for row in rows]
+
+
+def _record(conn, statement: str, parameters: Any, executemany: bool, duration_ms: float) -> None:
+    sql = normalize_sql(statement)
+    stats = current_request.get()
+    first = parameters[0] if executemany and parameters else parameters
+    entry: Dict[str, Any] = {
+        "at": datetime.now().isoformat(timespec="milliseconds"),
+        "duration_ms": round(duration_ms, 3),
+        "route": stats.route if stats is not None else None,
+        "statement": sql,
+        "parameters": redact_parameters(first) if first else None,
+        "executemany": len(parameters) if executemany else None,
+        "plan": None,
+    }
+
+    if (
+        duration_ms >= SLOW_QUERY_EXPLAIN_MS
+        and sql.lower().startswith(_EXPLAINABLE)
+        and _should_explain(sql, time.monotonic())
+    ):
+        try:
+            entry["plan"] = _explain(conn, statement, first or ())
+        except Exception as exc:  # The plan is best effort; never fail the request because of it
+            entry["plan_error"] = f"{type(exc).__name__}: {exc}"
+
+    with _lock:
+        _entries.append(entry)
+    logger.warning(
+        "Slow query (%.1f ms): %s",
+        duration_ms,
+        sql,
+        extra={"event": "db.slow_query", "duration_ms": entry["duration_ms"], "plan": entry["plan"]},
+    )
+
+
+def instrument_slow_queries(engine: Engine) -> None:
+    """
+    Time every statement executed on `engine` and record the slow ones.
+
+    Args:
+        engine (Engine): Sync engine (use `async_engine.sync_engine` for async engines).
+    """
+    if not SLOW_QUERY_LOG_ENABLED:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration_ms = (time.perf_counter() - conn.info["slow_query_started_at"].pop()) * 1000
+        if duration_ms >= SLOW_QUERY_MS and not conn.info.get("slow_query_explaining"):
+            _record(conn, statement, parameters, executemany, duration_ms)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        # A failed statement never reaches after_cursor_execute
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("slow_query_started_at"):
+            connection.info["slow_query_started_at"].pop()
+
+
+def slow_query_snapshot() -> Dict[str, Any]:
+    """
+    Buffered slow statements (newest first) and a per-statement summary.
+
+    Returns:
+        Dict[str, Any]: Settings, "statements" grouped by normalized SQL (slowest total first) and "entries".
+    """
+    with _lock:
+        entries = list(_entries)
+    entries.reverse()
+
+    grouped: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        group = grouped.setdefault(
+            entry["statement"],
+            {"statement": entry["statement"], "count": 0, "total_ms": 0.0, "max_ms": 0.0, "routes": set()},
+        )
+        group["count"] += 1
+        group["total_ms"] += entry["duration_ms"]
+        group["max_ms"] = max(group["max_ms"], entry["duration_ms"])
+        if entry["route"]:
+            group["routes"].add(entry["route"])
+    statements = sorted(grouped.values(), key=lambda group: group["total_ms"], reverse=True)
+    for group in statements:
+        group["total_ms"] = round(group["total_ms"], 3)
+        group["routes"] = sorted(group["routes"])
+
+    return {
+        "enabled": SLOW_QUERY_LOG_ENABLED,
+        "threshold_ms": SLOW_QUERY_MS,
+        "explain_threshold_ms": SLOW_QUERY_EXPLAIN_MS,
+        "statements": statements,
+        "entries": entries,
+    }
+
+
+def clear_slow_queries() -> None:
+    # Empty the ring buffer and forget which statements were explained
+    with _lock:
+        _entries.clear()
+        _explained.clear()
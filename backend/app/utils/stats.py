@@ -0,0 +1,83 @@
+# backend/app/utils/stats.py
+
+from sqlalchemy import case, func, select  # SQL expression helpers for aggregates
+from sqlalchemy.orm import Session  # To work with database sessions
+from datetime import date, datetime, timedelta  # For date calculations
+from decimal import Decimal  # Revenue totals are returned as Decimal
+from typing import Dict  # For specifying return types
+
+from app.models.member import Member  # Member table for membership counts
+from app.models.payment import Payment  # Payment table for revenue totals
+
+# Breakdown dimensions a client can ask for, mapped to the Payment column to group by
+BREAKDOWN_COLUMNS = {
+    "method": Payment.method,
+    "plan": Payment.plan_type,
+}
+
+
+def month_start(today: date) -> datetime:
+    # Midnight on the first day of the month containing `today`
+    return datetime(today.year, today.month, 1)
+
+
+def compute_dashboard_stats(db: Session, today: date) -> Dict[str, object]:
+    """
+    Compute the dashboard counters with a single SELECT.
+
+    Member counts use conditional aggregates over one scan of `members`, and the
+    monthly revenue is a scalar subquery summed in the database.
+
+    Args:
+        db (Session): SQLAlchemy database session used to perform queries.
+        today (date): Reference day for "expired", "upcoming" and "this month".
+
+    Returns:
+        Dict[str, object]: Counters keyed the way the dashboard page expects them.
+    """
+    next_week = today + timedelta(days=7)
+
+    revenue = (
+        select(func.coalesce(func.sum(Payment.amount), 0))
+        .where(Payment.date >= month_start(today))
+        .scalar_subquery()
+    )
+
+    row = db.execute(
+        select(
+            func.count(Member.id),
+            func.count(case((Member.end_date < today, 1))),
+            func.count(case(((Member.end_date >= today) & (Member.end_date <= next_week), 1))),
+            revenue,
+        )
+    ).one()
+
+    total_members, expired, upcoming, total_payments = row
+    return {
+        "Total_Members": total_members,
+        "Active_Members": total_members - expired,
+        "Total_Payments": Decimal(total_payments or 0),
+        "Upcoming_Renewals": upcoming,
+        "Expired_Membership": expired,
+    }
+
+
+def compute_revenue_breakdown(db: Session, dimension: str, today: date) -> Dict[str, Decimal]:
+    """
+    Sum this month's revenue grouped by payment method or plan.
+
+    Args:
+        db (Session): SQLAlchemy database session used to perform queries.
+        dimension (str): One of the keys of BREAKDOWN_COLUMNS.
+        today (date): Reference day used to find the start of the month.
+
+    Returns:
+        Dict[str, Decimal]: Revenue per method or plan name.
+    """
+    column = BREAKDOWN_COLUMNS[dimension]
+    rows = db.execute(
+        select(column, func.sum(Payment.amount))
+        .where(Payment.date >= month_start(today))
+        .group_by(column)
+    ).all()
+    return {key: Decimal(total or 0) for key, total in rows}
@@ -0,0 +1,221 @@
+# backend/app/utils/summary.py
+
+from sqlalchemy import func, select, update  # SQL expression helpers
+from sqlalchemy.exc import IntegrityError  # Raised when two requests create the same row
+from sqlalchemy.orm import Session  # To work with database sessions
+from datetime import date, datetime, timedelta  # For period boundaries
+from decimal import Decimal  # Money amounts
+from typing import Dict, List, Optional, Tuple  # For type hints
+
+from app.models.dashboard_summary import DashboardSummary  # The rollup table
+from app.models.payment import Payment  # Payment table for revenue totals
+from app.utils.stats import compute_dashboard_stats, month_start  # Full recomputation
+from app.utils.versions import bump_version  # Invalidates cached dashboards when drift is fixed
+
+# Length of the "upcoming renewals" window, in days (same as the dashboard)
+UPCOMING_DAYS = 7
+
+
+def _revenue_between(db: Session, start: datetime, end: datetime) -> Tuple[Decimal, int]:
+    # Sum and count of payments with start <= date < end
+    total, count = db.execute(
+        select(func.coalesce(func.sum(Payment.amount), 0), func.count(Payment.id))
+        .where(Payment.date >= start, Payment.date < end)
+    ).one()
+    return Decimal(total or 0), count
+
+
+def _next_month(start: datetime) -> datetime:
+    # Midnight on the 1st of the month after `start`
+    return datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+
+
+def _build_rows(db: Session, today: date) -> Tuple[Dict[str, object], Dict[str, object]]:
+    # Recompute the day and month rows for `today` from the base tables
+    stats = compute_dashboard_stats(db, today)
+    day_start = datetime(today.year, today.month, today.day)
+    first = month_start(today)
+
+    day_revenue, day_count = _revenue_between(db, day_start, day_start + timedelta(days=1))
+    month_revenue, month_count = _revenue_between(db, first, _next_month(first))
+
+    members = {
+        "total_members": stats["Total_Members"],
+        "expired_members": stats["Expired_Membership"],
+        "upcoming_renewals": stats["Upcoming_Renewals"],
+    }
+    day = dict(members, revenue=day_revenue, month_revenue=stats["Total_Payments"], payment_count=day_count)
+    month = dict(members, revenue=month_revenue, month_revenue=month_revenue, payment_count=month_count)
+    return day, month
+
+
+def ensure_summary(db: Session, today: date) -> DashboardSummary:
+    """
+    Return today's summary row, creating it (and the month row) if it does not exist yet.
+
+    The first request of a day builds the row from the base tables; every later
+    request is a primary-key read. Call this before changing members or payments
+    in the same transaction so the change is not counted twice.
+
+    Args:
+        db (Session): SQLAlchemy database session used to perform queries.
+        today (date): Day the summary row is for.
+
+    Returns:
+        DashboardSummary: The day row for `today`.
+    """
+    row = db.get(DashboardSummary, ("day", today))
+    if row is not None:
+        return row
+
+    day, month = _build_rows(db, today)
+    try:
+        # A savepoint keeps the caller's pending changes if another request won the race
+        with db.begin_nested():
+            db.add(DashboardSummary(period="day", period_start=today, **day))
+            if db.get(DashboardSummary, ("month", month_start(today).date())) is None:
+                db.add(DashboardSummary(period="month", period_start=month_start(today).date(), **month))
+    except IntegrityError:
+        pass
+    return db.get(DashboardSummary, ("day", today))
+
+
+def _increment(db: Session, today: date, **deltas) -> None:
+    # Add the given deltas to today's day row and to the current month row
+    for period, start in (("day", today), ("month", month_start(today).date())):
+        values = {name: getattr(DashboardSummary, name) + delta for name, delta in deltas.items() if delta}
+        if values:
+            db.execute(
+                update(DashboardSummary)
+                .where(DashboardSummary.period == period, DashboardSummary.period_start == start)
+                .values(updated_at=datetime.now(), **values)
+            )
+
+
+def _classify(end_date: Optional[date], today: date) -> Tuple[int, int, int]:
+    # (counted, expired, upcoming) contribution of a member with this end_date
+    if end_date is None:
+        return 0, 0, 0
+    expired = int(end_date < today)
+    upcoming = int(today <= end_date <= today + timedelta(days=UPCOMING_DAYS))
+    return 1, expired, upcoming
+
+
+def record_member_change(db: Session, old_end_date: Optional[date], new_end_date: Optional[date]) -> None:
+    """
+    Apply a member create, update or delete to the summary rows.
+
+    Args:
+        db (Session): Session holding the member change; the summary update joins its transaction.
+        old_end_date (Optional[date]): end_date before the change (None when creating).
+        new_end_date (Optional[date]): end_date after the change (None when deleting).
+    """
+    record_member_changes(db, [(old_end_date, new_end_date)])
+
+
+def record_members_added(db: Session, end_dates: List[date]) -> None:
+    """
+    Apply a batch of newly inserted members to the summary rows in one update.
+
+    Args:
+        db (Session): Session holding the inserts; the summary update joins its transaction.
+        end_dates (List[date]): end_date of every inserted member.
+    """
+    record_member_changes(db, [(None, end_date) for end_date in end_dates])
+
+
+def record_member_changes(db: Session, changes: List[Tuple[Optional[date], Optional[date]]]) -> None:
+    """
+    Apply a batch of member end_date changes to the summary rows in one update.
+
+    Args:
+        db (Session): Session holding the changes; the summary update joins its transaction.
+        changes (List[Tuple[Optional[date], Optional[date]]]): (old end_date, new end_date) per member,
+            with None for "did not exist" / "no longer exists".
+    """
+    today = datetime.now().date()
+    ensure_summary(db, today)
+
+    deltas = [0, 0, 0]
+    for old_end_date, new_end_date in changes:
+        old = _classify(old_end_date, today)
+        new = _classify(new_end_date, today)
+        for i in range(3):
+            deltas[i] += new[i] - old[i]
+    _increment(
+        db,
+        today,
+        total_members=deltas[0],
+        expired_members=deltas[1],
+        upcoming_renewals=deltas[2],
+    )
+
+
+def record_payment(db: Session, amount: Decimal) -> None:
+    """
+    Add a new payment to today's and this month's revenue.
+
+    Args:
+        db (Session): Session holding the new payment; the summary update joins its transaction.
+        amount (Decimal): Amount of the payment.
+    """
+    record_payments(db, [amount])
+
+
+def record_payments(db: Session, amounts: List[Decimal]) -> None:
+    """
+    Add a batch of new payments to today's and this month's revenue in one update.
+
+    Args:
+        db (Session): Session holding the new payments; the summary update joins its transaction.
+        amounts (List[Decimal]): Amount of every payment.
+    """
+    today = datetime.now().date()
+    ensure_summary(db, today)
+    total = sum(amounts, Decimal(0))
+    _increment(db, today, revenue=total, month_revenue=total, payment_count=len(amounts))
+
+
+def rebuild_summary(db: Session, today: date) -> Dict[str, Dict[str, object]]:
+    """
+    Recompute today's day and month rows from the base tables and store them.
+
+    Used by the nightly job to start each day with exact counters and to
+    correct any drift. Returns the fields that differed from the stored rows.
+
+    Args:
+        db (Session): SQLAlchemy database session used to perform queries.
+        today (date): Day to rebuild.
+
+    Returns:
+        Dict[str, Dict[str, object]]: Per period, the fields that were corrected as (old, new).
+    """
+    day, month = _build_rows(db, today)
+    drift = {}
+    for period, start, values in (("day", today, day), ("month", month_start(today).date(), month)):
+        row = db.get(DashboardSummary, (period, start))
+        if row is None:
+            db.add(DashboardSummary(period=period, period_start=start, **values))
+            continue
+        changed = {}
+        for name, value in values.items():
+            if getattr(row, name) != value:
+                changed[name] = (getattr(row, name), value)
+                setattr(row, name, value)
+        if changed:
+            drift[period] = changed
+    if drift:
+        bump_version(db, "dashboard_summary")
+    db.commit()
+    return drift
+
+
+def summary_to_stats(row: DashboardSummary) -> Dict[str, object]:
+    # Shape a day row like the dashboard response
+    return {
+        "Total_Members": row.total_members,
+        "Active_Members": row.total_members - row.expired_members,
+        "Total_Payments": row.month_revenue,
+        "Upcoming_Renewals": row.upcoming_renewals,
+        "Expired_Membership": row.expired_members,
+    }
@@ -0,0 +1,48 @@
+# backend/app/utils/versions.py
+
+from sqlalchemy import select, update  # SQL expression helpers
+from sqlalchemy.exc import IntegrityError  # Raised when two requests create the same counter
+from sqlalchemy.orm import Session  # To work with database sessions
+from datetime import datetime  # To timestamp version bumps
+from typing import Dict, Iterable  # For type hints
+
+from app.models.table_version import TableVersion  # The change counters table
+
+
+def bump_version(db: Session, name: str) -> None:
+    """
+    Increment the change counter of a table inside the caller's transaction.
+
+    Call this next to every write to the table, before commit, so the new
+    version becomes visible to other workers together with the change itself.
+
+    Args:
+        db (Session): Session holding the change; the counter update joins its transaction.
+        name (str): Name of the versioned table.
+    """
+    result = db.execute(
+        update(TableVersion)
+        .where(TableVersion.name == name)
+        .values(version=TableVersion.version + 1, updated_at=datetime.now())
+    )
+    if result.rowcount:
+        return
+    try:
+        # First change ever: create the counter, unless another request just did
+        with db.begin_nested():
+            db.add(TableVersion(name=name, version=1))
+    except IntegrityError:
+        db.execute(
+            update(TableVersion)
+            .where(TableVersion.name == name)
+            .values(version=TableVersion.version + 1, updated_at=datetime.now())
+        )
+
+
+def get_versions(db: Session, names: Iterable[str]) -> Dict[str, int]:
+    # Current counter of every named table (0 for tables that never changed)
+    names = list(names)
+    rows = db.execute(select(TableVersion.name, TableVersion.version).where(TableVersion.name.in_(names))).all()
+    versions = dict.fromkeys(names, 0)
+    versions.update({name: version for name, version in rows})
+    return versions
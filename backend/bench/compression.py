@@ -0,0 +1,98 @@
+# bench/compression.py
+#
+# Bytes saved and CPU spent by response compression on realistic payloads:
+# pages of the member, payment and expired-renewal lists (as produced by the
+# orjson fast path) and a CSV export chunk.
+#
+#   python bench/compression.py [rows per page]
+#
+# Brotli rows are only shown when the optional "brotli" package is installed.
+
+import csv  # For the export chunk
+import io  # In-memory buffer for the CSV chunk
+import os  # For the import path
+import random  # For generating test data
+import sys  # For command line arguments and import path
+import time  # For timing
+from datetime import date, datetime, timedelta  # For generating dates
+from decimal import Decimal  # Payment amounts
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.schemas.member import MemberOut  # noqa: E402
+from app.schemas.payment import PaymentOut  # noqa: E402
+from app.utils.compression import BrotliEncoder, GzipEncoder, brotli  # noqa: E402
+from app.utils.fast_json import FastJSONResponse  # noqa: E402
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+REPEAT = 20
+
+rng = random.Random(0)
+today = date.today()
+FIRST = ["Aarav", "Vivaan", "Aditya", "Diya", "Ananya", "Ishaan", "Meera", "Kabir", "Saanvi", "Rohan"]
+LAST = ["Sharma", "Patel", "Reddy", "Iyer", "Nair", "Gupta", "Khan", "Das", "Joshi", "Mehta"]
+PLANS = ["Monthly", "Quarterly", "Half-Yearly", "Yearly"]
+
+
+def member(i, end_date):
+    name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+    return {
+        "id": i, "name": name, "phone": f"9{rng.randint(0, 999_999_999):09d}",
+        "email": f"{name.lower().replace(' ', '.')}{i}@example.com" if rng.random() < 0.7 else None,
+        "plan_type": rng.choice(PLANS), "start_date": end_date - timedelta(days=30), "end_date": end_date,
+        "notes": "Prefers morning slots" if rng.random() < 0.2 else None,
+    }
+
+
+def payloads():
+    members = [member(i, today + timedelta(days=rng.randint(-30, 60))) for i in range(1, ROWS + 1)]
+    expired = [member(i, today - timedelta(days=rng.randint(1, 90))) for i in range(1, ROWS + 1)]
+    payments = [
+        {
+            "id": i, "member_id": rng.randint(1, 5000), "plan_type": rng.choice(PLANS),
+            "amount": Decimal(rng.choice(["999.00", "2699.00", "4999.00", "8999.00"])),
+            "method": rng.choice(["Cash", "UPI", "Card"]),
+            "date": datetime.now() - timedelta(minutes=rng.randint(0, 60 * 24 * 90)),
+            "notes": None,
+        }
+        for i in range(1, ROWS + 1)
+    ]
+    assert set(members[0]) == set(MemberOut.model_fields) and set(payments[0]) == set(PaymentOut.model_fields)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(list(payments[0]))
+    writer.writerows(row.values() for row in payments)
+
+    page = lambda items: FastJSONResponse({"items": items, "next_cursor": "eyJzIjoiaWQiLCJ2IjpbNTAwXX0", "total": None}).body
+    return {
+        "/api/members": page(members),
+        "/api/payments": page(payments),
+        "/api/renewals/exp": page(expired),
+        "payments export (csv)": buffer.getvalue().encode(),
+    }
+
+
+def measure(make_encoder, body):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        out = make_encoder().finish(body)
+        best = min(best, time.perf_counter() - start)
+    return len(out), best
+
+
+if __name__ == "__main__":
+    encoders = [(f"gzip-{level}", lambda level=level: GzipEncoder(level)) for level in (1, 6, 9)]
+    if brotli is not None:
+        encoders += [(f"br-{quality}", lambda quality=quality: BrotliEncoder(quality)) for quality in (4, 11)]
+
+    print(f"{ROWS} rows per payload, best of {REPEAT}")
+    print(f"{'payload':<24} {'encoder':<8} {'raw KiB':>8} {'out KiB':>8} {'saved':>6} {'CPU ms':>7} {'MiB/s':>7}")
+    for name, body in payloads().items():
+        for label, make_encoder in encoders:
+            size, seconds = measure(make_encoder, body)
+            print(
+                f"{name:<24} {label:<8} {len(body) / 1024:>8.1f} {size / 1024:>8.1f}"
+                f" {1 - size / len(body):>6.0%} {seconds * 1000:>7.2f} {len(body) / seconds / 2**20:>7.0f}"
+            )
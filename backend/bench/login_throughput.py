@@ -0,0 +1,64 @@
+# bench/login_throughput.py
+#
+# Password verifications per second through the bounded bcrypt executor at
+# different cost factors, and how many of a burst of logins are admitted.
+#
+#   python bench/login_throughput.py [burst]
+#
+# Each cost factor runs in a fresh interpreter because BCRYPT_ROUNDS,
+# HASH_WORKERS and HASH_QUEUE_LIMIT are read at import time.
+
+import asyncio  # To submit a burst of concurrent verifications
+import os  # For environment variables
+import subprocess  # To run each configuration in its own interpreter
+import sys  # For command line arguments and import path
+import time  # For timing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROUNDS = (10, 11, 12, 13)
+BURST = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+
+
+async def run_burst():
+    from app.auth import password_handler as ph
+
+    hashed = ph.hash_password("correct horse battery staple")
+
+    async def one():
+        try:
+            return await ph.verify_password_async("correct horse battery staple", hashed)
+        except ph.HashingPoolFull:
+            return None
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(BURST)))
+    elapsed = time.perf_counter() - start
+
+    admitted = sum(1 for r in results if r is not None)
+    rejected = BURST - admitted
+    print(
+        f"rounds={ph.BCRYPT_ROUNDS:2d} workers={ph.HASH_WORKERS} queue={ph.HASH_QUEUE_LIMIT:3d}  "
+        f"admitted={admitted:3d} rejected={rejected:3d}  "
+        f"{admitted / elapsed:7.1f} verifies/s  "
+        f"{elapsed / max(admitted, 1) * 1000:7.1f} ms/verify amortized  "
+        f"burst drained in {elapsed * 1000:7.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    if os.getenv("_BENCH_CHILD"):
+        asyncio.run(run_burst())
+    else:
+        workers = os.getenv("HASH_WORKERS", str(min(4, os.cpu_count() or 1)))
+        for rounds in ROUNDS:
+            for queue in (BURST, 16):
+                env = dict(
+                    os.environ,
+                    _BENCH_CHILD="1",
+                    BCRYPT_ROUNDS=str(rounds),
+                    HASH_WORKERS=workers,
+                    HASH_QUEUE_LIMIT=str(queue),
+                    DATABASE_URL=os.getenv("DATABASE_URL", "sqlite://"),
+                )
+                subprocess.run([sys.executable, __file__, str(BURST)], env=env, check=True)
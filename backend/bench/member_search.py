@@ -0,0 +1,79 @@
+# bench/member_search.py
+#
+# Latency of member search lookups (GET /api/members/search) on a large table.
+#
+# Uses a throwaway SQLite database unless BENCH_DATABASE_URL is set:
+#   python bench/member_search.py [members]
+#
+# WARNING: with BENCH_DATABASE_URL the members table is emptied.
+
+import os  # For environment variables and temp paths
+import random  # For generating test data
+import statistics  # For percentiles
+import sys  # For command line arguments and import path
+import tempfile  # For the throwaway database file
+import time  # For timing queries
+from datetime import date, timedelta  # For generating dates
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# app.database reads DATABASE_URL at import time, so point it at the bench database first
+DB_URL = os.getenv("BENCH_DATABASE_URL") or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+os.environ["DATABASE_URL"] = DB_URL
+
+from sqlalchemy import create_engine  # noqa: E402
+
+from app.migrations import run_migrations  # noqa: E402
+from app.models.member import Member, normalize_phone  # noqa: E402
+from app.schemas.member import MemberOut  # noqa: E402
+from app.utils.fast_json import field_columns  # noqa: E402
+from app.utils.search import member_search_query, parse_terms  # noqa: E402
+
+N_MEMBERS = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+REPEAT = 50
+BATCH = 20_000
+
+FIRST = ["Aarav", "Vivaan", "Aditya", "Diya", "Ananya", "Ishaan", "Meera", "Kabir", "Saanvi", "Rohan",
+         "Arjun", "Priya", "Neha", "Rahul", "Sneha", "Vikram", "Pooja", "Karan", "Anjali", "Ravi"]
+LAST = ["Sharma", "Patel", "Reddy", "Iyer", "Nair", "Gupta", "Khan", "Das", "Joshi", "Mehta",
+        "Kapoor", "Singh", "Rao", "Menon", "Bose", "Chopra", "Malhotra", "Pillai", "Verma", "Agarwal"]
+
+QUERIES = ["ravi", "sharma", "priya nair", "98765", "43210", "kapoor 123", "gmail", "zzzqx"]
+
+engine = create_engine(DB_URL)
+
+
+def seed():
+    run_migrations(engine)
+    rng = random.Random(0)
+    today = date.today()
+    with engine.begin() as conn:
+        conn.execute(Member.__table__.delete())
+        for start in range(1, N_MEMBERS + 1, BATCH):
+            rows = []
+            for i in range(start, min(start + BATCH, N_MEMBERS + 1)):
+                first, last = rng.choice(FIRST), rng.choice(LAST)
+                phone = f"+91 9{rng.randint(0, 9999):04d}-{rng.randint(0, 99999):05d}"
+                rows.append({
+                    "id": i, "name": f"{first} {last}", "phone": phone, "phone_digits": normalize_phone(phone),
+                    "email": f"{first.lower()}.{last.lower()}{i}@{rng.choice(['gmail.com', 'yahoo.in', 'outlook.com'])}",
+                    "plan_type": "Monthly", "start_date": today, "end_date": today + timedelta(days=30),
+                })
+            conn.execute(Member.__table__.insert(), rows)
+
+
+if __name__ == "__main__":
+    seed()
+    columns = field_columns(Member, list(MemberOut.model_fields))
+    print(f"{N_MEMBERS} members on {engine.dialect.name}, {REPEAT} runs, limit 20")
+    print(f"{'query':<14} {'hits':>5} {'p50 ms':>8} {'p95 ms':>8}")
+    with engine.connect() as conn:
+        for q in QUERIES:
+            stmt = member_search_query(engine.dialect.name, parse_terms(q), columns, 20)
+            timings = []
+            for _ in range(REPEAT):
+                start = time.perf_counter()
+                hits = len(conn.execute(stmt).all())
+                timings.append((time.perf_counter() - start) * 1000)
+            timings.sort()
+            print(f"{q:<14} {hits:>5} {statistics.median(timings):>8.2f} {timings[int(REPEAT * 0.95) - 1]:>8.2f}")
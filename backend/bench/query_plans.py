@@ -0,0 +1,108 @@
+# bench/query_plans.py
+#
+# Show the query plans and timings of the hot filter queries before and after
+# migration 0003 (indexes on members.end_date, payments(member_id, date DESC)
+# and payments.date).
+#
+# Uses a throwaway SQLite database unless BENCH_DATABASE_URL is set:
+#   python bench/query_plans.py [members] [payments]
+#
+# WARNING: with BENCH_DATABASE_URL the members and payments tables are emptied.
+
+import os  # For environment variables and temp paths
+import random  # For generating test data
+import sys  # For command line arguments and import path
+import tempfile  # For the throwaway database file
+import time  # For timing queries
+from datetime import date, datetime, timedelta  # For generating dates
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# app.database reads DATABASE_URL at import time, so point it at the bench database first
+DB_URL = os.getenv("BENCH_DATABASE_URL") or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+os.environ["DATABASE_URL"] = DB_URL
+
+from sqlalchemy import create_engine, func, select, text  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.models import admin, member, payment, plan, gym_info, dashboard_summary  # noqa: E402,F401
+from app.models.member import Member  # noqa: E402
+from app.models.payment import Payment  # noqa: E402
+from app.migrations import m0003_hot_filter_indexes  # noqa: E402
+
+N_MEMBERS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+N_PAYMENTS = int(sys.argv[2]) if len(sys.argv) > 2 else 300_000
+REPEAT = 20
+
+today = date.today()
+engine = create_engine(DB_URL)
+
+QUERIES = {
+    "renewals in next 7 days": select(Member.id).where(
+        Member.end_date >= today, Member.end_date <= today + timedelta(days=7)
+    ).order_by(Member.end_date),
+    "payments of one member, newest first": select(Payment.id).where(
+        Payment.member_id == 42
+    ).order_by(Payment.date.desc()),
+    "revenue this month": select(func.sum(Payment.amount)).where(
+        Payment.date >= datetime(today.year, today.month, 1)
+    ),
+}
+
+
+def seed():
+    # Create the tables as they were before migration 0003 and fill them
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(Payment.__table__.delete())
+        conn.execute(Member.__table__.delete())
+        for name in m0003_hot_filter_indexes.INDEX_NAMES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+        rng = random.Random(0)
+        conn.execute(Member.__table__.insert(), [
+            {
+                "id": i, "name": f"Member {i}", "phone": f"9{i:09d}", "plan_type": "Monthly",
+                "start_date": today - timedelta(days=400),
+                "end_date": today + timedelta(days=rng.randint(-1000, 60)),
+            }
+            for i in range(1, N_MEMBERS + 1)
+        ])
+        conn.execute(Payment.__table__.insert(), [
+            {
+                "member_id": rng.randint(1, N_MEMBERS), "plan_type": "Monthly", "amount": 999,
+                "method": "Cash", "date": datetime.now() - timedelta(minutes=rng.randint(0, 3 * 365 * 24 * 60)),
+            }
+            for _ in range(N_PAYMENTS)
+        ])
+
+
+def explain(conn, stmt):
+    # Render the dialect's plan for a statement with its parameters inlined
+    sql = str(stmt.compile(engine, compile_kwargs={"literal_binds": True}))
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    return [" ".join(str(c) for c in row) for row in conn.execute(text(prefix + sql))]
+
+
+def report(label):
+    print(f"\n=== {label} ===")
+    with engine.connect() as conn:
+        # Refresh planner statistics so the new indexes are considered
+        conn.execute(text("ANALYZE"))
+        for name, stmt in QUERIES.items():
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                conn.execute(stmt).all()
+            elapsed = (time.perf_counter() - start) / REPEAT * 1000
+            print(f"\n{name}: {elapsed:.2f} ms")
+            for line in explain(conn, stmt):
+                print(f"    {line}")
+
+
+if __name__ == "__main__":
+    print(f"Seeding {N_MEMBERS} members and {N_PAYMENTS} payments into {engine.url.render_as_string()}")
+    seed()
+    report("before migration 0003")
+    with engine.begin() as conn:
+        m0003_hot_filter_indexes.upgrade(conn)
+    report("after migration 0003")
@@ -0,0 +1,125 @@
+# bench/serialization.py
+#
+# Cost of turning 10k member and payment rows into a JSON response body,
+# before and after the list endpoints' fast path.
+#
+#   before: ORM entities -> response_model validation (orm_mode) -> dict -> json
+#   after:  column tuples -> dicts -> orjson (FastJSONResponse)
+#
+# Uses a throwaway SQLite database:
+#   python bench/serialization.py [rows]
+
+import asyncio  # FastAPI's serialize_response is a coroutine
+import json  # To compare both payloads
+import os  # For environment variables and temp paths
+import sys  # For command line arguments and import path
+import tempfile  # For the throwaway database file
+import time  # For timing
+from datetime import date, datetime, timedelta  # For generating dates
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# app.database reads DATABASE_URL at import time, so point it at the bench database first
+DB_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+os.environ["DATABASE_URL"] = DB_URL
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.models import admin, member, payment, plan, gym_info, dashboard_summary  # noqa: E402,F401
+from app.models.member import Member  # noqa: E402
+from app.models.payment import Payment  # noqa: E402
+from app.schemas.member import MemberOut, MemberPage  # noqa: E402
+from app.schemas.payment import PaymentOut, PaymentPage  # noqa: E402
+from app.utils.fast_json import FastJSONResponse, schema_columns, rows_to_dicts  # noqa: E402
+
+N_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+REPEAT = 5
+
+engine = create_engine(DB_URL)
+
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    today = date.today()
+    with engine.begin() as conn:
+        conn.execute(Member.__table__.insert(), [
+            {
+                "id": i, "name": f"Member {i}", "phone": f"9{i:09d}", "email": f"m{i}@example.com",
+                "plan_type": "Monthly", "start_date": today - timedelta(days=30),
+                "end_date": today + timedelta(days=i % 60), "notes": None,
+            }
+            for i in range(1, N_ROWS + 1)
+        ])
+        conn.execute(Payment.__table__.insert(), [
+            {
+                "member_id": i, "plan_type": "Monthly", "amount": 999,
+                "method": "Cash", "date": datetime.now() - timedelta(minutes=i), "notes": "renewal",
+            }
+            for i in range(1, N_ROWS + 1)
+        ])
+
+
+def before(model, page):
+    # What FastAPI does for a dict of ORM entities with response_model=page
+    field = create_response_field(name="response", type_=page, mode="serialization")
+    with Session(engine) as db:
+        entities = db.execute(select(model).order_by(model.id)).scalars().all()
+        start = time.perf_counter()
+        content = asyncio.run(serialize_response(field=field, response_content={"items": entities, "next_cursor": None, "total": None}))
+        body = JSONResponse(content).body
+        return time.perf_counter() - start, body
+
+
+def after(model, schema):
+    # The fast path used by the list endpoints
+    columns = schema_columns(model, schema)
+    names = [column.key for column in columns]
+    with Session(engine) as db:
+        rows = db.execute(select(*columns).order_by(model.id)).all()
+        start = time.perf_counter()
+        body = FastJSONResponse({"items": rows_to_dicts(rows, names), "next_cursor": None, "total": None}).body
+        return time.perf_counter() - start, body
+
+
+def fetch(model, columns):
+    # Time to load the rows themselves: ORM entities vs column tuples
+    with Session(engine) as db:
+        start = time.perf_counter()
+        if columns:
+            db.execute(select(*schema_columns(model, columns)).order_by(model.id)).all()
+        else:
+            db.execute(select(model).order_by(model.id)).scalars().all()
+        return time.perf_counter() - start
+
+
+def best(fn, *args):
+    return min(fn(*args)[0] for _ in range(REPEAT))
+
+
+if __name__ == "__main__":
+    seed()
+    per = 10_000 / N_ROWS
+    print(f"{N_ROWS} rows, best of {REPEAT}, ms per 10k rows")
+    print(f"{'':<10} {'fetch before':>13} {'fetch after':>12} {'encode before':>14} {'encode after':>13} {'speedup':>8}")
+    for name, model, schema, page in (
+        ("members", Member, MemberOut, MemberPage),
+        ("payments", Payment, PaymentOut, PaymentPage),
+    ):
+        _, old_body = before(model, page)
+        _, new_body = after(model, schema)
+        # Both paths must produce the same payload
+        assert json.loads(old_body) == json.loads(new_body), name
+
+        fetch_before = min(fetch(model, None) for _ in range(REPEAT)) * per * 1000
+        fetch_after = min(fetch(model, schema) for _ in range(REPEAT)) * per * 1000
+        encode_before = best(before, model, page) * per * 1000
+        encode_after = best(after, model, schema) * per * 1000
+        print(
+            f"{name:<10} {fetch_before:>13.1f} {fetch_after:>12.1f} {encode_before:>14.1f} {encode_after:>13.1f}"
+            f" {(fetch_before + encode_before) / (fetch_after + encode_after):>7.1f}x"
+        )
@@ -0,0 +1,21 @@
+# migrate.py
+#
+# Apply pending schema migrations, or list them with --status:
+#   python migrate.py
+#   python migrate.py --status
+
+import sys  # To read command line arguments
+
+from app.database import engine
+from app.migrations import MIGRATIONS, applied_versions, run_migrations
+
+
+if __name__ == "__main__":
+    if "--status" in sys.argv:
+        done = set(applied_versions(engine))
+        for migration in MIGRATIONS:
+            state = "applied" if migration.VERSION in done else "pending"
+            print(f"{migration.VERSION:04d}  {state:8}  {migration.DESCRIPTION}")
+    else:
+        applied = run_migrations(engine)
+        print(f"Applied migrations: {applied}" if applied else "Database is up to date")
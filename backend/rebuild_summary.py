@@ -0,0 +1,27 @@
+# rebuild_summary.py
+#
+# Nightly job: rebuild today's dashboard_summary rows from the base tables.
+# Schedule it shortly after midnight, e.g. with cron:
+#   5 0 * * * cd /path/to/backend && python rebuild_summary.py
+
+from datetime import datetime  # To find today's date
+
+# Import the session factory and the rollup helpers
+from app.database import SessionLocal
+from app.models import admin, member, payment, plan, gym_info, dashboard_summary  # Import all models
+from app.utils.summary import rebuild_summary
+
+
+if __name__ == "__main__":
+    db = SessionLocal()
+    try:
+        today = datetime.now().date()
+        drift = rebuild_summary(db, today)
+
+        # Report any counters the incremental updates got wrong
+        if drift:
+            print(f"dashboard_summary for {today} corrected: {drift}")
+        else:
+            print(f"dashboard_summary for {today} is up to date")
+    finally:
+        db.close()
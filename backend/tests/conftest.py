@@ -0,0 +1,71 @@
+# backend/tests/conftest.py
+#
+# Shared fixtures: every test session runs against a throwaway SQLite database
+# (the engines read DATABASE_URL at import time, so it is set before importing the app),
+# and every test starts from empty tables and cold in-process caches.
+
+import os
+import tempfile
+from decimal import Decimal
+
+_db_dir = tempfile.mkdtemp(prefix="gym-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app  # Runs the migrations on the test database
+from app.auth.jwt_handler import clear_token_cache, create_access_token
+from app.database import Base, SessionLocal, engine
+from app.models.plan import Plan
+from app.routes import renewal
+from app.utils.plan_catalog import invalidate_plan_catalog
+from app.utils.versions import bump_version
+
+
+@pytest.fixture(autouse=True)
+def clean_database():
+    # Empty every table (children first) and drop cached copies of their contents
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+    invalidate_plan_catalog()
+    renewal._calendar_cache.clear()
+    clear_token_cache()
+    yield
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def monthly_plan(db):
+    # The plan most tests put members on (member and payment writes reject unknown plans)
+    plan = Plan(name="Monthly", price=Decimal("1000.00"), duration=30)
+    db.add(plan)
+    bump_version(db, "plans")
+    db.commit()
+    return plan
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def auth_headers():
+    return {"Authorization": "Bearer " + create_access_token({"sub": "admin"})}
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
@@ -0,0 +1,97 @@
+# backend/tests/test_batch_renewal.py
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.models.member import Member
+from app.models.payment import Payment
+from app.models.plan import Plan
+from app.utils.summary import rebuild_summary
+from app.utils.versions import bump_version
+
+
+@pytest.fixture
+def members(client, auth_headers, db, monthly_plan):
+    db.add(Plan(name="Quarterly", price=Decimal("2700.00"), duration=90))
+    bump_version(db, "plans")
+    db.commit()
+
+    today = date.today()
+    ids = {}
+    for key, start, end in (
+        ("upcoming", today - timedelta(days=27), today + timedelta(days=3)),   # Renewal due this week
+        ("lapsed", today - timedelta(days=40), today - timedelta(days=10)),    # Already expired
+        ("other", today - timedelta(days=5), today + timedelta(days=25)),      # Not part of the batch
+    ):
+        ids[key] = client.post("/api/members/", headers=auth_headers, json={
+            "name": key.title(), "phone": "9876500700", "plan_type": "Monthly",
+            "start_date": str(start), "end_date": str(end),
+        }).json()["id"]
+    return ids
+
+
+def _renew(client, auth_headers, *items):
+    return client.post("/api/renewals/batch", headers=auth_headers, json={"items": list(items)})
+
+
+def test_batch_updates_members_and_inserts_payments(client, auth_headers, db, members):
+    today = date.today()
+    response = _renew(
+        client, auth_headers,
+        {"member_id": members["upcoming"], "plan_type": "Monthly", "method": "Cash"},
+        {"member_id": members["lapsed"], "plan_type": "Quarterly", "method": "UPI", "amount": "2500", "notes": "promo"},
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["renewed"] == 2
+
+    # Active members are extended from their end date; lapsed ones restart today
+    upcoming = db.get(Member, members["upcoming"])
+    lapsed = db.get(Member, members["lapsed"])
+    assert (upcoming.start_date, upcoming.end_date) == (today - timedelta(days=27), today + timedelta(days=33))
+    assert (lapsed.start_date, lapsed.end_date, lapsed.plan_type) == (today, today + timedelta(days=90), "Quarterly")
+    assert [Decimal(result["amount"]) for result in body["results"]] == [Decimal("1000.00"), Decimal("2500")]
+
+    payments = {payment.member_id: payment for payment in db.query(Payment)}
+    assert set(payments) == {members["upcoming"], members["lapsed"]}
+    assert (payments[members["upcoming"]].amount, payments[members["upcoming"]].method) == (Decimal("1000.00"), "Cash")
+    assert (payments[members["lapsed"]].amount, payments[members["lapsed"]].notes) == (Decimal("2500.00"), "promo")
+    assert db.get(Member, members["other"]).end_date == today + timedelta(days=25)
+
+
+def test_batch_keeps_the_dashboard_summary_in_step(client, auth_headers, db, members):
+    before = client.get("/api/dashboard/", headers=auth_headers).json()
+    assert (before["Upcoming_Renewals"], before["Expired_Membership"]) == (1, 1)
+
+    _renew(
+        client, auth_headers,
+        {"member_id": members["upcoming"], "plan_type": "Monthly", "method": "Cash"},
+        {"member_id": members["lapsed"], "plan_type": "Quarterly", "method": "UPI"},
+    )
+
+    after = client.get("/api/dashboard/", headers=auth_headers).json()
+    assert after["Total_Members"] == 3
+    assert (after["Upcoming_Renewals"], after["Expired_Membership"], after["Active_Members"]) == (0, 0, 3)
+    assert Decimal(str(after["Total_Payments"])) == Decimal("3700.00")
+    assert rebuild_summary(db, date.today()) == {}
+
+
+def test_invalid_batches_write_nothing(client, auth_headers, db, members):
+    upcoming = {"member_id": members["upcoming"], "plan_type": "Monthly", "method": "Cash"}
+
+    response = _renew(client, auth_headers, upcoming, {**upcoming, "method": "UPI"})
+    assert response.status_code == 400
+
+    response = _renew(client, auth_headers, upcoming, {"member_id": members["lapsed"], "plan_type": "Lifetime", "method": "Cash"})
+    assert (response.status_code, response.json()["detail"]) == (404, "Plan not found: Lifetime")
+
+    response = _renew(client, auth_headers, upcoming, {"member_id": 999999, "plan_type": "Monthly", "method": "Cash"})
+    assert (response.status_code, response.json()["detail"]) == (404, "Member not found: 999999")
+
+    assert _renew(client, auth_headers).json() == {"renewed": 0, "results": []}
+
+    db.expire_all()
+    assert db.query(Payment).count() == 0
+    assert db.get(Member, members["upcoming"]).end_date == date.today() + timedelta(days=3)
@@ -0,0 +1,83 @@
+# backend/tests/test_dashboard_summary.py
+
+import runpy
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from sqlalchemy import update
+
+from app.models.dashboard_summary import DashboardSummary
+from app.utils.stats import compute_dashboard_stats
+from app.utils.summary import rebuild_summary, summary_to_stats
+
+REBUILD_SCRIPT = Path(__file__).resolve().parents[1] / "rebuild_summary.py"
+
+
+def _member(client, auth_headers, name, end_in_days):
+    today = date.today()
+    response = client.post("/api/members/", headers=auth_headers, json={
+        "name": name, "phone": "9876500600", "plan_type": "Monthly",
+        "start_date": str(today - timedelta(days=30)), "end_date": str(today + timedelta(days=end_in_days)),
+    })
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def _stored(db, period="day"):
+    db.expire_all()
+    start = date.today() if period == "day" else date.today().replace(day=1)
+    return db.get(DashboardSummary, (period, start))
+
+
+def test_rollup_follows_member_and_payment_writes(client, auth_headers, db, monthly_plan):
+    active = _member(client, auth_headers, "Active One", 30)
+    upcoming = _member(client, auth_headers, "Upcoming One", 3)
+    expired = _member(client, auth_headers, "Expired One", -5)
+    leaving = _member(client, auth_headers, "Leaving One", 2)
+
+    # Upcoming -> expired, expired -> active, and one member removed
+    client.put(f"/api/members/{upcoming}", headers=auth_headers, json={"end_date": str(date.today() - timedelta(days=1))})
+    client.put(f"/api/members/{expired}", headers=auth_headers, json={"end_date": str(date.today() + timedelta(days=60))})
+    assert client.delete(f"/api/members/{leaving}", headers=auth_headers).status_code == 204
+
+    for member_id, amount in ((active, "1000"), (expired, "1200.50")):
+        response = client.post("/api/payments/", headers=auth_headers, json={
+            "member_id": member_id, "plan_type": "Monthly", "amount": amount, "method": "Cash",
+        })
+        assert response.status_code == 201
+
+    stats = client.get("/api/dashboard/", headers=auth_headers).json()
+    assert stats["Total_Members"] == 3
+    assert stats["Expired_Membership"] == 1
+    assert stats["Upcoming_Renewals"] == 0
+    assert stats["Active_Members"] == 2
+    assert Decimal(str(stats["Total_Payments"])) == Decimal("2200.50")
+
+    day = _stored(db)
+    assert (day.revenue, day.payment_count) == (Decimal("2200.50"), 2)
+    assert summary_to_stats(day) == compute_dashboard_stats(db, date.today())
+
+    # The incremental updates left nothing for a full rebuild to correct
+    assert rebuild_summary(db, date.today()) == {}
+
+
+def test_rebuild_script_corrects_drift(client, auth_headers, db, monthly_plan, capsys):
+    _member(client, auth_headers, "Drift One", 30)
+    _member(client, auth_headers, "Drift Two", 1)
+
+    # Simulate a lost increment on both rows
+    db.execute(update(DashboardSummary).values(total_members=7, upcoming_renewals=0))
+    db.commit()
+    assert client.get("/api/dashboard/", headers=auth_headers).json()["Total_Members"] == 7
+
+    runpy.run_path(str(REBUILD_SCRIPT), run_name="__main__")
+    assert "corrected" in capsys.readouterr().out
+
+    for period in ("day", "month"):
+        row = _stored(db, period)
+        assert (row.total_members, row.upcoming_renewals) == (2, 1), period
+    assert client.get("/api/dashboard/", headers=auth_headers).json()["Total_Members"] == 2
+
+    runpy.run_path(str(REBUILD_SCRIPT), run_name="__main__")
+    assert "is up to date" in capsys.readouterr().out
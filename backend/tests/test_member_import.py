@@ -0,0 +1,60 @@
+# backend/tests/test_member_import.py
+
+from datetime import date, timedelta
+
+from app.models.dashboard_summary import DashboardSummary
+from app.models.member import Member
+from app.utils.summary import rebuild_summary
+
+
+def _csv(*rows):
+    header = "name,phone,email,plan_type,start_date,end_date,notes\n"
+    return header + "".join(",".join(row) + "\n" for row in rows)
+
+
+def test_import_into_empty_day_counts_each_member_once(client, auth_headers, db, monthly_plan):
+    today = date.today()
+    body = _csv(
+        ("Asha Rao", "9876500001", "asha@example.com", "Monthly", str(today), str(today + timedelta(days=30)), ""),
+        ("Ben Lee", "9876500002", "", "Monthly", str(today - timedelta(days=60)), str(today - timedelta(days=30)), ""),
+        ("Cara Diaz", "9876500003", "", "Monthly", str(today), str(today + timedelta(days=3)), ""),
+    )
+    response = client.post("/api/members/import", content=body, headers={**auth_headers, "Content-Type": "text/csv"})
+    assert response.status_code == 200
+    assert response.json()["inserted"] == 3
+
+    stats = client.get("/api/dashboard/", headers=auth_headers).json()
+    assert stats["Total_Members"] == 3
+    assert stats["Expired_Membership"] == 1
+    assert stats["Upcoming_Renewals"] == 1
+    assert stats["Active_Members"] == 2
+
+    # Both rollup rows agree with a full recomputation
+    assert db.query(Member).count() == 3
+    assert {row.period: row.total_members for row in db.query(DashboardSummary)} == {"day": 3, "month": 3}
+    assert rebuild_summary(db, today) == {}
+
+
+def test_import_after_summary_exists_adds_to_it(client, auth_headers, monthly_plan):
+    today = date.today()
+    client.post("/api/members/", headers=auth_headers, json={
+        "name": "First Member", "phone": "9876500000", "plan_type": "Monthly",
+        "start_date": str(today), "end_date": str(today + timedelta(days=30)),
+    })
+    body = _csv(
+        ("Dev Patel", "9876500004", "", "Monthly", str(today), str(today + timedelta(days=30)), ""),
+        ("Ela Roy", "9876500005", "", "Monthly", str(today), str(today + timedelta(days=30)), ""),
+    )
+    client.post("/api/members/import", content=body, headers={**auth_headers, "Content-Type": "text/csv"})
+
+    assert client.get("/api/dashboard/", headers=auth_headers).json()["Total_Members"] == 3
+
+
+def test_dry_run_import_changes_nothing(client, auth_headers, monthly_plan):
+    today = date.today()
+    body = _csv(("Fay Wong", "9876500006", "", "Monthly", str(today), str(today + timedelta(days=30)), ""))
+    response = client.post(
+        "/api/members/import?dry_run=true", content=body, headers={**auth_headers, "Content-Type": "text/csv"}
+    )
+    assert response.json()["inserted"] == 0
+    assert client.get("/api/dashboard/", headers=auth_headers).json()["Total_Members"] == 0
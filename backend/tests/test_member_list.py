@@ -0,0 +1,76 @@
+# backend/tests/test_member_list.py
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.member import Member
+from app.utils.pagination import encode_cursor
+
+
+@pytest.fixture
+def member_ids(db):
+    # Five members; two share an end date, so the id breaks the tie when sorting by end_date
+    base = date(2026, 6, 1)
+    members = [
+        Member(name=f"Member {index}", phone=f"98765005{index:02d}", plan_type="Monthly",
+               start_date=base, end_date=base + timedelta(days=offset))
+        for index, offset in enumerate((30, 10, 20, 10, 5))
+    ]
+    db.add_all(members)
+    db.commit()
+    return [member.id for member in members]
+
+
+def _walk(client, auth_headers, **params):
+    # Follow next_cursor to the last page, returning the ids in page order
+    ids, cursor, pages = [], None, 0
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/members/", params=query, headers=auth_headers)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        ids.extend(item["id"] for item in page["items"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids, pages
+
+
+def test_pages_by_id(client, auth_headers, member_ids):
+    ids, pages = _walk(client, auth_headers, limit=2)
+    assert ids == member_ids
+    assert pages == 3
+
+
+def test_pages_by_end_date_then_id(client, auth_headers, member_ids):
+    ids, _ = _walk(client, auth_headers, limit=2, sort="end_date", fields="id,end_date")
+    assert ids == [member_ids[i] for i in (4, 1, 3, 2, 0)]
+
+
+def test_total_only_when_requested(client, auth_headers, member_ids):
+    first = client.get("/api/members/", params={"limit": 2, "include_total": "true"}, headers=auth_headers).json()
+    assert first["total"] == 5
+    assert client.get("/api/members/", params={"limit": 2}, headers=auth_headers).json()["total"] is None
+
+
+def test_invalid_cursor_is_rejected(client, auth_headers, member_ids):
+    for params in (
+        {"cursor": "not-a-cursor"},
+        {"cursor": encode_cursor("end_date", [str(date(2026, 6, 1)), member_ids[0]])},  # Issued for sort=end_date
+        {"cursor": encode_cursor("end_date", [member_ids[0]]), "sort": "end_date"},    # Wrong number of key values
+    ):
+        response = client.get("/api/members/", params=params, headers=auth_headers)
+        assert response.status_code == 400, params
+        assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_ids_returns_profiles_in_requested_order(client, auth_headers, member_ids):
+    wanted = [member_ids[3], member_ids[0], 999999, member_ids[3]]
+    response = client.get("/api/members/", params={"ids": ",".join(map(str, wanted))}, headers=auth_headers)
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["id"] for item in items] == [member_ids[3], member_ids[0]]
+    assert items[0]["payments"] == [] and items[0]["payment_count"] == 0
+
+    assert client.get("/api/members/", params={"ids": "3,x"}, headers=auth_headers).status_code == 400
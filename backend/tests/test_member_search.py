@@ -0,0 +1,58 @@
+# backend/tests/test_member_search.py
+
+from datetime import date, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def members(client, auth_headers, monthly_plan):
+    today = date.today()
+    people = [
+        ("Bob Stone", "9876500101", "jan.stone@example.com"),
+        ("Rajan Kumar", "9876500102", None),
+        ("Ann Janssen", "9876500103", None),
+        ("Jan Smith", "+91 98765-00104", None),
+        ("Janet Lindqvist", "9876500105", None),
+    ]
+    for name, phone, email in people:
+        client.post("/api/members/", headers=auth_headers, json={
+            "name": name, "phone": phone, "email": email, "plan_type": "Monthly",
+            "start_date": str(today), "end_date": str(today + timedelta(days=30)),
+        })
+
+
+def _search(client, auth_headers, q, **params):
+    response = client.get("/api/members/search", params={"q": q, **params}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    return [item["name"] for item in response.json()["items"]]
+
+
+def test_ranking_prefers_name_start_then_word_start_then_substring_then_email(client, auth_headers, members):
+    # Same rank: shorter names first
+    assert _search(client, auth_headers, "jan") == ["Jan Smith", "Janet Lindqvist", "Ann Janssen", "Rajan Kumar", "Bob Stone"]
+
+
+def test_every_term_must_match(client, auth_headers, members):
+    assert _search(client, auth_headers, "jan smi") == ["Jan Smith"]
+
+
+def test_phone_search_ignores_formatting(client, auth_headers, members):
+    assert _search(client, auth_headers, "00104") == ["Jan Smith"]
+    assert _search(client, auth_headers, "98765-00103") == ["Ann Janssen"]
+
+
+def test_limit_and_fields(client, auth_headers, members):
+    response = client.get("/api/members/search", params={"q": "jan", "limit": 2, "fields": "name"}, headers=auth_headers)
+    assert response.json()["items"] == [{"name": "Jan Smith"}, {"name": "Janet Lindqvist"}]
+
+
+def test_terms_shorter_than_the_trigram_minimum_are_rejected(client, auth_headers, members):
+    assert client.get("/api/members/search", params={"q": "ja"}, headers=auth_headers).status_code == 400
+
+
+def test_index_follows_member_updates(client, auth_headers, members):
+    member_id = client.get("/api/members/search", params={"q": "rajan"}, headers=auth_headers).json()["items"][0]["id"]
+    client.put(f"/api/members/{member_id}", headers=auth_headers, json={"name": "Rita Kumar"})
+    assert _search(client, auth_headers, "rajan") == []
+    assert _search(client, auth_headers, "rita") == ["Rita Kumar"]
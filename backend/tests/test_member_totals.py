@@ -0,0 +1,77 @@
+# backend/tests/test_member_totals.py
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.models.member import Member
+
+
+@pytest.fixture
+def member_ids(client, auth_headers, monthly_plan):
+    today = date.today()
+    ids = []
+    for name in ("Hari Om", "Isha Sen"):
+        ids.append(client.post("/api/members/", headers=auth_headers, json={
+            "name": name, "phone": "9876500200", "plan_type": "Monthly",
+            "start_date": str(today), "end_date": str(today + timedelta(days=30)),
+        }).json()["id"])
+    return ids
+
+
+def _pay(client, auth_headers, member_id, amount):
+    response = client.post("/api/payments/", headers=auth_headers, json={
+        "member_id": member_id, "plan_type": "Monthly", "amount": amount, "method": "Cash",
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_new_member_starts_with_zero_totals(client, auth_headers, member_ids):
+    profile = client.get(f"/api/members/{member_ids[0]}", headers=auth_headers).json()
+    assert Decimal(profile["total_paid"]) == 0
+    assert profile["payment_count"] == 0
+    assert profile["last_payment_at"] is None
+    assert profile["payments"] == []
+
+
+def test_payments_update_lifetime_counters(client, auth_headers, member_ids):
+    first = _pay(client, auth_headers, member_ids[0], "500.50")
+    second = _pay(client, auth_headers, member_ids[0], "250.25")
+
+    profile = client.get(f"/api/members/{member_ids[0]}", headers=auth_headers).json()
+    assert Decimal(profile["total_paid"]) == Decimal("750.75")
+    assert profile["payment_count"] == 2
+    assert profile["last_payment_at"] == second["date"]
+    # Payment history is newest first
+    assert [payment["id"] for payment in profile["payments"]] == [second["id"], first["id"]]
+
+    other = client.get(f"/api/members/{member_ids[1]}", headers=auth_headers).json()
+    assert other["payment_count"] == 0
+
+
+def test_batch_renewal_updates_lifetime_counters(client, auth_headers, member_ids, db):
+    response = client.post("/api/renewals/batch", headers=auth_headers, json={"items": [
+        {"member_id": member_ids[0], "plan_type": "Monthly", "method": "Cash"},
+        {"member_id": member_ids[1], "plan_type": "Monthly", "method": "UPI", "amount": "900"},
+    ]})
+    assert response.status_code == 200, response.text
+
+    totals = {member.id: (member.total_paid, member.payment_count) for member in db.query(Member)}
+    assert totals == {member_ids[0]: (Decimal("1000.00"), 1), member_ids[1]: (Decimal("900.00"), 1)}
+
+
+def test_ids_lookup_returns_profiles_in_requested_order(client, auth_headers, member_ids):
+    _pay(client, auth_headers, member_ids[1], "100")
+    response = client.get(
+        "/api/members/", params={"ids": f"{member_ids[1]},999999,{member_ids[0]}"}, headers=auth_headers
+    )
+    items = response.json()["items"]
+    assert [item["id"] for item in items] == [member_ids[1], member_ids[0]]
+    assert [item["payment_count"] for item in items] == [1, 0]
+    assert len(items[0]["payments"]) == 1
+
+
+def test_unknown_member_profile_is_404(client, auth_headers):
+    assert client.get("/api/members/999999", headers=auth_headers).status_code == 404
@@ -0,0 +1,29 @@
+# backend/tests/test_metrics.py
+
+from app.models.admin import Admin
+
+
+def _add_admin(db):
+    db.add(Admin(username="admin", email="admin@example.com", hashed_password="x"))
+    db.commit()
+
+
+def test_metrics_requires_a_token(client):
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer not-a-token"}).status_code == 401
+
+
+def test_metrics_for_admin(client, auth_headers, db):
+    _add_admin(db)
+    client.get("/api/dashboard/", headers=auth_headers)
+
+    response = client.get("/metrics", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'method="GET",route="/api/dashboard/"' in response.text
+
+
+def test_metrics_with_scrape_token(client, monkeypatch):
+    monkeypatch.setattr("app.routes.metrics.METRICS_SCRAPE_TOKEN", "scrape-secret")
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-secre"}).status_code == 401
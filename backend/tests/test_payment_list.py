@@ -0,0 +1,89 @@
+# backend/tests/test_payment_list.py
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.models.member import Member
+from app.models.payment import Payment
+from app.utils.pagination import encode_cursor
+
+
+@pytest.fixture
+def payment_ids(db):
+    # Seven payments over four days; three share one timestamp, so the id breaks the tie
+    member = Member(
+        name="Lata Iyer", phone="9876500400", plan_type="Monthly",
+        start_date=date(2026, 1, 1), end_date=date(2026, 12, 31),
+    )
+    db.add(member)
+    db.flush()
+    noon = datetime(2026, 3, 10, 12, 0)
+    rows = [
+        (noon - timedelta(days=3), "Cash", "Monthly"),
+        (noon - timedelta(days=2), "UPI", "Monthly"),
+        (noon, "Cash", "Monthly"),
+        (noon, "UPI", "Yearly"),
+        (noon, "Cash", "Monthly"),
+        (noon + timedelta(days=1), "Card", "Monthly"),
+        (noon + timedelta(days=1, hours=2), "UPI", "Yearly"),
+    ]
+    payments = [
+        Payment(member_id=member.id, plan_type=plan, amount=Decimal("500.00"), method=method, date=paid_at)
+        for paid_at, method, plan in rows
+    ]
+    db.add_all(payments)
+    db.commit()
+    return [payment.id for payment in payments]
+
+
+def _walk(client, auth_headers, **params):
+    # Follow next_cursor to the last page, returning every page
+    pages, cursor = [], None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/payments/", params=query, headers=auth_headers)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_pages_follow_date_then_id_descending(client, auth_headers, payment_ids):
+    pages = _walk(client, auth_headers, limit=2, fields="id,date")
+    assert [len(page["items"]) for page in pages] == [2, 2, 2, 1]
+
+    ids = [item["id"] for page in pages for item in page["items"]]
+    expected = [payment_ids[i] for i in (6, 5, 4, 3, 2, 1, 0)]
+    assert ids == expected
+
+
+def test_filters_are_applied_on_the_server(client, auth_headers, payment_ids):
+    def ids(**params):
+        return [item["id"] for page in _walk(client, auth_headers, limit=2, **params) for item in page["items"]]
+
+    assert ids(method="UPI") == [payment_ids[i] for i in (6, 3, 1)]
+    assert ids(plan_type="Yearly") == [payment_ids[i] for i in (6, 3)]
+    assert ids(start_date="2026-03-10T00:00:00", end_date="2026-03-10T23:59:59") == [
+        payment_ids[i] for i in (4, 3, 2)
+    ]
+
+    page = client.get(
+        "/api/payments/", params={"method": "Cash", "include_total": "true", "limit": 1}, headers=auth_headers
+    ).json()
+    assert page["total"] == 3
+    assert len(page["items"]) == 1
+
+
+def test_mismatched_or_malformed_cursor_is_rejected(client, auth_headers, payment_ids):
+    for cursor in (
+        encode_cursor("id", [payment_ids[0]]),           # Issued for another ordering
+        encode_cursor("date", [payment_ids[0]]),         # Wrong number of key values
+        "not-a-cursor",
+    ):
+        response = client.get("/api/payments/", params={"cursor": cursor}, headers=auth_headers)
+        assert response.status_code == 400, cursor
+        assert response.json()["detail"] == "Invalid cursor"
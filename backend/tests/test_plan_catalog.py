@@ -0,0 +1,105 @@
+# backend/tests/test_plan_catalog.py
+
+import asyncio
+import threading
+from datetime import date, timedelta
+from decimal import Decimal
+
+from app.database import AsyncSessionLocal, SessionLocal
+from app.models.plan import Plan
+from app.utils import plan_catalog
+from app.utils.plan_catalog import get_plan_catalog, invalidate_plan_catalog
+from app.utils.versions import bump_version
+
+
+def _add_plans(db, *names):
+    for name in names:
+        db.add(Plan(name=name, price=Decimal("1000.00"), duration=30))
+    bump_version(db, "plans")
+    db.commit()
+
+
+def test_concurrent_cold_cache_loads_do_not_block_the_event_loop(db):
+    _add_plans(db, "Monthly", "Quarterly")
+
+    async def load():
+        async with AsyncSessionLocal() as session:
+            return await session.run_sync(get_plan_catalog)
+
+    async def scenario():
+        return await asyncio.wait_for(asyncio.gather(*(load() for _ in range(8))), timeout=5)
+
+    # A blocked event loop would also block asyncio.wait_for, so watch it from another thread
+    results = []
+    worker = threading.Thread(target=lambda: results.append(asyncio.run(scenario())), daemon=True)
+    worker.start()
+    worker.join(timeout=10)
+
+    assert not worker.is_alive(), "concurrent catalog loads blocked the event loop"
+    catalogs = results[0]
+    assert all(len(catalog.plans) == 2 for catalog in catalogs)
+    assert catalogs[0].by_name("Quarterly").duration == 30
+
+
+def test_catalog_reloads_when_plans_version_moves(db, monkeypatch):
+    monkeypatch.setattr("app.utils.plan_catalog.PLAN_CATALOG_CHECK_SECONDS", 0)
+    _add_plans(db, "Monthly")
+    first = get_plan_catalog(db)
+    assert [plan.name for plan in first.plans] == ["Monthly"]
+
+    # Another worker adds a plan: only the shared version counter tells this one
+    _add_plans(db, "Yearly")
+    second = get_plan_catalog(db)
+    assert second.version == first.version + 1
+    assert [plan.name for plan in second.plans] == ["Monthly", "Yearly"]
+
+    # Unchanged version: the same snapshot is reused
+    assert get_plan_catalog(db) is second
+
+
+def test_reload_is_not_stored_over_a_newer_invalidation(db, monkeypatch):
+    _add_plans(db, "Monthly")
+    real_load = plan_catalog._load
+
+    def load_then_write(session, version):
+        # This worker adds a plan while another request is still loading the old list
+        catalog = real_load(session, version)
+        with SessionLocal() as other:
+            _add_plans(other, "Yearly")
+        invalidate_plan_catalog()
+        return catalog
+
+    monkeypatch.setattr(plan_catalog, "_load", load_then_write)
+    stale = get_plan_catalog(db)
+    assert [plan.name for plan in stale.plans] == ["Monthly"]
+
+    monkeypatch.setattr(plan_catalog, "_load", real_load)
+    assert [plan.name for plan in get_plan_catalog(db).plans] == ["Monthly", "Yearly"]
+
+
+def test_unknown_plan_types_are_rejected(client, auth_headers, monthly_plan):
+    today = date.today()
+    member = {
+        "name": "Kiran Das", "phone": "9876500300", "plan_type": "Lifetime",
+        "start_date": str(today), "end_date": str(today + timedelta(days=30)),
+    }
+    response = client.post("/api/members/", headers=auth_headers, json=member)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown plan: Lifetime"
+
+    member_id = client.post("/api/members/", headers=auth_headers, json={**member, "plan_type": "Monthly"}).json()["id"]
+    update = client.put(f"/api/members/{member_id}", headers=auth_headers, json={"plan_type": "Lifetime"})
+    assert update.status_code == 400
+
+    payment = client.post("/api/payments/", headers=auth_headers, json={
+        "member_id": member_id, "plan_type": "Lifetime", "amount": "100", "method": "Cash",
+    })
+    assert payment.status_code == 400
+
+    body = "name,phone,plan_type,start_date,end_date\n" + "".join(
+        f"Row {plan},98765003{index}0,{plan},{today},{today + timedelta(days=30)}\n"
+        for index, plan in enumerate(("Monthly", "Lifetime"))
+    )
+    report = client.post("/api/members/import", content=body, headers={**auth_headers, "Content-Type": "text/csv"}).json()
+    assert report["inserted"] == 1
+    assert report["errors"] == [{"row": 2, "errors": ["plan_type: Unknown plan: Lifetime"]}]
@@ -0,0 +1,43 @@
+# backend/tests/test_sparse_fields.py
+
+from datetime import date, timedelta
+
+from app.main import app
+from app.schemas.member import MemberOut, MemberOutPartial
+from app.schemas.payment import PaymentOut, PaymentOutPartial
+
+
+def _item_schema(path):
+    schema = app.openapi()
+    ref = schema["paths"][path]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    # GET /members may also answer ?ids= with member profiles
+    page = next(option for option in ref.get("anyOf", [ref]) if option["$ref"].endswith(("Page", "Results")))
+    page_schema = schema["components"]["schemas"][page["$ref"].rsplit("/", 1)[-1]]
+    item_ref = page_schema["properties"]["items"]["items"]["$ref"]
+    return schema["components"]["schemas"][item_ref.rsplit("/", 1)[-1]]
+
+
+def test_partial_schemas_cover_every_output_field():
+    assert set(MemberOutPartial.model_fields) == set(MemberOut.model_fields)
+    assert set(PaymentOutPartial.model_fields) == set(PaymentOut.model_fields)
+
+
+def test_list_items_have_no_required_fields_in_openapi():
+    for path in ("/api/members/", "/api/members/search", "/api/payments/", "/api/renewals/7days", "/api/renewals/exp", "/api/renewals/today"):
+        assert not _item_schema(path).get("required"), path
+
+
+def test_fields_returns_only_requested_keys(client, auth_headers, monthly_plan):
+    today = date.today()
+    client.post("/api/members/", headers=auth_headers, json={
+        "name": "Gita Nair", "phone": "9876500007", "plan_type": "Monthly",
+        "start_date": str(today), "end_date": str(today + timedelta(days=2)),
+    })
+
+    page = client.get("/api/members/?fields=name,end_date", headers=auth_headers).json()
+    assert page["items"] == [{"name": "Gita Nair", "end_date": str(today + timedelta(days=2))}]
+
+    renewals = client.get("/api/renewals/7days?fields=name", headers=auth_headers).json()
+    assert renewals["items"] == [{"name": "Gita Nair"}]
+
+    assert client.get("/api/members/?fields=name,password", headers=auth_headers).status_code == 400
@@ -0,0 +1,42 @@
+# backend/tests/test_throttle.py
+
+from app.auth import throttle
+from app.auth.throttle import AttemptThrottle
+
+
+def test_blocks_after_max_attempts_and_reset_clears():
+    limiter = AttemptThrottle(max_attempts=2, window=60)
+    assert limiter.hit("ravi") is None
+    assert limiter.hit("ravi") is None
+    assert 0 < limiter.hit("ravi") <= 61
+    limiter.reset("ravi")
+    assert limiter.hit("ravi") is None
+
+
+def test_tracked_keys_stay_capped_inside_one_window(monkeypatch):
+    monkeypatch.setattr(throttle, "MAX_TRACKED_KEYS", 100)
+    limiter = AttemptThrottle(max_attempts=2, window=60)
+    limiter.hit("target")
+    limiter.hit("target")
+
+    # A flood of distinct usernames, all still inside the window
+    for index in range(1000):
+        limiter.hit(f"user{index}")
+        if index % 10 == 0:
+            assert limiter.hit("target") is not None  # Still blocked, so kept as recently tried
+    assert len(limiter._attempts) <= 100
+    assert "target" in limiter._attempts
+    assert "user0" not in limiter._attempts
+
+
+def test_expired_keys_are_dropped_first(monkeypatch):
+    monkeypatch.setattr(throttle, "MAX_TRACKED_KEYS", 3)
+    clock = [1000.0]
+    monkeypatch.setattr(throttle.time, "monotonic", lambda: clock[0])
+    limiter = AttemptThrottle(max_attempts=5, window=60)
+    limiter.hit("old")
+    clock[0] += 120
+    limiter.hit("a")
+    limiter.hit("b")
+    limiter.hit("c")
+    assert list(limiter._attempts) == ["a", "b", "c"]
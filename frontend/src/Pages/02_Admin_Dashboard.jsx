@@ -1,13 +1,16 @@
 import React, { useEffect, useState } from "react";
 import { Users, UserCheck, DollarSign, Calendar } from "lucide-react";
 import axios from "axios";
+import Cookies from "js-cookie";
 
 const App = () => {
   const [activeNavItem, setActiveNavItem] = useState("dashboard");
   const [userData, setUserData] = useState({});
   useEffect(() => {
     const data = async () => {
-      const res = await axios.get("http://127.0.0.1:8000/api/dashboard");
+      const res = await axios.get("http://127.0.0.1:8000/api/dashboard", {
+        headers: { Authorization: `Bearer ${Cookies.get("token")}` },
+      });
 
       const userobj = {
         Active_Members: res.data.Active_Members,
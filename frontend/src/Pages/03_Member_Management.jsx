@@ -1,20 +1,38 @@
 import React, { useState, useEffect, useMemo } from "react";
 import axios from "axios";
 import Cookies from "js-cookie";
-import { useCallback } from "react";
 import API from "../API/membersAPI";
 
 // Main App component
 const App = () => {
-  // State for managing member data
+  // Number of members shown (and fetched from the server) per page
+  const membersPerPage = 20;
+
+  // Members on the page being viewed (only this page is loaded from the server)
   const [members, setMembers] = useState([]);
+  // Cursor of every page visited so far (null = first page), to go back without re-walking the list
+  const [pageCursors, setPageCursors] = useState([null]);
+  const [pageIndex, setPageIndex] = useState(0);
+  // Cursor of the following page, null on the last page
+  const [nextCursor, setNextCursor] = useState(null);
+  // Total number of members (counted with the first page only)
+  const [totalMembers, setTotalMembers] = useState(null);
 
-  // Effect to save members to localStorage whenever it changes
-  const fetchMembers = async () => {
+  // Fetch one page of members from the server
+  const fetchMembers = async (index = pageIndex, cursors = pageCursors) => {
     try {
-      const response = await API.get("/");
-      console.log(response);
-      setMembers(response.data);
+      const response = await API.get("/", {
+        params: {
+          limit: membersPerPage,
+          ...(cursors[index] ? { cursor: cursors[index] } : {}),
+          ...(index === 0 ? { include_total: true } : {}),
+        },
+      });
+      setMembers(response.data.items);
+      setNextCursor(response.data.next_cursor);
+      if (response.data.total != null) setTotalMembers(response.data.total);
+      setPageCursors(cursors);
+      setPageIndex(index);
     } catch (error) {
       console.error("Error fetching members:", error);
       alert("Unauthorized or faild to fetch members.");
@@ -22,21 +40,55 @@ const App = () => {
   };
 
   useEffect(() => {
-    fetchMembers();
+    fetchMembers(0, [null]);
   }, []);
 
+  // Move to the next or previous server page
+  const goToNextPage = () => {
+    if (!nextCursor) return;
+    fetchMembers(pageIndex + 1, [...pageCursors.slice(0, pageIndex + 1), nextCursor]);
+  };
+  const goToPreviousPage = () => {
+    if (pageIndex === 0) return;
+    fetchMembers(pageIndex - 1, pageCursors);
+  };
+
   // State for search term
   const [searchTerm, setSearchTerm] = useState("");
-  // State for pagination
+  // Page within the server search results (at most 50 results, paged in the browser)
   const [currentPage, setCurrentPage] = useState(1);
-  const [membersPerPage] = useState(20); // Number of members to display per page
 
   // State for modal visibility and current member being edited
   const [showModal, setShowModal] = useState(false);
   const [currentMember, setCurrentMember] = useState(null); // Null for add, object for edit
 
-  // Filtered members based on search term
+  // Server-side search results for terms of 3+ characters (searches the whole table by name, email or phone)
+  const [searchResults, setSearchResults] = useState(null);
+
+  useEffect(() => {
+    if (searchTerm.trim().length < 3) {
+      setSearchResults(null);
+      return;
+    }
+    // Wait for the user to stop typing before querying
+    const timer = setTimeout(async () => {
+      try {
+        const response = await API.get("/search", {
+          params: { q: searchTerm.trim(), limit: 50 },
+        });
+        setSearchResults(response.data.items);
+        setCurrentPage(1);
+      } catch (error) {
+        console.error("Search failed:", error);
+        setSearchResults(null);
+      }
+    }, 250);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+  // Search results, or the current page narrowed by a short (1-2 character) search term
   const filteredMembers = useMemo(() => {
+    if (searchResults) return searchResults;
     return members.filter((member) => {
       if (!member) return false;
       const nameMatch = member.name
@@ -50,21 +102,31 @@ const App = () => {
         .includes(searchTerm.toLowerCase());
       return nameMatch || phoneMatch || planMatch;
     });
-  }, [members, searchTerm]);
+  }, [members, searchTerm, searchResults]);
 
-  // Pagination logic
-  const indexOfLastMember = currentPage * membersPerPage;
-  const indexOfFirstMember = indexOfLastMember - membersPerPage;
-  const currentMembers = filteredMembers.slice(
-    indexOfFirstMember,
-    indexOfLastMember
-  );
-  const totalPages = Math.ceil(filteredMembers.length / membersPerPage);
+  // Pagination: search results are paged in the browser, the member list page by page from the server
+  const searching = searchResults !== null;
+  const currentMembers = searching
+    ? filteredMembers.slice((currentPage - 1) * membersPerPage, currentPage * membersPerPage)
+    : filteredMembers;
+  const pageNumber = searching ? currentPage : pageIndex + 1;
+  const totalPages = searching
+    ? Math.ceil(filteredMembers.length / membersPerPage)
+    : totalMembers != null
+    ? Math.max(Math.ceil(totalMembers / membersPerPage), 1)
+    : null;
+  const hasPreviousPage = pageNumber > 1;
+  const hasNextPage = searching ? currentPage < totalPages : Boolean(nextCursor);
 
-  // Function to change page
-  const paginate = useCallback((pageNumber) => {
-    setCurrentPage(pageNumber);
-  }, []);
+  const paginatePrevious = () => {
+    if (searching) setCurrentPage((page) => page - 1);
+    else goToPreviousPage();
+  };
+
+  const paginateNext = () => {
+    if (searching) setCurrentPage((page) => page + 1);
+    else goToNextPage();
+  };
 
   // Handle adding a new member
   const handleAddMember = async (newMember) => {
@@ -75,8 +137,9 @@ const App = () => {
         notes: newMember.notes?.trim() === "" ? null : newMember.notes?.trim(),
       };
       // console.log("Sending", data);
-      const response = await API.post("/", data);
-      setMembers((prev) => [...prev, response.data.details]);
+      await API.post("/", data);
+      // Refresh the current page and the member count
+      setTotalMembers((total) => (total != null ? total + 1 : total));
       await fetchMembers();
       setShowModal(false);
       alert("Member added successfully.");
@@ -118,7 +181,9 @@ const App = () => {
     if (!confirmDelete) return;
     try {
       await API.delete(`/${id}`);
-      setMembers((prev) => prev.filter((member) => member.id !== id));
+      setTotalMembers((total) => (total != null ? total - 1 : total));
+      // Reload the page so it is filled up again from the next one
+      await fetchMembers();
       alert("Successfully deleted member.");
     } catch (error) {
       console.error("Delete failed:", error);
@@ -158,7 +223,7 @@ const App = () => {
         <div className="mb-6">
           <input
             type="text"
-            placeholder="Search by name, phone, or plan..."
+            placeholder="Search by name, email or phone..."
             className="w-full p-3 rounded-xl border border-gray-300 focus:ring-2 focus:ring-teal-500 focus:border-transparent shadow-sm transition duration-200"
             value={searchTerm}
             onChange={(e) => {
@@ -292,15 +357,15 @@ const App = () => {
         </div>
 
         {/* Pagination */}
-        {totalPages > 1 && (
-          <div className="flex justify-center mt-6">
+        {(hasPreviousPage || hasNextPage) && (
+          <div className="flex justify-center items-center mt-6">
             <nav
-              className="relative z-0 inline-flex rounded-md shadow-sm -space-x-px"
+              className="relative z-0 inline-flex items-center rounded-md shadow-sm -space-x-px"
               aria-label="Pagination"
             >
               <button
-                onClick={() => paginate(currentPage - 1)}
-                disabled={currentPage === 1}
+                onClick={paginatePrevious}
+                disabled={!hasPreviousPage}
                 className="relative inline-flex items-center px-2 py-2 rounded-l-md border border-gray-300 bg-white text-sm font-medium text-gray-500 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
               >
                 {/* Previous Icon */}
@@ -318,22 +383,13 @@ const App = () => {
                   />
                 </svg>
               </button>
-              {[...Array(totalPages).keys()].map((number) => (
-                <button
-                  key={number + 1}
-                  onClick={() => paginate(number + 1)}
-                  className={`relative inline-flex items-center px-4 py-2 border border-gray-300 bg-white text-sm font-medium ${
-                    currentPage === number + 1
-                      ? "z-10 bg-teal-50 border-teal-500 text-teal-600"
-                      : "text-gray-700 hover:bg-gray-50"
-                  }`}
-                >
-                  {number + 1}
-                </button>
-              ))}
+              <span className="relative inline-flex items-center px-4 py-2 border border-gray-300 bg-teal-50 text-sm font-medium text-teal-600">
+                Page {pageNumber}
+                {totalPages ? ` of ${totalPages}` : ""}
+              </span>
               <button
-                onClick={() => paginate(currentPage + 1)}
-                disabled={currentPage === totalPages}
+                onClick={paginateNext}
+                disabled={!hasNextPage}
                 className="relative inline-flex items-center px-2 py-2 rounded-r-md border border-gray-300 bg-white text-sm font-medium text-gray-500 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
               >
                 {/* Next Icon */}
@@ -10,30 +10,56 @@ const tailwindConfigColors = {
   "fitness-card-light": "#FFFFFF", // Card background
 };
 
+// Number of payments fetched per request ("Load more" fetches the next batch)
+const PAGE_SIZE = 50;
+
+const EMPTY_FILTERS = { memberId: "", method: "", startDate: "", endDate: "" };
+
+// Query parameters for the server-side filters
+const filterParams = (filters) => ({
+  ...(filters.memberId.trim() ? { member_id: filters.memberId.trim() } : {}),
+  ...(filters.method ? { method: filters.method } : {}),
+  ...(filters.startDate ? { start_date: filters.startDate } : {}),
+  // Include the whole end day
+  ...(filters.endDate ? { end_date: `${filters.endDate}T23:59:59` } : {}),
+});
+
 // Main App Component
 function App() {
   const [isModalOpen, setIsModalOpen] = useState(false);
+  // Payments loaded so far, newest first
   const [payments, setPayments] = useState([]);
-
-  // Effect to save payments to local storage whenever they change
-  const fetchPayments = async () => {
+  // Cursor of the next batch, null when everything matching the filters is loaded
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loading, setLoading] = useState(false);
+  const [filters, setFilters] = useState(EMPTY_FILTERS);
+
+  // Fetch the first batch (cursor = null) or the batch after `cursor`
+  const fetchPayments = async (cursor = null) => {
+    setLoading(true);
     try {
-      const response = await API.get("/");
-      console.log(response);
-      setPayments(response.data);
+      const response = await API.get("/", {
+        params: { limit: PAGE_SIZE, ...filterParams(filters), ...(cursor ? { cursor } : {}) },
+      });
+      setPayments((prev) => (cursor ? [...prev, ...response.data.items] : response.data.items));
+      setNextCursor(response.data.next_cursor);
     } catch (error) {
       console.error("Error fetching payments:", error);
+    } finally {
+      setLoading(false);
     }
   };
 
+  // Start over from the newest payment whenever the filters change
   useEffect(() => {
-    fetchPayments();
-  }, []);
+    const timer = setTimeout(() => fetchPayments(), 250);
+    return () => clearTimeout(timer);
+  }, [filters]);
 
   const handleAddPayment = async (newPayment) => {
     try {
-      const response = await API.post("/", newPayment);
-      setPayments((prev) => [...(prev || []), response.data]);
+      await API.post("/", newPayment);
+      // The new payment is the newest one, so reload the first batch
       await fetchPayments();
       setIsModalOpen(false);
       alert("Payment added successfully.");
@@ -63,7 +89,14 @@ function App() {
       </div>
 
       {/* Payments Table Component */}
-      <PaymentsTable payments={payments} />
+      <PaymentsTable
+        payments={payments}
+        filters={filters}
+        onFiltersChange={setFilters}
+        hasMore={Boolean(nextCursor)}
+        loading={loading}
+        onLoadMore={() => fetchPayments(nextCursor)}
+      />
 
       {/* Add Payment Modal Component (conditionally rendered) */}
       {isModalOpen && (
@@ -77,37 +110,29 @@ function App() {
 }
 
 // PaymentsTable Component
-const PaymentsTable = ({ payments }) => {
-  const [searchTerm, setSearchTerm] = useState("");
-  const [filterMethod, setFilterMethod] = useState("");
-
-  // Filter payments based on search term and payment method
-  const filteredPayments = payments.filter((payment) => {
-    const matchesSearch =
-      payment.member_id.toString().includes(searchTerm.toLowerCase()) ||
-      payment.notes.toLowerCase().includes(searchTerm.toLowerCase());
-    const matchesMethod =
-      filterMethod === "" || payment.method === filterMethod;
-    return matchesSearch && matchesMethod;
-  });
+// Filters are applied by the server; the table shows the batches loaded so far
+const PaymentsTable = ({ payments, filters, onFiltersChange, hasMore, loading, onLoadMore }) => {
+  const setFilter = (name, value) => onFiltersChange({ ...filters, [name]: value });
+  const hasFilters = Object.values(filters).some((value) => value !== "");
 
   return (
     <div className="bg-fitness-card-light rounded-lg shadow-md overflow-hidden mt-4 p-4">
       {/* Search and Filter Bar */}
       <div className="flex flex-col md:flex-row gap-4 mb-4">
         <input
-          type="text"
-          placeholder="Search by member name or notes..."
+          type="number"
+          min="1"
+          placeholder="Filter by member ID..."
           className="flex-grow border border-gray-300 rounded-md p-2 focus:outline-none focus:border-fitness-primary
                      focus:ring-1 focus:ring-fitness-primary transition duration-200"
-          value={searchTerm}
-          onChange={(e) => setSearchTerm(e.target.value)}
+          value={filters.memberId}
+          onChange={(e) => setFilter("memberId", e.target.value)}
         />
         <select
           className="border border-gray-300 rounded-md p-2 focus:outline-none focus:border-fitness-primary
                      focus:ring-1 focus:ring-fitness-primary transition duration-200"
-          value={filterMethod}
-          onChange={(e) => setFilterMethod(e.target.value)}
+          value={filters.method}
+          onChange={(e) => setFilter("method", e.target.value)}
         >
           <option value="">All Payment Methods</option>
           <option value="Cash">Cash</option>
@@ -116,12 +141,25 @@ const PaymentsTable = ({ payments }) => {
           <option value="Bank Transfer">Bank Transfer</option>
           {/* Add more payment methods as needed */}
         </select>
-        {(searchTerm || filterMethod) && (
+        <input
+          type="date"
+          title="From date"
+          className="border border-gray-300 rounded-md p-2 focus:outline-none focus:border-fitness-primary
+                     focus:ring-1 focus:ring-fitness-primary transition duration-200"
+          value={filters.startDate}
+          onChange={(e) => setFilter("startDate", e.target.value)}
+        />
+        <input
+          type="date"
+          title="To date"
+          className="border border-gray-300 rounded-md p-2 focus:outline-none focus:border-fitness-primary
+                     focus:ring-1 focus:ring-fitness-primary transition duration-200"
+          value={filters.endDate}
+          onChange={(e) => setFilter("endDate", e.target.value)}
+        />
+        {hasFilters && (
           <button
-            onClick={() => {
-              setSearchTerm("");
-              setFilterMethod("");
-            }}
+            onClick={() => onFiltersChange(EMPTY_FILTERS)}
             className="text-gray-600 hover:text-gray-800 text-sm px-2 py-1 rounded-md
                        transition duration-200 ease-in-out"
           >
@@ -144,8 +182,8 @@ const PaymentsTable = ({ payments }) => {
             </tr>
           </thead>
           <tbody className="text-gray-600 text-sm font-light">
-            {filteredPayments.length > 0 ? (
-              filteredPayments.map((payment, index) => (
+            {payments.length > 0 ? (
+              payments.map((payment, index) => (
                 <tr
                   key={payment.id}
                   className={`border-b border-gray-200 hover:bg-gray-50
@@ -177,13 +215,28 @@ const PaymentsTable = ({ payments }) => {
             ) : (
               <tr>
                 <td colSpan="6" className="py-6 text-center text-gray-500">
-                  No payments found.
+                  {loading ? "Loading payments..." : "No payments found."}
                 </td>
               </tr>
             )}
           </tbody>
         </table>
       </div>
+
+      {/* Load the next batch on demand */}
+      {hasMore && (
+        <div className="flex justify-center mt-4">
+          <button
+            onClick={onLoadMore}
+            disabled={loading}
+            className="bg-fitness-primary text-white font-bold py-2 px-4 rounded-md shadow-md
+                       hover:bg-green-600 focus:outline-none focus:ring-2 focus:ring-green-500 focus:ring-opacity-75
+                       transition duration-200 ease-in-out disabled:opacity-50"
+          >
+            {loading ? "Loading..." : "Load more"}
+          </button>
+        </div>
+      )}
     </div>
   );
 };